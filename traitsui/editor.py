@@ -25,12 +25,19 @@
 
 from __future__ import absolute_import
 
+from threading import Lock
+from thread import get_ident
+from time import time
+
+from traits import trait_notifiers
 from traits.api import (
     Any,
     Bool,
+    Float,
     HasPrivateTraits,
     HasTraits,
     Instance,
+    Int,
     Property,
     ReadOnly,
     Str,
@@ -46,6 +53,12 @@ from .editor_factory import EditorFactory
 
 from .context_value import ContextValue
 
+from .helper import compile_expression
+
+from .profiler import count_event, profiled
+
+from .toolkit import toolkit
+
 from .undo import UndoItem
 
 from .item import Item
@@ -57,6 +70,72 @@ from .item import Item
 # Reference to an EditorFactory object
 factory_trait = Trait(EditorFactory)
 
+#-------------------------------------------------------------------------
+#  '_SyncBinding' class:
+#-------------------------------------------------------------------------
+
+
+class _SyncBinding(object):
+    """ Accessor for a user object trait synchronized with an editor trait
+        using **Editor.sync_value**.
+
+        The object holding the trait at the end of an extended name of the
+        form 'name.name...' is resolved once, and resolved again only after
+        **invalidate** has been called because one of the intermediate links
+        has changed.
+    """
+
+    def __init__(self, user_object, extended_name):
+        names = extended_name.split('.')
+
+        # The object the extended name starts from:
+        self.user_object = user_object
+
+        # The names of the intermediate links and of the synchronized trait:
+        self.links = names[:-1]
+        self.name = names[-1]
+
+        # Whether the object holding the trait can be cached (i.e. whether
+        # changes to the intermediate links are being listened to):
+        self.cache = True
+
+        # Whether a value is currently being propagated through the binding:
+        self.updating = False
+
+        self._target = None
+
+    def invalidate(self):
+        """ Discards the cached object holding the synchronized trait.
+        """
+        self._target = None
+
+    def target(self):
+        """ Returns the object holding the synchronized trait.
+        """
+        target = self._target
+        if target is None:
+            target = self.user_object
+            cache = self.cache
+            for link in self.links:
+                # Only links of HasTraits objects can be listened to:
+                cache = cache and isinstance(target, HasTraits)
+                target = getattr(target, link)
+
+            if cache:
+                self._target = target
+
+        return target
+
+    def get(self):
+        """ Returns the value of the synchronized trait.
+        """
+        return getattr(self.target(), self.name)
+
+    def set(self, value):
+        """ Sets the value of the synchronized trait.
+        """
+        setattr(self.target(), self.name, value)
+
 #-------------------------------------------------------------------------
 #  'Editor' abstract base class:
 #-------------------------------------------------------------------------
@@ -134,6 +213,27 @@ class Editor(HasPrivateTraits):
     # The current editor invalid state status:
     invalid = Bool(False)
 
+    # The number of changes to the edited trait made on other threads which
+    # were coalesced into a later update of the editor (see the factory's
+    # **max_update_rate**):
+    dropped_updates = Int
+
+    #-- Private Traits -------------------------------------------------------
+
+    # The maximum number of updates per second for changes to the edited trait
+    # made on other threads (0 if not limited):
+    _max_update_rate = Float
+
+    # The (object, name, old, new) arguments of the latest coalesced change to
+    # the edited trait waiting to be delivered (None if there is none):
+    _pending_update = Any
+
+    # Lock protecting **_pending_update**:
+    _update_lock = Any
+
+    # Time of the last delivery of a coalesced change:
+    _update_time = Float
+
     #-------------------------------------------------------------------------
     #  Initializes the object:
     #-------------------------------------------------------------------------
@@ -162,13 +262,24 @@ class Editor(HasPrivateTraits):
     def prepare(self, parent):
         """ Finishes setting up the editor.
         """
-        name = self.extended_name
-        if name != 'None':
-            self.context_object.on_trait_change(self._update_editor, name,
-                                                dispatch='ui')
-        self.init(parent)
-        self._sync_values()
-        self.update_editor()
+        with profiled('prepare', editor=self):
+            name = self.extended_name
+            if name != 'None':
+                self._max_update_rate = self.factory.max_update_rate
+                if self._max_update_rate > 0.0:
+                    self._update_lock = Lock()
+                    self.context_object.on_trait_change(self._coalesce_update,
+                                                        name)
+                else:
+                    self.context_object.on_trait_change(self._update_editor,
+                                                        name, dispatch='ui')
+                count_event('listeners', self)
+
+            with profiled('init', editor=self):
+                self.init(parent)
+            self._sync_values()
+            count_event('update_editor', self)
+            self.update_editor()
 
     #-------------------------------------------------------------------------
     #  Finishes initializing the editor by creating the underlying toolkit
@@ -202,7 +313,7 @@ class Editor(HasPrivateTraits):
 
         name = self.extended_name
         if name != 'None':
-            self.context_object.on_trait_change(self._update_editor, name,
+            self.context_object.on_trait_change(self._update_listener(), name,
                                                 remove=True)
 
         if self._user_from is not None:
@@ -346,6 +457,8 @@ class Editor(HasPrivateTraits):
     def _update_editor(self, object, name, old_value, new_value):
         """ Performs updates when the object trait changes.
         """
+        count_event('_update_editor', self)
+
         # If background threads have modified the trait the editor is bound to,
         # their trait notifications are queued to the UI thread. It is possible
         # that by the time the UI thread dispatches these events, the UI the
@@ -360,12 +473,13 @@ class Editor(HasPrivateTraits):
         # been modified. In this case, we need to rebind the current object
         # being edited:
         if object is not self.object:
-            self.object = eval(self.object_name, globals(), self.ui.context)
+            self.object = eval(compile_expression(self.object_name), globals(),
+                               self.ui.context)
 
         # If the editor has gone away for some reason, disconnect and exit:
         if self.control is None:
             self.context_object.on_trait_change(
-                self._update_editor, self.extended_name, remove=True)
+                self._update_listener(), self.extended_name, remove=True)
             return
 
         # Log the change that was made (as long as it is not for an event):
@@ -375,8 +489,75 @@ class Editor(HasPrivateTraits):
 
         # If the change was not caused by the editor itself:
         if not self._no_update:
-            # Update the editor control to reflect the current object state:
-            self.update_editor()
+            # Update the editor control to reflect the current object state
+            # (unless the update is deferred until the end of a batch of
+            # updates):
+            if not self.ui._defer_update(self):
+                count_event('update_editor', self)
+                self.update_editor()
+
+    #-------------------------------------------------------------------------
+    #  Coalesces changes to the object trait made on other threads:
+    #-------------------------------------------------------------------------
+
+    def _coalesce_update(self, object, name, old_value, new_value):
+        """ Handles the object trait changing when the factory's
+            **max_update_rate** is set.
+
+            Changes made on the UI thread update the editor immediately. Other
+            changes are coalesced with any change still waiting to be
+            delivered to the UI thread (keeping the original old value, so
+            that a single undo item covers all of them).
+        """
+        if get_ident() == trait_notifiers.ui_thread:
+            self._update_editor(object, name, old_value, new_value)
+            return
+
+        with self._update_lock:
+            pending = self._pending_update
+            if pending is not None:
+                self._pending_update = (object, name, pending[2], new_value)
+                self.dropped_updates += 1
+                return
+
+            self._pending_update = (object, name, old_value, new_value)
+
+        ui_handler = trait_notifiers.ui_handler
+        if ui_handler is None:
+            self._deliver_update()
+        else:
+            ui_handler(self._schedule_update)
+
+    def _schedule_update(self):
+        """ Delivers the pending change to the object trait, once at least
+            1 / **max_update_rate** seconds have elapsed since the last one.
+        """
+        if self.ui is None:
+            return
+
+        delay = self._update_time + 1.0 / self._max_update_rate - time()
+        if delay > 0.0:
+            toolkit().invoke_later(delay, self._deliver_update)
+        else:
+            self._deliver_update()
+
+    def _deliver_update(self):
+        """ Updates the editor for the pending change to the object trait.
+        """
+        with self._update_lock:
+            pending, self._pending_update = self._pending_update, None
+
+        if (pending is not None) and (self.ui is not None):
+            self._update_time = time()
+            self._update_editor(*pending)
+
+    def _update_listener(self):
+        """ Returns the handler listening to changes to the object trait.
+        """
+        if self._max_update_rate > 0.0:
+            return self._coalesce_update
+
+        return self._update_editor
 
     #-------------------------------------------------------------------------
     #  Logs a change made in the editor:
@@ -479,46 +660,45 @@ class Editor(HasPrivateTraits):
             object trait.
         """
         if user_name != '':
-            key = '%s:%s' % (user_name, editor_name)
-
-            if self._no_trait_update is None:
-                self._no_trait_update = {}
-
-            user_ref = 'user_object'
             col = user_name.find('.')
             if col < 0:
                 user_object = self.context_object
                 xuser_name = user_name
             else:
                 user_object = self.ui.context[user_name[: col]]
-                user_name = xuser_name = user_name[col + 1:]
-                col = user_name.rfind('.')
-                if col >= 0:
-                    user_ref += ('.' + user_name[: col])
-                    user_name = user_name[col + 1:]
+                xuser_name = user_name[col + 1:]
 
-            user_value = compile('%s.%s' % (user_ref, user_name),
-                                 '<string>', 'eval')
-            user_ref = compile(user_ref, '<string>', 'eval')
+            binding = _SyncBinding(user_object, xuser_name)
+
+            if self._user_to is None:
+                self._user_to = []
+
+            # Re-resolve the object holding the user trait whenever one of the
+            # intermediate links leading to it is replaced:
+            if binding.links and isinstance(user_object, HasTraits):
+                links = '.'.join(binding.links)
+                try:
+                    user_object.on_trait_change(binding.invalidate, links)
+                    count_event('listeners', self)
+                    self._user_to.append((user_object, links,
+                                          binding.invalidate))
+                except Exception:
+                    binding.cache = False
 
             if mode in ('from', 'both'):
 
                 def user_trait_modified(new):
-                    # Need this to include 'user_object' in closure:
-                    user_object
-                    if key not in self._no_trait_update:
-                        self._no_trait_update[key] = None
+                    if not binding.updating:
+                        binding.updating = True
                         try:
                             setattr(self, editor_name, new)
                         except:
                             from traitsui.api import raise_to_debug
                             raise_to_debug()
-                        del self._no_trait_update[key]
+                        binding.updating = False
 
                 user_object.on_trait_change(user_trait_modified, xuser_name)
-
-                if self._user_to is None:
-                    self._user_to = []
+                count_event('listeners', self)
                 self._user_to.append((user_object, xuser_name,
                                       user_trait_modified))
 
@@ -526,8 +706,8 @@ class Editor(HasPrivateTraits):
 
                     def user_list_modified(event):
                         if isinstance(event, TraitListEvent):
-                            if key not in self._no_trait_update:
-                                self._no_trait_update[key] = None
+                            if not binding.updating:
+                                binding.updating = True
                                 n = event.index
                                 try:
                                     getattr(self, editor_name)[
@@ -535,15 +715,16 @@ class Editor(HasPrivateTraits):
                                 except:
                                     from traitsui.api import raise_to_debug
                                     raise_to_debug()
-                                del self._no_trait_update[key]
+                                binding.updating = False
 
                     user_object.on_trait_change(user_list_modified,
                                                 xuser_name + '_items')
+                    count_event('listeners', self)
                     self._user_to.append((user_object, xuser_name + '_items',
                                           user_list_modified))
 
                 try:
-                    setattr(self, editor_name, eval(user_value))
+                    setattr(self, editor_name, binding.get())
                 except:
                     from traitsui.api import raise_to_debug
                     raise_to_debug()
@@ -551,18 +732,17 @@ class Editor(HasPrivateTraits):
             if mode in ('to', 'both'):
 
                 def editor_trait_modified(new):
-                    # Need this to include 'user_object' in closure:
-                    user_object
-                    if key not in self._no_trait_update:
-                        self._no_trait_update[key] = None
+                    if not binding.updating:
+                        binding.updating = True
                         try:
-                            setattr(eval(user_ref), user_name, new)
+                            binding.set(new)
                         except:
                             from traitsui.api import raise_to_debug
                             raise_to_debug()
-                        del self._no_trait_update[key]
+                        binding.updating = False
 
                 self.on_trait_change(editor_trait_modified, editor_name)
+                count_event('listeners', self)
 
                 if self._user_from is None:
                     self._user_from = []
@@ -571,28 +751,26 @@ class Editor(HasPrivateTraits):
                 if is_list:
 
                     def editor_list_modified(event):
-                        # Need this to include 'user_object' in closure:
-                        user_object
-                        if key not in self._no_trait_update:
-                            self._no_trait_update[key] = None
+                        if not binding.updating:
+                            binding.updating = True
                             n = event.index
                             try:
-                                eval(user_value)[
+                                binding.get()[
                                     n: n + len(event.removed)] = event.added
                             except:
                                 from traitsui.api import raise_to_debug
                                 raise_to_debug()
-                            del self._no_trait_update[key]
+                            binding.updating = False
 
                     self.on_trait_change(editor_list_modified,
                                          editor_name + '_items')
+                    count_event('listeners', self)
                     self._user_from.append((editor_name + '_items',
                                             editor_list_modified))
 
                 if mode == 'to':
                     try:
-                        setattr(eval(user_ref), user_name,
-                                getattr(self, editor_name))
+                        binding.set(getattr(self, editor_name))
                     except:
                         from traitsui.api import raise_to_debug
                         raise_to_debug()
@@ -29,7 +29,8 @@ import sys
 import os
 import logging
 
-from traits.api import HasPrivateTraits, Callable, Str, Bool, Event, Any, Property
+from traits.api import (
+    HasPrivateTraits, Callable, Str, Bool, Event, Any, Float, Property)
 
 from .helper import enum_values_changed
 
@@ -68,6 +69,12 @@ class EditorFactory(HasPrivateTraits):
     # status:
     invalid = Str
 
+    # The maximum number of times per second that created editors are updated
+    # for changes to the edited trait made on threads other than the UI
+    # thread (0 means that there is no limit). Changes made in between
+    # updates are coalesced, so only the latest value is displayed:
+    max_update_rate = Float(0.0)
+
     # Text aligment to use in most readonly editors
     # Possible values: left, right, top, bottom, just, vcenter, hcenter, center
     # Example: left,vcenter
@@ -26,12 +26,17 @@ from __future__ import absolute_import
 
 import numpy
 
-from traits.api import Bool, HasTraits, Int, Float, Instance, false, TraitError
+from traits.api import (Any, Bool, Callable, HasTraits, Int, Float, Instance,
+                        false, TraitError)
 
 from ..editor import Editor
 
 from ..editor_factory import EditorFactory
 
+from ..tabular_adapter import TabularAdapter
+
+from .tabular_editor import TabularEditor
+
 # CIRCULAR IMPORT FIXME: Importing from the source rather than traits.ui.api
 # to avoid circular imports, as this EditorFactory will be part of
 # traits.ui.api as well.
@@ -41,6 +46,30 @@ from ..group import Group
 
 from ..item import Item
 
+#-------------------------------------------------------------------------
+#  Converts the text of an array element entered by the user to a value:
+#-------------------------------------------------------------------------
+
+# The texts accepted for the True and False values of boolean arrays:
+TRUE_TEXTS = ('1', 'true', 'yes')
+FALSE_TEXTS = ('0', 'false', 'no')
+
+
+def parse_element(dtype, text):
+    """ Returns the value of the specified numpy *dtype* entered as *text*,
+        raising a ValueError if the text is not a valid value.
+    """
+    if dtype.kind == 'b':
+        # numpy would convert any non-empty string to True:
+        lower_text = text.strip().lower()
+        if lower_text in TRUE_TEXTS:
+            return dtype.type(True)
+        if lower_text in FALSE_TEXTS:
+            return dtype.type(False)
+        raise ValueError('invalid boolean value: %r' % text)
+
+    return dtype.type(text)
+
 #-------------------------------------------------------------------------
 #  'ToolkitEditorFactory' class:
 #-------------------------------------------------------------------------
@@ -63,6 +92,41 @@ class ToolkitEditorFactory(EditorFactory):
     # Is user input set when the Enter key is pressed?
     enter_set = Bool(False)
 
+    # Arrays with more elements than this are edited using a single grid
+    # (table) widget that writes edited elements directly into the array,
+    # rather than with one field per element (0 means always use fields):
+    grid_threshold = Int(1000)
+
+#-------------------------------------------------------------------------
+#  'ArrayGridAdapter' class:
+#-------------------------------------------------------------------------
+
+
+class ArrayGridAdapter(TabularAdapter):
+    """ Tabular adapter for editing the elements of a 1D or 2D array in place.
+    """
+
+    # The function used to format each element (if any):
+    format_func = Callable
+
+    alignment = 'right'
+
+    def _get_content(self):
+        if isinstance(self.item, numpy.ndarray):
+            return self.item[self.column_id]
+
+        return self.item
+
+    def _get_text(self):
+        if self.format_func is not None:
+            return self.format_func(self.get_content(self.object, self.name,
+                                                     self.row, self.column))
+
+        return super(ArrayGridAdapter, self)._get_text()
+
+    def _set_text(self, value):
+        self.object.set_element(self.row, self.column_id, value)
+
 #-------------------------------------------------------------------------
 #  'ArrayStructure' class:
 #-------------------------------------------------------------------------
@@ -80,6 +144,9 @@ class ArrayStructure(HasTraits):
     # The constructed View for the array
     view = Instance(View)
 
+    # The array being edited (only used when editing with a grid):
+    array = Any(rich_compare=False)
+
     #-------------------------------------------------------------------------
     #  Initializes the object:
     #-------------------------------------------------------------------------
@@ -107,12 +174,16 @@ class ArrayStructure(HasTraits):
         if object.dtype.type == 'i':
             trait = Int
 
-        if len(object.shape) == 1:
+        if len(object.shape) not in (1, 2):
+            raise TraitError('Only 1D or 2D arrays supported')
+
+        if editor.grid:
+            self.array = object
+            self.view = self._grid_view(object, editor.readonly)
+        elif len(object.shape) == 1:
             self.view = self._one_dim_view(object, style, width, trait)
-        elif len(object.shape) == 2:
-            self.view = self._two_dim_view(object, style, width, trait)
         else:
-            raise TraitError('Only 1D or 2D arrays supported')
+            self.view = self._two_dim_view(object, style, width, trait)
 
     #-------------------------------------------------------------------------
     #  1D view:
@@ -179,6 +250,46 @@ class ArrayStructure(HasTraits):
 
         return View(Group(show_labels=False, *content))
 
+    #-------------------------------------------------------------------------
+    #  Grid view:
+    #-------------------------------------------------------------------------
+
+    def _grid_view(self, object, readonly):
+        factory = self.editor.factory
+        if len(object.shape) == 2:
+            columns = [(str(j), j) for j in range(object.shape[1])]
+        else:
+            columns = [('', 0)]
+
+        adapter = ArrayGridAdapter(columns=columns,
+                                   format=factory.format_str or '%s',
+                                   format_func=factory.format_func)
+        editor = self.editor.grid_editor(adapter=adapter,
+                                         editable=not readonly,
+                                         operations=['edit'],
+                                         show_titles=(len(object.shape) == 2),
+                                         show_row_titles=True)
+
+        return View(Item('array', editor=editor, show_label=False))
+
+    #-------------------------------------------------------------------------
+    #  Sets a single array element from a grid edit:
+    #-------------------------------------------------------------------------
+
+    def set_element(self, row, column, text):
+        """ Sets the array element at the specified grid position from the
+            text entered by the user, writing it directly into the array.
+        """
+        array = self.array
+        index = (row, column) if len(array.shape) == 2 else row
+        try:
+            array[index] = parse_element(array.dtype, text)
+        except (TypeError, ValueError):
+            # Leave the element unchanged if the text is not a valid value:
+            return
+
+        self.editor.update_element()
+
     #-------------------------------------------------------------------------
     #  Updates the underlying tuple when any field changes value:
     #-------------------------------------------------------------------------
@@ -221,6 +332,9 @@ class SimpleEditor(Editor):
     # Is the editor read-only?
     readonly = false
 
+    # Is the array edited using a single grid (rather than fields)?
+    grid = Bool(False)
+
     #-------------------------------------------------------------------------
     #  Finishes initializing the editor by creating the underlying toolkit
     #  widget:
@@ -230,10 +344,82 @@ class SimpleEditor(Editor):
         """ Finishes initializing the editor by creating the underlying toolkit
             widget.
         """
+        # The array user interface is placed in a container, so that it can be
+        # replaced when the shape of the array changes:
+        self.control = self.create_container(parent)
+        self.add_array_control(self.create_array_control(self.control))
+
+    #-------------------------------------------------------------------------
+    #  Creates the container of the array user interface:
+    #
+    #  (Must be overridden in a toolkit subclass)
+    #-------------------------------------------------------------------------
+
+    def create_container(self, parent):
+        """ Creates and returns the toolkit control containing the user
+            interface mirroring the array.
+        """
+        raise NotImplementedError
+
+    #-------------------------------------------------------------------------
+    #  Adds the array user interface to the container:
+    #
+    #  (Must be overridden in a toolkit subclass)
+    #-------------------------------------------------------------------------
+
+    def add_array_control(self, control):
+        """ Adds the control returned by **create_array_control** to the
+            editor's container.
+        """
+        raise NotImplementedError
+
+    #-------------------------------------------------------------------------
+    #  Creates the user interface mirroring the current array:
+    #-------------------------------------------------------------------------
+
+    def create_array_control(self, parent):
+        """ Creates the ArrayStructure mirroring the current array value and
+            returns the control of its user interface.
+        """
+        object = self.value
+        threshold = self.factory.grid_threshold
+        self.grid = (threshold > 0) and (object.size > threshold)
         self._as = _as = ArrayStructure(self)
-        ui = _as.view.ui(_as, parent, kind='subpanel')
+        self._as_ui = ui = _as.view.ui(_as, parent, kind='subpanel')
         ui.parent = self.ui
-        self.control = ui.control
+
+        # Remember what the fields display, so that later updates only need
+        # to push the elements that actually changed (a grid displays the
+        # array itself, so no copy is needed):
+        if self.grid:
+            self._shown = None
+        else:
+            self._shown = object.copy()
+
+        return ui.control
+
+    #-------------------------------------------------------------------------
+    #  Disposes of the user interface mirroring the array:
+    #-------------------------------------------------------------------------
+
+    def dispose_array_control(self):
+        """ Disposes of the user interface created by
+            **create_array_control**.
+        """
+        if self._as_ui is not None:
+            self._as_ui.dispose(abort=True)
+            self._as_ui = self._as = None
+
+    #-------------------------------------------------------------------------
+    #  Rebuilds the editor when the shape of the array changes:
+    #-------------------------------------------------------------------------
+
+    def rebuild_editor(self):
+        """ Rebuilds the editor contents for an array whose shape or type
+            differs from the one currently displayed.
+        """
+        self.dispose_array_control()
+        self.add_array_control(self.create_array_control(self.control))
 
     #-------------------------------------------------------------------------
     #  Updates the editor when the object trait changes external to the editor:
@@ -242,25 +428,47 @@ class SimpleEditor(Editor):
     def update_editor(self):
         """ Updates the editor when the object trait changes externally to the
             editor.
-        """
 
+            Only the elements which differ from the ones currently displayed
+            are pushed to their fields. If the shape (or type) of the array
+            changed, the editor contents are rebuilt instead.
+        """
         if not self._busy:
             self._busy = True
-            object = self.value
-            shape = object.shape
-            _as = self._as
-
-            # 1D
-            if len(shape) == 1:
-                for i in range(shape[0]):
-                    setattr(_as, 'f%d' % i, object[i])
-            # 2D
-            elif len(shape) == 2:
-                for i in range(shape[0]):
-                    for j in range(shape[1]):
-                        setattr(_as, 'f%d_%d' % (i, j), object[i, j])
+            try:
+                object = self.value
+                shown = self._as.array if self.grid else self._shown
+                if ((object.shape != shown.shape) or
+                        (object.dtype != shown.dtype)):
+                    self.rebuild_editor()
+                elif self.grid:
+                    # The table refreshes itself when the array is replaced:
+                    _as = self._as
+                    _as.trait_setq(array=object)
+                    _as.trait_property_changed('array', object, object)
+                else:
+                    self._update_fields(object, shown)
+            finally:
+                self._busy = False
+
+    def _update_fields(self, object, shown):
+        """ Pushes the elements of *object* that differ from the *shown*
+            array to their fields.
+        """
+        _as = self._as
+        changed = (object != shown)
+        if object.dtype.kind in 'fc':
+            # NaN never equals itself, but is not a change:
+            changed &= ~(numpy.isnan(object) & numpy.isnan(shown))
+        changed = numpy.nonzero(changed)
+        if len(object.shape) == 1:
+            for i in changed[0]:
+                setattr(_as, 'f%d' % i, object[i])
+        else:
+            for i, j in zip(*changed):
+                setattr(_as, 'f%d_%d' % (i, j), object[i, j])
 
-            self._busy = False
+        shown[changed] = object[changed]
 
     #-------------------------------------------------------------------------
     #  Updates the array value associated with the editor:
@@ -271,8 +479,34 @@ class SimpleEditor(Editor):
         """
         self._busy = True
         self.value = value
+        self._shown = value.copy()
         self._busy = False
 
+    #-------------------------------------------------------------------------
+    #  Notifies listeners that an element of the array was changed in place:
+    #-------------------------------------------------------------------------
+
+    def update_element(self):
+        """ Notifies listeners of the edited trait that an element of the
+            array was modified in place (when editing with a grid).
+        """
+        self._busy = True
+        try:
+            value = self.value
+            self.object.trait_property_changed(self.name, value, value)
+        finally:
+            self._busy = False
+
+    #-------------------------------------------------------------------------
+    #  Returns the tabular editor factory used to edit the array as a grid:
+    #-------------------------------------------------------------------------
+
+    def grid_editor(self, **traits):
+        """ Returns the tabular editor factory used to edit the array when it
+            is too large to be edited with one field per element.
+        """
+        return TabularEditor(**traits)
+
 
 # Define the ArrayEditor class
 ArrayEditor = ToolkitEditorFactory
@@ -22,7 +22,12 @@
 
 from __future__ import absolute_import
 
-from traits.api import Any, Dict, Bool, Tuple, Int, List, Instance, Str, Enum
+import collections
+import logging
+from threading import Lock, RLock, Thread
+
+from traits.api import (Any, Dict, Bool, Callable, Event, Tuple, Int, List,
+                        Instance, Str, Enum, HasPrivateTraits)
 
 from ..tree_node import TreeNode
 
@@ -32,6 +37,10 @@ from ..editor_factory import EditorFactory
 
 from ..helper import Orientation
 
+from ..toolkit import toolkit_object
+
+logger = logging.getLogger(__name__)
+
 #-------------------------------------------------------------------------
 #  Trait definitions:
 #-------------------------------------------------------------------------
@@ -164,7 +173,615 @@ class ToolkitEditorFactory(EditorFactory):
     # This works only in the qt backend and if there is only one column in tree
     word_wrap = Bool(False)
 
+    # Whether the tree should be displayed using a virtual item model, which
+    # only creates the nodes of the tree as they are scrolled into view and
+    # only requests their labels, icons and colors when they are painted.
+    # This works only in the qt backend, and word wrapping is not supported.
+    virtual = Bool(False)
+
+    # Whether the children of all nodes (and not only of the nodes whose
+    # 'async_children' trait is set) should be fetched in background threads
+    # when they are expanded, showing a placeholder item meanwhile. This works
+    # only in the qt backend, and is ignored (with a warning) by the
+    # **virtual** tree, which fetches children as they are scrolled into view.
+    async_children = Bool(False)
+
+    # The label of the placeholder item shown while children are fetched:
+    loading_label = Str('Loading...')
+
+    # The optional extended trait name of the trait holding the text used to
+    # filter the tree: only the nodes whose label matches the text (and their
+    # ancestors) are shown. The labels of the whole tree are indexed in a
+    # background thread. This works only in the qt backend (including the
+    # **virtual** tree, where the filter applies to the nodes created so far).
+    filter = Str
+
+    # How node labels are matched against the filter text (ignoring case):
+    filter_mode = Enum('substring', 'prefix')
+
+    #-------------------------------------------------------------------------
+    #  Property getters
+    #-------------------------------------------------------------------------
+
+    def _get_simple_editor_class(self):
+        """ Returns the editor class to use for "simple" style views.
+
+        If **virtual** is set, this is the virtual tree editor of the backend
+        package, if the backend implements it.
+        """
+        if self.virtual:
+            try:
+                return toolkit_object('tree_model_editor:SimpleEditor', True)
+            except (ImportError, AttributeError):
+                pass
+
+        return super(ToolkitEditorFactory, self)._get_simple_editor_class()
+
 # Define the TreeEditor class.
 TreeEditor = ToolkitEditorFactory
 
+#-------------------------------------------------------------------------
+#  'TreeNodeCache' class:
+#-------------------------------------------------------------------------
+
+# The extended name of the factory traits which invalidate a TreeNodeCache:
+NODES_CHANGED = 'nodes.[node_for,cache_node_for]'
+
+
+class TreeNodeCache(object):
+    """ Caches which of the nodes of a tree editor factory handle each class of
+        objects, so that a tree editor does not have to ask every node about
+        every object added to the tree.
+
+        Nodes whose **cache_node_for** trait is False are still asked about
+        every object. The cache is flushed whenever the factory nodes (or
+        their **node_for** or **cache_node_for** traits) change.
+    """
+
+    def __init__(self, factory):
+        """ Initializes the object.
+        """
+        self.factory = factory
+        self.flush()
+        factory.on_trait_change(self.flush, NODES_CHANGED)
+
+    def dispose(self):
+        """ Stops listening to changes of the factory nodes.
+        """
+        self.factory.on_trait_change(self.flush, NODES_CHANGED, remove=True)
+
+    def flush(self):
+        """ Discards all cached information.
+        """
+        # The nodes which have to be asked about every object:
+        self._dynamic_nodes = [node for node in self.factory.nodes
+                               if not node.cache_node_for]
+
+        # Mapping from classes to the list of cacheable matching nodes:
+        self._matching_nodes = {}
+
+        # Mapping from classes to the node resolved for their instances:
+        self._nodes = {}
+
+        # Mappings from classes and class names to the results of
+        # 'node_for_class' and 'node_for_class_name':
+        self._class_nodes = {}
+        self._class_name_nodes = {}
+
+    def nodes_for(self, object):
+        """ Returns the list of factory nodes handling a specified object, in
+            the order of the factory nodes.
+        """
+        if object is None:
+            return []
+
+        klass = object.__class__
+        nodes = self._matching_nodes.get(klass)
+        if nodes is None:
+            self._matching_nodes[klass] = nodes = [
+                node for node in self.factory.nodes
+                if node.cache_node_for and node.is_node_for(object)]
+
+        if len(self._dynamic_nodes) == 0:
+            return nodes[:]
+
+        matching = set(nodes)
+        matching.update(node for node in self._dynamic_nodes
+                        if node.is_node_for(object))
+
+        return [node for node in self.factory.nodes if node in matching]
+
+    def get_node(self, object):
+        """ Returns the node previously resolved for the class of a specified
+            object (if any).
+        """
+        return self._nodes.get(object.__class__)
+
+    def set_node(self, object, node):
+        """ Records the node resolved for a specified object as the node for
+            all instances of its class (if allowed), and returns the node.
+        """
+        if (object is not None) and (len(self._dynamic_nodes) == 0):
+            self._nodes[object.__class__] = node
+
+        return node
+
+    def node_for_class(self, klass):
+        """ Returns the TreeNode associated with a specified class.
+        """
+        try:
+            return self._class_nodes[klass]
+        except KeyError:
+            pass
+
+        for node in self.factory.nodes:
+            if issubclass(klass, tuple(node.node_for)):
+                break
+        else:
+            node = None
+        self._class_nodes[klass] = node
+
+        return node
+
+    def node_for_class_name(self, class_name):
+        """ Returns the node and class associated with a specified class name.
+        """
+        try:
+            return self._class_name_nodes[class_name]
+        except KeyError:
+            pass
+
+        result = (None, None)
+        for node in self.factory.nodes:
+            for klass in node.node_for:
+                if class_name == klass.__name__:
+                    result = (node, klass)
+                    break
+            if result[0] is not None:
+                break
+        self._class_name_nodes[class_name] = result
+
+        return result
+
+#-------------------------------------------------------------------------
+#  'TreeChildrenLoader' class:
+#-------------------------------------------------------------------------
+
+# The maximum number of worker threads of a TreeChildrenLoader:
+LOADER_THREADS = 4
+
+
+class TreeChildrenLoader(HasPrivateTraits):
+    """ Fetches the children of tree node objects in background threads.
+
+        Each load request is identified by a key (typically the tree item being
+        expanded). At most **async_limit** objects of the same TreeNode are
+        loaded at the same time; further requests wait for their turn. The
+        **loaded** event is fired from the worker thread with a (key,
+        children) tuple once the children of a request which has not been
+        cancelled are available.
+    """
+
+    # Fired (from a worker thread) with a (key, children) tuple when the
+    # children requested for a key have been loaded:
+    loaded = Event
+
+    def __init__(self, **traits):
+        """ Initializes the object.
+        """
+        super(TreeChildrenLoader, self).__init__(**traits)
+
+        self._lock = Lock()
+
+        # Mapping from keys to their (node, object) requests waiting to be
+        # started, and to their started requests:
+        self._requests = {}
+        self._started = {}
+
+        # The keys of the requests waiting to be started:
+        self._waiting = collections.deque()
+
+        # Mapping from nodes to the number of their running requests:
+        self._running = {}
+
+        # The number of running worker threads:
+        self._workers = 0
+
+    #-- Public Methods -------------------------------------------------------
+
+    def load(self, key, node, object):
+        """ Requests the children of an object handled by a node, replacing
+            any previous request for the same key.
+        """
+        with self._lock:
+            # A started request for the same key is superseded:
+            self._started.pop(key, None)
+            if key not in self._requests:
+                self._waiting.append(key)
+            self._requests[key] = (node, object)
+            start = self._workers < LOADER_THREADS
+            if start:
+                self._workers += 1
+
+        if start:
+            thread = Thread(target=self._work)
+            thread.daemon = True
+            thread.start()
+
+    def cancel(self, key):
+        """ Cancels the request for a specified key (if any). The children of
+            a cancelled request are not reported, even if they are being
+            loaded already.
+        """
+        with self._lock:
+            self._requests.pop(key, None)
+            self._started.pop(key, None)
+
+    def is_loading(self, key):
+        """ Returns whether a request for a specified key is pending.
+        """
+        return (key in self._requests) or (key in self._started)
+
+    def dispose(self):
+        """ Cancels all pending requests.
+        """
+        with self._lock:
+            self._requests.clear()
+            self._started.clear()
+            self._waiting.clear()
+
+    #-- Private Methods ------------------------------------------------------
+
+    def _work(self):
+        """ Runs the waiting requests (in a worker thread).
+        """
+        while True:
+            with self._lock:
+                next = self._next_request()
+                if next is None:
+                    self._workers -= 1
+                    return
+
+            key, request = next
+            node, object = request
+            try:
+                children = list(node.get_children(object))
+            except Exception:
+                logger.exception('Error loading the children of %r', object)
+                children = []
+
+            with self._lock:
+                self._running[node] -= 1
+                if self._running[node] == 0:
+                    del self._running[node]
+                current = self._started.get(key) is request
+                if current:
+                    del self._started[key]
+
+            if current:
+                self.loaded = (key, children)
+
+    def _next_request(self):
+        """ Returns the next (key, request) that can be started, if any
+            (called with the lock held).
+        """
+        waiting = self._waiting
+        for i in range(len(waiting)):
+            key = waiting.popleft()
+            request = self._requests.get(key)
+            if request is None:
+                # The request has been cancelled:
+                continue
+
+            node = request[0]
+            running = self._running.get(node, 0)
+            if running < getattr(node, 'async_limit', 1):
+                self._running[node] = running + 1
+                self._started[key] = self._requests.pop(key)
+                return (key, request)
+
+            # The node is busy, so wait for one of its requests to finish:
+            waiting.append(key)
+
+        return None
+
+#-------------------------------------------------------------------------
+#  'TreeLabelIndex' class:
+#-------------------------------------------------------------------------
+
+
+class TreeLabelIndex(HasPrivateTraits):
+    """ An index of the labels of all objects of a tree, used to filter it.
+
+        The labels and children of the objects are read in a background
+        thread, walking the tree from its root object with the 'get_label' and
+        'get_children' methods of the tree nodes. The nodes of the children
+        are resolved, and the index updated, on the UI thread, which then
+        fires the **updated** event.
+
+        The index does not listen to the objects itself: **listener** is told
+        which objects are indexed, and their label and children changes must
+        be reported with **label_changed** and **children_changed**.
+    """
+
+    # Returns the (object, node) pair for a child object, or (object, None)
+    # if the object is not part of the tree (called on the UI thread):
+    node_for = Callable
+
+    # Called (on the UI thread) as listener(object, node, remove) when an
+    # object is added to (remove=False) or removed from (remove=True) the
+    # index:
+    listener = Callable
+
+    # How labels are matched against the filter text (ignoring case):
+    mode = Enum('substring', 'prefix')
+
+    # Is the index up to date with all the objects queued for indexing?
+    complete = Bool(False)
+
+    # Fired when the index has been brought up to date:
+    updated = Event
+
+    # Fired (from the indexing thread) when objects have been read:
+    _read = Event
+
+    def __init__(self, **traits):
+        """ Initializes the object.
+        """
+        super(TreeLabelIndex, self).__init__(**traits)
+
+        self._lock = RLock()
+
+        # Mapping from the ids of the indexed objects to their (object, node)
+        # pair, their lower case label, the ids of their parents and the ids
+        # of their children:
+        self._objects = {}
+        self._labels = {}
+        self._parents = {}
+        self._children = {}
+
+        # The id of the root object:
+        self._root = None
+
+        # The (object, node) pairs waiting to be (re)indexed, and their ids:
+        self._queue = collections.deque()
+        self._queued = set()
+
+        # The (generation, object, node, label, children) tuples read by the
+        # indexing thread, waiting to be added to the index:
+        self._results = []
+
+        # Incremented whenever the index is discarded, so that the results
+        # read for a previous tree are ignored:
+        self._generation = 0
+
+        # Is the indexing thread running?
+        self._running = False
+
+        # Incremented whenever the index changes:
+        self._version = 0
+
+        # The (version, text, matches) of the last query:
+        self._last_query = None
+
+        self.on_trait_change(self._store_results, '_read', dispatch='ui')
+
+    #-- Public Methods -------------------------------------------------------
+
+    def reset(self, object, node):
+        """ Starts indexing the tree of a (new) root object.
+        """
+        with self._lock:
+            self._clear()
+            if node is not None:
+                self._root = id(object)
+                self._enqueue(object, node)
+
+    def dispose(self):
+        """ Stops indexing, and tells the listener about all of the objects
+            which are no longer indexed.
+        """
+        self.on_trait_change(self._store_results, '_read', remove=True)
+        with self._lock:
+            self._clear()
+
+    def label_changed(self, object):
+        """ Updates the label of an object (if it is indexed).
+        """
+        with self._lock:
+            info = self._objects.get(id(object))
+            if info is None:
+                return
+
+            self._labels[id(object)] = (info[1].get_label(object) or
+                                        '').lower()
+            self._version += 1
+
+        self.updated = True
+
+    def children_changed(self, object):
+        """ Reindexes the children of an object (if it is indexed).
+        """
+        with self._lock:
+            info = self._objects.get(id(object))
+            if info is not None:
+                self._enqueue(*info)
+
+    def match(self, text):
+        """ Returns the ids of the objects whose label matches a specified
+            text, and the ids of their ancestors, as a (matches, ancestors)
+            tuple of sets.
+
+            When the text extends the text of the previous query (as it does
+            while the user types), only the previous matches are searched.
+        """
+        text = text.lower()
+        with self._lock:
+            last = self._last_query
+            if ((last is not None) and (last[0] == self._version) and
+                    text.startswith(last[1])):
+                candidates = last[2]
+            else:
+                candidates = self._labels.keys()
+
+            labels = self._labels
+            if self.mode == 'prefix':
+                matches = set(oid for oid in candidates
+                              if labels[oid].startswith(text))
+            else:
+                matches = set(oid for oid in candidates
+                              if text in labels[oid])
+            self._last_query = (self._version, text, matches)
+
+            ancestors = set()
+            stack = [oid for oid in matches]
+            while len(stack) > 0:
+                for pid in self._parents.get(stack.pop(), ()):
+                    if pid not in ancestors:
+                        ancestors.add(pid)
+                        stack.append(pid)
+
+        return (matches, ancestors)
+
+    #-- Private Methods ------------------------------------------------------
+
+    def _clear(self):
+        """ Discards the whole index (called with the lock held).
+        """
+        for object, node in self._objects.values():
+            self._listen(object, node, True)
+
+        self._objects.clear()
+        self._labels.clear()
+        self._parents.clear()
+        self._children.clear()
+        self._queue.clear()
+        self._queued.clear()
+        del self._results[:]
+        self._root = None
+        self._generation += 1
+        self._version += 1
+
+    def _enqueue(self, object, node):
+        """ Queues an object for (re)indexing, and makes sure the indexing
+            thread is running (called with the lock held).
+        """
+        if id(object) not in self._queued:
+            self._queued.add(id(object))
+            self._queue.append((object, node))
+
+        self.complete = False
+        if not self._running:
+            self._running = True
+            thread = Thread(target=self._work)
+            thread.daemon = True
+            thread.start()
+
+    def _work(self):
+        """ Reads the labels and children of the queued objects (in the
+            indexing thread).
+        """
+        while True:
+            with self._lock:
+                if len(self._queue) == 0:
+                    self._running = False
+                    break
+
+                object, node = self._queue.popleft()
+                self._queued.discard(id(object))
+                generation = self._generation
+
+            try:
+                label = node.get_label(object)
+                children = []
+                if node.allows_children(object):
+                    children = list(node.get_children(object))
+            except Exception:
+                logger.exception('Error indexing the tree node of %r', object)
+                continue
+
+            with self._lock:
+                self._results.append(
+                    (generation, object, node, label, children))
+
+        self._read = True
+
+    def _store_results(self):
+        """ Adds the objects read by the indexing thread to the index,
+            resolving the nodes of their children (on the UI thread).
+        """
+        with self._lock:
+            results, self._results = self._results, []
+
+        for generation, object, node, label, children in results:
+            children = [self.node_for(child) for child in children]
+            with self._lock:
+                if generation == self._generation:
+                    self._store(object, node, label,
+                                [(child, child_node)
+                                 for child, child_node in children
+                                 if child_node is not None])
+
+        with self._lock:
+            self.complete = ((not self._running) and
+                             (len(self._results) == 0))
+
+        self.updated = True
+
+    def _store(self, object, node, label, children):
+        """ Records the label and children of an object, and queues the
+            children which are not indexed yet (called with the lock held).
+        """
+        oid = id(object)
+        if (oid != self._root) and (len(self._parents.get(oid, ())) == 0):
+            # The object has been removed from the tree meanwhile:
+            return
+
+        if oid not in self._objects:
+            self._objects[oid] = (object, node)
+            self._listen(object, node)
+        self._labels[oid] = (label or '').lower()
+
+        child_ids = [id(child) for child, child_node in children]
+        for cid in set(self._children.get(oid, ())) - set(child_ids):
+            self._unlink(cid, oid)
+        self._children[oid] = child_ids
+
+        for child, child_node in children:
+            cid = id(child)
+            self._parents.setdefault(cid, set()).add(oid)
+            if cid not in self._objects:
+                self._enqueue(child, child_node)
+
+        self._version += 1
+
+    def _unlink(self, cid, pid):
+        """ Removes a child object from the children of a parent object, and
+            removes it (and its descendants) from the index if it has no
+            parent left (called with the lock held).
+        """
+        stack = [(cid, pid)]
+        while len(stack) > 0:
+            cid, pid = stack.pop()
+            parents = self._parents.get(cid)
+            if parents is None:
+                continue
+
+            parents.discard(pid)
+            if (len(parents) == 0) and (cid != self._root):
+                del self._parents[cid]
+                self._labels.pop(cid, None)
+                info = self._objects.pop(cid, None)
+                if info is not None:
+                    self._listen(info[0], info[1], True)
+                for gid in self._children.pop(cid, ()):
+                    stack.append((gid, cid))
+
+    def _listen(self, object, node, remove=False):
+        """ Tells the listener (if any) that an object has been added to (or
+            removed from) the index.
+        """
+        if self.listener is not None:
+            self.listener(object, node, remove)
+
 ### EOF #######################################################################
@@ -25,7 +25,9 @@
 
 from __future__ import absolute_import
 
+from collections import OrderedDict
 from operator import itemgetter
+from threading import Lock
 
 from traits.api import BaseTraitHandler, CTrait, Enum, TraitError
 
@@ -41,6 +43,13 @@ Orientation = Enum('horizontal', 'vertical')
 # Docking drag bar style:
 DockStyle = Enum('horizontal', 'vertical', 'tab', 'fixed')
 
+#-------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------
+
+# The maximum number of compiled expressions kept by 'compile_expression':
+EXPRESSION_CACHE_SIZE = 1024
+
 #----------------------------------------------------------------------------
 #  Return a 'user-friendly' name for a specified trait:
 #----------------------------------------------------------------------------
@@ -115,3 +124,74 @@ def enum_values_changed(values, strfunc=unicode):
         inverse_mapping[value] = name
 
     return (names, mapping, inverse_mapping)
+
+#-------------------------------------------------------------------------
+#  'ExpressionCache' class:
+#-------------------------------------------------------------------------
+
+
+class ExpressionCache(object):
+    """ A bounded cache of compiled expressions, which discards the least
+        recently used expressions first.
+
+        The number of cache hits and misses is kept in the **hits** and
+        **misses** attributes (for profiling).
+    """
+
+    def __init__(self, size=EXPRESSION_CACHE_SIZE):
+        # The maximum number of compiled expressions kept:
+        self.size = size
+
+        # The number of cache hits and misses:
+        self.hits = self.misses = 0
+
+        self._codes = OrderedDict()
+        self._lock = Lock()
+
+    def compile(self, expression):
+        """ Returns the code object for a specified expression string
+            (compiled for 'eval'). Anything other than a string (such as an
+            already compiled expression) is returned unchanged.
+        """
+        if not isinstance(expression, basestring):
+            return expression
+
+        with self._lock:
+            codes = self._codes
+            code = codes.pop(expression, None)
+            if code is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+                code = compile(expression, '<string>', 'eval')
+                if len(codes) >= self.size:
+                    codes.popitem(last=False)
+
+            codes[expression] = code
+
+        return code
+
+    def clear(self):
+        """ Discards all compiled expressions and resets the statistics.
+        """
+        with self._lock:
+            self._codes.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._codes)
+
+# The cache of compiled expressions shared by all user interfaces:
+expression_cache = ExpressionCache()
+
+#-------------------------------------------------------------------------
+#  Compiles an expression (using the shared cache):
+#-------------------------------------------------------------------------
+
+
+def compile_expression(expression):
+    """ Returns the code object for a specified expression string, taken
+        from the shared **expression_cache** (where it is compiled on first
+        use). Anything other than a string is returned unchanged.
+    """
+    return expression_cache.compile(expression)
@@ -39,6 +39,8 @@ from .ui_traits import convert_theme, ContainerDelegate, EditorStyle
 
 from .editor_factory import EditorFactory
 
+from .helper import compile_expression
+
 #-------------------------------------------------------------------------
 #  Constants:
 #-------------------------------------------------------------------------
@@ -333,7 +335,7 @@ class Item(ViewSubElement):
         if self.help != '':
             return self.help
 
-        object = eval(self.object_, globals(), ui.context)
+        object = eval(compile_expression(self.object_), globals(), ui.context)
 
         return object.base_trait(self.name).get_help()
 
@@ -365,7 +367,7 @@ class Item(ViewSubElement):
             return label
 
         name = self.name
-        object = eval(self.object_, globals(), ui.context)
+        object = eval(compile_expression(self.object_), globals(), ui.context)
         trait = object.base_trait(name)
         label = user_name_for(name)
         tlabel = trait.label
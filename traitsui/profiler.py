@@ -0,0 +1,385 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+
+""" Defines an opt-in profiler for the construction and use of Traits-based
+    user interfaces.
+
+    While a profiler is active (see **profile_ui**), the time spent building
+    views, panels, Items and editors is recorded as a tree, together with
+    counts of the trait listeners installed, of the editor updates and of the
+    evaluations of 'visible_when', 'enabled_when' and 'checked_when'
+    conditions. For example::
+
+        with profile_ui() as profiler:
+            ui = model.edit_traits()
+            ...
+        print(profiler.summary())
+        data = profiler.to_json()
+"""
+
+#-------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+import json
+from collections import defaultdict
+from contextlib import contextmanager
+from time import time
+from weakref import WeakSet
+
+from .helper import expression_cache
+
+#-------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------
+
+# The profiler currently recording (None if none is active):
+active_profiler = None
+
+#-------------------------------------------------------------------------
+#  Records the time spent in a block of code with the active profiler:
+#-------------------------------------------------------------------------
+
+
+def profiled(kind, name='', editor=None):
+    """ Returns a context manager recording the time spent in its block as a
+        node of the active profiler's tree (doing nothing if no profiler is
+        active).
+
+        If *editor* is specified, the time is also added to the statistics
+        of the editor's class, and *name* defaults to the class name.
+    """
+    profiler = active_profiler
+    if profiler is None:
+        return _not_profiled
+
+    return profiler.record(kind, name, editor)
+
+#-------------------------------------------------------------------------
+#  Starts/Ends recording a node with the active profiler:
+#-------------------------------------------------------------------------
+
+
+def begin_profiled(kind, name=''):
+    """ Starts recording a node of the active profiler's tree, for work
+        which does not fit in a single block of code. Returns the node (None
+        if no profiler is active), which is recorded until it is passed to
+        **end_profiled**.
+    """
+    profiler = active_profiler
+    if profiler is None:
+        return None
+
+    return profiler.begin(kind, name)
+
+
+def end_profiled(node):
+    """ Ends recording a node returned by **begin_profiled** (doing nothing
+        if it is None or has already ended).
+    """
+    profiler = active_profiler
+    if (node is not None) and (profiler is not None):
+        profiler.end(node)
+
+#-------------------------------------------------------------------------
+#  Counts an event with the active profiler:
+#-------------------------------------------------------------------------
+
+
+def count_event(counter, editor=None, n=1):
+    """ Counts an event with the active profiler (if any).
+
+        The event is counted globally, for the node of the tree currently
+        being recorded and, if *editor* is specified, for the editor's class.
+    """
+    profiler = active_profiler
+    if profiler is not None:
+        profiler.count(counter, editor, n)
+
+#-------------------------------------------------------------------------
+#  Profiles the user interfaces built and used in a block of code:
+#-------------------------------------------------------------------------
+
+
+@contextmanager
+def profile_ui():
+    """ Returns a context manager which profiles the user interfaces built
+        and used in its block, yielding the UIProfiler object.
+    """
+    profiler = UIProfiler()
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+
+#-------------------------------------------------------------------------
+#  '_NotProfiled' class:
+#-------------------------------------------------------------------------
+
+
+class _NotProfiled(object):
+    """ Context manager used by **profiled** when no profiler is active.
+    """
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+_not_profiled = _NotProfiled()
+
+#-------------------------------------------------------------------------
+#  'ProfileNode' class:
+#-------------------------------------------------------------------------
+
+
+class ProfileNode(object):
+    """ A node of the tree recorded by a UIProfiler.
+    """
+
+    def __init__(self, kind, name):
+        # The kind of work recorded (e.g. 'View', 'Item' or 'prepare'):
+        self.kind = kind
+
+        # The name of the element the work was done for:
+        self.name = name
+
+        # The wall time spent (in seconds):
+        self.time = 0.0
+
+        # The number of events counted while the node was recorded:
+        self.counters = defaultdict(int)
+
+        # The nodes recorded while the node was recorded:
+        self.children = []
+
+        # The time the recording of the node started:
+        self._start = None
+
+    def to_dict(self):
+        """ Returns the node and its children as a dictionary.
+        """
+        return {
+            'kind': self.kind,
+            'name': self.name,
+            'time': self.time,
+            'counters': dict(self.counters),
+            'children': [child.to_dict() for child in self.children]
+        }
+
+#-------------------------------------------------------------------------
+#  'UIProfiler' class:
+#-------------------------------------------------------------------------
+
+
+class UIProfiler(object):
+    """ Records where the time goes while building and using Traits-based
+        user interfaces.
+    """
+
+    def __init__(self):
+        # The root of the tree of recorded nodes:
+        self.root = ProfileNode('profile', '')
+
+        # The events counted, for all of the recorded nodes:
+        self.counters = defaultdict(int)
+
+        # Mapping from editor class names to their statistics:
+        self.editors = defaultdict(lambda: defaultdict(float))
+
+        # The stack of nodes being recorded:
+        self._stack = [self.root]
+
+        # The editors used while profiling (for their 'dropped_updates'):
+        self._editors = WeakSet()
+
+        # The profiler which was active when this one was started:
+        self._previous = None
+
+        # Time and expression cache statistics when the profiler started:
+        self._start_time = None
+        self._cache_stats = (0, 0)
+
+    def start(self):
+        """ Makes the profiler the active one.
+        """
+        global active_profiler
+
+        self._previous = active_profiler
+        active_profiler = self
+        self._start_time = time()
+        self._cache_stats = (expression_cache.hits, expression_cache.misses)
+
+    def stop(self):
+        """ Stops the profiler, restoring the profiler which was previously
+            active (if any).
+        """
+        global active_profiler
+
+        if self._start_time is not None:
+            self.root.time += time() - self._start_time
+            self._start_time = None
+            hits, misses = self._cache_stats
+            self.counters['expression_cache_hits'] += (
+                expression_cache.hits - hits)
+            self.counters['expression_cache_misses'] += (
+                expression_cache.misses - misses)
+
+        if active_profiler is self:
+            active_profiler = self._previous
+        self._previous = None
+
+    @contextmanager
+    def record(self, kind, name='', editor=None):
+        """ Returns a context manager recording the time spent in its block
+            as a new node, yielding the node.
+        """
+        if editor is not None:
+            class_name = self._class_name(editor)
+            if name == '':
+                name = class_name
+            self._editors.add(editor)
+
+        node = self.begin(kind, name)
+        try:
+            yield node
+        finally:
+            self.end(node)
+            if editor is not None:
+                stats = self.editors[class_name]
+                stats[kind] += 1
+                stats[kind + '_time'] += node.time
+
+    def begin(self, kind, name=''):
+        """ Starts recording a new node, as a child of the node currently
+            being recorded, and returns it.
+        """
+        node = ProfileNode(kind, name)
+        self._stack[-1].children.append(node)
+        self._stack.append(node)
+        node._start = time()
+
+        return node
+
+    def end(self, node):
+        """ Ends recording a node, and any node started since then which
+            has not ended yet. Does nothing if the node has already ended.
+        """
+        if node not in self._stack[1:]:
+            return
+
+        now = time()
+        while True:
+            top = self._stack.pop()
+            top.time = now - top._start
+            if top is node:
+                break
+
+    def count(self, counter, editor=None, n=1):
+        """ Counts an event.
+        """
+        self.counters[counter] += n
+        self._stack[-1].counters[counter] += n
+        if editor is not None:
+            self.editors[self._class_name(editor)][counter] += n
+
+    def report(self):
+        """ Returns the profile as a dictionary, with the tree of recorded
+            nodes, the counters and the statistics of each editor class.
+        """
+        editors = dict((name, dict(stats))
+                       for name, stats in self.editors.items())
+        for editor in list(self._editors):
+            dropped = getattr(editor, 'dropped_updates', 0)
+            if dropped:
+                stats = editors[self._class_name(editor)]
+                stats['dropped_updates'] = (stats.get('dropped_updates', 0) +
+                                            dropped)
+
+        return {
+            'tree': self.root.to_dict(),
+            'counters': dict(self.counters),
+            'editors': editors
+        }
+
+    def to_json(self, **kw):
+        """ Returns the profile (see **report**) as a JSON string.
+        """
+        kw.setdefault('indent', 2)
+        kw.setdefault('sort_keys', True)
+
+        return json.dumps(self.report(), **kw)
+
+    def summary(self, min_time=0.0):
+        """ Returns a printable summary of the profile. Nodes of the tree
+            taking less than *min_time* seconds are omitted.
+        """
+        report = self.report()
+        lines = ['UI profile: %.3fs' % report['tree']['time']]
+        for child in report['tree']['children']:
+            self._summarize_node(child, min_time, 1, lines)
+
+        if len(report['editors']) > 0:
+            lines.append('Editors:')
+            editors = sorted(report['editors'].items(),
+                             key=lambda item: -item[1].get('prepare_time', 0))
+            for name, stats in editors:
+                lines.append('  %s: %s' % (name, self._format_counters(
+                    stats, '%d created' % stats.get('prepare', 0),
+                    '%.3fs' % stats.get('prepare_time', 0.0))))
+
+        if len(report['counters']) > 0:
+            lines.append('Counters: ' +
+                         self._format_counters(report['counters']))
+
+        return '\n'.join(lines)
+
+    #-- Private Methods ------------------------------------------------------
+
+    def _summarize_node(self, node, min_time, level, lines):
+        """ Adds the summary lines of a node and its children.
+        """
+        if node['time'] < min_time:
+            return
+
+        description = node['kind']
+        if node['name'] != '':
+            description += " '%s'" % node['name']
+        lines.append('%s%s: %.3fs%s' % (
+            '  ' * level, description, node['time'],
+            self._format_counters(node['counters'], prefix=' [',
+                                  suffix=']')))
+        for child in node['children']:
+            self._summarize_node(child, min_time, level + 1, lines)
+
+    def _format_counters(self, counters, *first, **kw):
+        """ Formats a dictionary of counters, after the strings in *first*
+            (omitting the recorded times of editor statistics).
+        """
+        items = list(first) + [
+            '%s=%d' % (name, value) for name, value in sorted(counters.items())
+            if not (name.endswith('_time') or (name + '_time') in counters)]
+        if len(items) == 0:
+            return ''
+
+        return '%s%s%s' % (kw.get('prefix', ''), ', '.join(items),
+                           kw.get('suffix', ''))
+
+    def _class_name(self, editor):
+        """ Returns the qualified name of the class of an editor.
+        """
+        cls = editor.__class__
+        return '%s.%s' % (cls.__module__, cls.__name__)
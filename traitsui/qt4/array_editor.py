@@ -24,12 +24,78 @@
 # FIXME: ToolkitEditorFactory is a proxy class defined here just for backward
 # compatibility. The class has been moved to the
 # traitsui.editors.array_editor file.
+from pyface.qt import QtCore, QtGui
+
+from traits.api import Bool, Property
+
 from traitsui.editors.array_editor \
     import SimpleEditor as BaseSimpleEditor, ToolkitEditorFactory
 
+from traitsui.editors.tabular_editor \
+    import TabularEditor as TabularEditorFactory
+
 from editor \
     import Editor
 
+from tabular_editor \
+    import TabularEditor, _ItemDelegate
+
+#-------------------------------------------------------------------------
+#  '_ArrayGridDelegate' class:
+#-------------------------------------------------------------------------
+
+
+class _ArrayGridDelegate(_ItemDelegate):
+    """ An item delegate that commits every keystroke to the model, used when
+        the array editor factory's 'auto_set' is True.
+    """
+
+    def createEditor(self, parent, option, index):
+        """ Reimplemented to commit the data whenever the text is edited.
+        """
+        control = _ItemDelegate.createEditor(self, parent, option, index)
+        if isinstance(control, QtGui.QLineEdit):
+            signal = QtCore.SIGNAL('commitData(QWidget*)')
+            QtCore.QObject.connect(control,
+                                   QtCore.SIGNAL('textEdited(QString)'),
+                                   lambda text: self.emit(signal, control))
+
+        return control
+
+#-------------------------------------------------------------------------
+#  '_ArrayGridEditor' class:
+#-------------------------------------------------------------------------
+
+
+class _ArrayGridEditor(TabularEditor):
+    """ The tabular editor used to edit large arrays as a grid.
+    """
+
+    def init(self, parent):
+        """ Finishes initializing the editor by creating the underlying toolkit
+            widget.
+        """
+        super(_ArrayGridEditor, self).init(parent)
+
+        if self.factory.auto_set:
+            self.control.setItemDelegate(_ArrayGridDelegate(self.control))
+
+
+class _ArrayGridEditorFactory(TabularEditorFactory):
+    """ Editor factory for the grid used to edit large arrays.
+    """
+
+    # The editor class to be created:
+    klass = Property
+
+    # Is each keystroke committed to the array?
+    auto_set = Bool(False)
+
+    def _get_klass(self):
+        """ Returns the editor class to be instantiated.
+        """
+        return _ArrayGridEditor
+
 #-------------------------------------------------------------------------
 #  'SimpleEditor' class:
 #-------------------------------------------------------------------------
@@ -39,9 +105,27 @@ class SimpleEditor(BaseSimpleEditor, Editor):
     """ Simple style of editor for arrays.
     """
 
-    # FIXME: This class has been re-defined here simply so it inherits from the
-    # PyQt Editor class.
-    pass
+    def create_container(self, parent):
+        """ Creates and returns the toolkit control containing the user
+            interface mirroring the array.
+        """
+        control = QtGui.QWidget()
+        layout = QtGui.QVBoxLayout(control)
+        layout.setContentsMargins(0, 0, 0, 0)
+        return control
+
+    def add_array_control(self, control):
+        """ Adds the control returned by **create_array_control** to the
+            editor's container.
+        """
+        self.control.layout().addWidget(control)
+
+    def grid_editor(self, **traits):
+        """ Returns the tabular editor factory used to edit the array when it
+            is too large to be edited with one field per element.
+        """
+        return _ArrayGridEditorFactory(auto_set=self.factory.auto_set,
+                                       **traits)
 
 #-------------------------------------------------------------------------
 #  'ReadonlyEditor' class:
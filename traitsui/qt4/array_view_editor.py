@@ -16,15 +16,441 @@
 #  Imports:
 #-------------------------------------------------------------------------
 
+from math import ceil, floor
+
+import numpy as np
+
+from pyface.qt import QtCore, QtGui
+
+from traits.api import Callable, Instance, Property
+
+from traitsui.editors.tabular_editor import \
+    TabularEditor as TabularEditorFactory
+
 from traitsui.ui_editors.array_view_editor \
-    import _ArrayViewEditor as BaseArrayViewEditor
+    import _ArrayViewEditor as BaseArrayViewEditor, ArraySummary, \
+    column_title, format_block
+
+from editor import Editor
 
 from ui_editor import UIEditor
 
+from array_view_model import ArrayViewModel
+
+from tabular_editor import TabularEditor
+
+#-------------------------------------------------------------------------
+#  '_ArrayTabularEditor' class:
+#-------------------------------------------------------------------------
+
+
+class _ArrayTabularEditor(TabularEditor):
+    """ A tabular editor whose model reads directly from the array buffer.
+    """
+
+    model_factory = Callable(
+        lambda *args, **kwds: ArrayViewModel(*args, **kwds))
+
+
+class _ArrayTabularEditorFactory(TabularEditorFactory):
+    """ Tabular editor factory creating **_ArrayTabularEditor** editors.
+    """
+
+    # The editor class to be created:
+    klass = Property
+
+    def _get_klass(self):
+        """ Returns the editor class to be instantiated.
+        """
+        return _ArrayTabularEditor
+
 #-------------------------------------------------------------------------
 #  '_ArrayViewEditor' class:
 #-------------------------------------------------------------------------
 
 
 class _ArrayViewEditor(BaseArrayViewEditor, UIEditor):
-    pass
+
+    def _tabular_editor(self, **traits):
+        """ Returns the tabular editor factory used to display the array.
+        """
+        return _ArrayTabularEditorFactory(**traits)
+
+#-------------------------------------------------------------------------
+#  '_ArraySummaryEditor' class:
+#-------------------------------------------------------------------------
+
+
+class _ArraySummaryEditor(Editor):
+    """ Displays a zoomable overview of a large 1D or 2D array, aggregating
+        blocks of elements into a heatmap and showing the exact values of the
+        elements once zoomed in far enough.
+    """
+
+    # Indicate that the editor is scrollable/resizable:
+    scrollable = True
+
+    # The pyramid of reductions of the array currently displayed:
+    summary = Instance(ArraySummary)
+
+    #-------------------------------------------------------------------------
+    #  Finishes initializing the editor by creating the underlying toolkit
+    #  widget:
+    #-------------------------------------------------------------------------
+
+    def init(self, parent):
+        """ Finishes initializing the editor by creating the underlying toolkit
+            widget.
+        """
+        self.control = _ArraySummaryWidget(self)
+
+    #-------------------------------------------------------------------------
+    #  Disposes of the contents of an editor:
+    #-------------------------------------------------------------------------
+
+    def dispose(self):
+        """ Disposes of the contents of an editor.
+        """
+        self._set_summary(None)
+
+        super(_ArraySummaryEditor, self).dispose()
+
+    #-------------------------------------------------------------------------
+    #  Updates the editor when the object trait changes external to the editor:
+    #-------------------------------------------------------------------------
+
+    def update_editor(self):
+        """ Updates the editor when the object trait changes externally to the
+            editor.
+        """
+        array = self.value
+        if array.ndim not in (1, 2):
+            raise ValueError("ArrayViewEditor can only display 1D or 2D "
+                             "arrays")
+
+        if not (np.issubdtype(array.dtype, np.number) or
+                (array.dtype == bool)):
+            raise ValueError("ArrayViewEditor can only summarize numeric "
+                             "arrays")
+
+        if array.ndim == 1:
+            array = array.reshape(-1, 1)
+
+        if self.factory.transpose:
+            array = array.T
+
+        # Each new version of the array gets its own pyramid of reductions,
+        # which is then reused for every zoom level and position:
+        summary = ArraySummary(array=array,
+                               statistic=self.factory.summary_statistic)
+        self._set_summary(summary)
+        summary.start()
+
+        self.control.reset_view()
+
+    #-------------------------------------------------------------------------
+    #  Returns the title of a column of the displayed array:
+    #-------------------------------------------------------------------------
+
+    def column_title(self, column):
+        """ Returns the title of a column of the displayed array.
+        """
+        return column_title(self.factory.titles, self.summary.array.shape[1],
+                            column)
+
+    #-- Private Methods ------------------------------------------------------
+
+    def _set_summary(self, summary):
+        """ Replaces the pyramid of reductions, abandoning any computation of
+            the previous one.
+        """
+        old = self.summary
+        if old is not None:
+            old.cancel()
+            old.on_trait_change(self._summary_updated, 'updated',
+                                remove=True)
+
+        self.summary = summary
+        if summary is not None:
+            summary.on_trait_change(self._summary_updated, 'updated',
+                                    dispatch='ui')
+
+    def _summary_updated(self):
+        """ Handles the pyramid of reductions becoming available.
+        """
+        if self.control is not None:
+            self.control.update()
+
+#-------------------------------------------------------------------------
+#  '_ArraySummaryWidget' class:
+#-------------------------------------------------------------------------
+
+
+class _ArraySummaryWidget(QtGui.QWidget):
+    """ The widget used by the _ArraySummaryEditor. The wheel zooms around the
+        mouse position, dragging pans and double clicking resets the view.
+    """
+
+    # The size (in pixels) at and above which exact values are displayed:
+    CELL_SIZE = 48
+
+    # The factor by which each step of the mouse wheel zooms:
+    ZOOM_STEP = 1.25
+
+    def __init__(self, editor):
+        """ Initialise the object.
+        """
+        QtGui.QWidget.__init__(self)
+
+        self._editor = editor
+        self._font = QtGui.QFont(editor.factory.font)
+        self._scale = None
+        self._origin = (0.0, 0.0)
+        self._drag = None
+
+        self.setMouseTracking(True)
+        self.setMinimumSize(100, 100)
+
+    #-------------------------------------------------------------------------
+    #  _ArraySummaryWidget interface:
+    #-------------------------------------------------------------------------
+
+    def reset_view(self):
+        """ Displays the whole array.
+        """
+        self._scale = None
+        self._origin = (0.0, 0.0)
+        self.update()
+
+    #-------------------------------------------------------------------------
+    #  QWidget interface:
+    #-------------------------------------------------------------------------
+
+    def sizeHint(self):
+        """ Reimplemented to define a reasonable size hint.
+        """
+        return QtCore.QSize(400, 300)
+
+    def paintEvent(self, event):
+        """ Reimplemented to paint the overview of the array.
+        """
+        painter = QtGui.QPainter(self)
+        summary = self._editor.summary
+        if (summary is not None) and summary.failed:
+            painter.drawText(self.rect(), QtCore.Qt.AlignCenter,
+                             'The summary could not be computed')
+            return
+
+        if (summary is None) or (not summary.complete):
+            painter.drawText(self.rect(), QtCore.Qt.AlignCenter,
+                             'Computing summary...')
+            return
+
+        scale = self._current_scale()
+        if scale >= self.CELL_SIZE:
+            self._paint_cells(painter, summary, scale)
+        else:
+            self._paint_blocks(painter, summary, scale)
+
+    def wheelEvent(self, event):
+        """ Reimplemented to zoom around the mouse position.
+        """
+        summary = self._editor.summary
+        if (summary is None) or (not summary.complete):
+            return
+
+        scale = self._current_scale()
+        new_scale = scale * (self.ZOOM_STEP ** (event.delta() / 120.0))
+        new_scale = max(self._fit_scale(),
+                        min(new_scale, 4 * self.CELL_SIZE))
+
+        # Keep the element under the mouse at the same position:
+        pos = event.pos()
+        row, column = self._origin
+        row += pos.y() / scale
+        column += pos.x() / scale
+        self._scale = new_scale
+        self._set_origin(row - pos.y() / new_scale,
+                         column - pos.x() / new_scale)
+        event.accept()
+
+    def mousePressEvent(self, event):
+        """ Reimplemented to start panning.
+        """
+        if event.button() == QtCore.Qt.LeftButton:
+            self._drag = (event.pos(), self._origin)
+
+    def mouseMoveEvent(self, event):
+        """ Reimplemented to pan the view.
+        """
+        if self._drag is not None:
+            pos, (row, column) = self._drag
+            scale = self._current_scale()
+            delta = event.pos() - pos
+            self._set_origin(row - delta.y() / scale,
+                             column - delta.x() / scale)
+
+    def mouseReleaseEvent(self, event):
+        """ Reimplemented to stop panning.
+        """
+        self._drag = None
+
+    def mouseDoubleClickEvent(self, event):
+        """ Reimplemented to display the whole array.
+        """
+        self.reset_view()
+
+    def event(self, event):
+        """ Reimplemented to describe the data under the mouse in a tooltip.
+        """
+        if event.type() == QtCore.QEvent.ToolTip:
+            text = self._describe(event.pos())
+            if text:
+                QtGui.QToolTip.showText(event.globalPos(), text, self)
+            else:
+                QtGui.QToolTip.hideText()
+            return True
+
+        return QtGui.QWidget.event(self, event)
+
+    #-------------------------------------------------------------------------
+    #  Private methods:
+    #-------------------------------------------------------------------------
+
+    def _fit_scale(self):
+        """ Returns the scale (in pixels per element) that fits the whole
+            array in the widget.
+        """
+        rows, columns = self._editor.summary.array.shape
+        return min(self.width() / float(max(columns, 1)),
+                   self.height() / float(max(rows, 1)))
+
+    def _current_scale(self):
+        """ Returns the current scale (in pixels per element).
+        """
+        if self._scale is None:
+            return self._fit_scale()
+
+        return self._scale
+
+    def _set_origin(self, row, column):
+        """ Sets the element displayed at the top left of the widget, keeping
+            the array in view.
+        """
+        rows, columns = self._editor.summary.array.shape
+        scale = self._current_scale()
+        row = max(0.0, min(row, rows - self.height() / scale))
+        column = max(0.0, min(column, columns - self.width() / scale))
+        self._origin = (row, column)
+        self.update()
+
+    def _visible(self, scale, block=1):
+        """ Returns the slices of (level) rows and columns of the array blocks
+            of the specified size which are visible in the widget.
+        """
+        rows, columns = self._editor.summary.array.shape
+        row, column = self._origin
+        first_row = int(floor(row / block))
+        first_column = int(floor(column / block))
+        last_row = min(int(ceil((row + self.height() / scale) / block)),
+                       int(ceil(rows / float(block))))
+        last_column = min(int(ceil((column + self.width() / scale) / block)),
+                          int(ceil(columns / float(block))))
+        return (slice(first_row, last_row), slice(first_column, last_column))
+
+    def _rect_for(self, rows, columns, scale, block=1):
+        """ Returns the widget rectangle covered by the specified slices of
+            blocks of array elements.
+        """
+        row, column = self._origin
+        x = (columns.start * block - column) * scale
+        y = (rows.start * block - row) * scale
+        return QtCore.QRectF(x, y,
+                             (columns.stop - columns.start) * block * scale,
+                             (rows.stop - rows.start) * block * scale)
+
+    def _grays(self, values):
+        """ Returns the gray levels (0..255) of an array of values.
+        """
+        low, high = self._editor.summary.limits
+        span = (high - low) or 1.0
+        with np.errstate(invalid='ignore'):
+            grays = np.clip((values - low) * (255.0 / span), 0, 255)
+
+        return np.where(np.isnan(grays), 0, grays).astype(np.uint32)
+
+    def _paint_blocks(self, painter, summary, scale):
+        """ Paints the visible part of the level of the pyramid matching the
+            current scale as a heatmap.
+        """
+        level = summary.level_for(1.0 / scale)
+        block = 1 << level
+        rows, columns = self._visible(scale, block)
+        values = np.asarray(summary.get_level(level)[rows, columns],
+                            dtype=float)
+        if values.size == 0:
+            return
+
+        grays = self._grays(values)
+        argb = np.ascontiguousarray(0xff000000 | (grays << 16) |
+                                    (grays << 8) | grays, dtype=np.uint32)
+        height, width = argb.shape
+        image = QtGui.QImage(argb.tobytes(), width, height,
+                             QtGui.QImage.Format_RGB32).copy()
+        painter.drawImage(self._rect_for(rows, columns, scale, block), image)
+
+    def _paint_cells(self, painter, summary, scale):
+        """ Paints the exact values of the visible array elements.
+        """
+        rows, columns = self._visible(scale)
+        block = summary.array[rows, columns]
+        if block.size == 0:
+            return
+
+        grays = self._grays(np.asarray(block, dtype=float))
+        texts = format_block(self._editor.factory.format, block)
+        painter.setFont(self._font)
+        origin = self._rect_for(rows, columns, scale).topLeft()
+        for i, row_texts in enumerate(texts):
+            for j, text in enumerate(row_texts):
+                gray = int(grays[i, j])
+                rect = QtCore.QRectF(origin.x() + j * scale,
+                                     origin.y() + i * scale, scale, scale)
+                painter.fillRect(rect, QtGui.QColor(gray, gray, gray))
+                if gray < 128:
+                    painter.setPen(QtCore.Qt.white)
+                else:
+                    painter.setPen(QtCore.Qt.black)
+                painter.drawText(rect, QtCore.Qt.AlignCenter, text)
+
+    def _describe(self, pos):
+        """ Returns a description of the array data under a widget position.
+        """
+        editor = self._editor
+        summary = editor.summary
+        if (summary is None) or (not summary.complete):
+            return None
+
+        scale = self._current_scale()
+        origin_row, origin_column = self._origin
+        row = int(origin_row + pos.y() / scale)
+        column = int(origin_column + pos.x() / scale)
+        rows, columns = summary.array.shape
+        if (row >= rows) or (column >= columns):
+            return None
+
+        if scale >= 1.0:
+            value = format_block(editor.factory.format,
+                                 summary.array[row: row + 1,
+                                               column: column + 1])[0][0]
+            return 'Row %d, %s: %s' % (row, editor.column_title(column),
+                                       value)
+
+        level = summary.level_for(1.0 / scale)
+        block = 1 << level
+        row, column = row // block, column // block
+        value = summary.get_level(level)[row, column]
+        return 'Rows %d-%d, columns %d-%d: %s %g' % (
+            row * block, min((row + 1) * block, rows) - 1,
+            column * block, min((column + 1) * block, columns) - 1,
+            summary.statistic, value)
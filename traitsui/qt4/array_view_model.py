@@ -0,0 +1,196 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Defines the table model used by the ArrayViewEditor.
+
+    Unlike the generic TabularModel, which asks the adapter for every cell
+    (slicing the array once per cell), this model reads the displayed values
+    directly from the array buffer, one block of cells at a time, and formats
+    each block with a single vectorized operation.
+
+    Copied or dragged cells are also exported from the array buffer, as
+    tab-separated text and in the NumPy ``.npy`` format.
+"""
+
+#-------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------
+
+from collections import OrderedDict
+
+from pyface.qt import QtCore, QtGui
+
+from .tabular_model import TabularModel, alignment_map
+
+#-------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------
+
+# The number of rows and columns in a block of formatted cells:
+BLOCK_ROWS = 128
+BLOCK_COLUMNS = 32
+
+# The maximum number of formatted blocks kept in the cache:
+MAX_BLOCKS = 64
+
+# MIME type for exported cells in the NumPy .npy format:
+npy_mime_type = 'application/x-npy'
+
+#-------------------------------------------------------------------------
+#  'ArrayViewModel' class:
+#-------------------------------------------------------------------------
+
+
+class ArrayViewModel(TabularModel):
+    """ The model for the tabular view of a 1D or 2D array.
+    """
+
+    def __init__(self, editor, parent=None):
+        """ Initialise the object.
+        """
+        TabularModel.__init__(self, editor, parent)
+
+        # Cache of formatted blocks, keyed by (block row, block column):
+        self._blocks = OrderedDict()
+
+        # Cached per-view constants (created lazily):
+        self._font = None
+        self._alignment = None
+
+    #-------------------------------------------------------------------------
+    #  QAbstractItemModel interface:
+    #-------------------------------------------------------------------------
+
+    def data(self, mi, role):
+        """ Reimplemented to read values directly from the array buffer.
+        """
+        if role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
+            row = mi.row()
+            adapter = self._editor.adapter
+            column_id = adapter.column_map[mi.column()]
+            if column_id == 'index':
+                return str(row)
+
+            # A 1D array has a single column of values, shown in every column:
+            if not adapter.is_2d:
+                column_id = 0
+
+            return self._text_for(row, column_id)
+
+        elif role == QtCore.Qt.FontRole:
+            if self._font is None:
+                font = self._editor.adapter.font
+                if font is not None:
+                    self._font = QtGui.QFont(font)
+            return self._font
+
+        elif role == QtCore.Qt.TextAlignmentRole:
+            if self._alignment is None:
+                alignment = alignment_map.get(self._editor.adapter.alignment,
+                                              QtCore.Qt.AlignLeft)
+                self._alignment = int(alignment | QtCore.Qt.AlignVCenter)
+            return self._alignment
+
+        # The array view adapter defines no images, tooltips or colors:
+        return None
+
+    def rowCount(self, mi):
+        """ Reimplemented to return the number of rows.
+        """
+        editor = self._editor
+        adapter = editor.adapter
+        return adapter.get_array(editor.object, editor.name).shape[0]
+
+    def mimeData(self, indexes):
+        """ Reimplemented to add the exported cells in the NumPy .npy format.
+        """
+        import numpy as np
+
+        mime_data = TabularModel.mimeData(self, indexes)
+
+        editor = self._editor
+        rows = sorted(set([index.row() for index in indexes]))
+        columns = sorted(set([index.column() for index in indexes]))
+        array = editor.adapter.get_export_data(editor.object, editor.name,
+                                               rows, columns)
+        if array is not None:
+            stream = _ByteArrayStream()
+            try:
+                # Arrays are written in buffer-sized chunks by 'np.save':
+                np.save(stream, array, allow_pickle=False)
+            except ValueError:
+                # Object arrays cannot be saved without pickling:
+                pass
+            else:
+                mime_data.setData(npy_mime_type, stream.data)
+
+        return mime_data
+
+    def reset(self):
+        """ Reimplemented to discard any formatted blocks.
+        """
+        self.flush()
+        TabularModel.reset(self)
+
+    #-------------------------------------------------------------------------
+    #  ArrayViewModel interface:
+    #-------------------------------------------------------------------------
+
+    def flush(self):
+        """ Discards all cached formatted data.
+        """
+        self._blocks.clear()
+        self._font = self._alignment = None
+
+    #-------------------------------------------------------------------------
+    #  Private methods:
+    #-------------------------------------------------------------------------
+
+    def _text_for(self, row, column):
+        """ Returns the formatted text of the array value at display position
+            (*row*, *column*), formatting the block containing it if needed.
+        """
+        key = (row // BLOCK_ROWS, column // BLOCK_COLUMNS)
+        blocks = self._blocks
+        block = blocks.pop(key, None)
+        if block is None:
+            editor = self._editor
+            first_row = key[0] * BLOCK_ROWS
+            first_column = key[1] * BLOCK_COLUMNS
+            block = editor.adapter.get_text_block(
+                editor.object, editor.name,
+                slice(first_row, first_row + BLOCK_ROWS),
+                slice(first_column, first_column + BLOCK_COLUMNS))
+            if len(blocks) >= MAX_BLOCKS:
+                blocks.popitem(last=False)
+
+        # Re-insert the block to mark it as the most recently used one:
+        blocks[key] = block
+
+        return block[row % BLOCK_ROWS][column % BLOCK_COLUMNS]
+
+#-------------------------------------------------------------------------
+#  '_ByteArrayStream' class:
+#-------------------------------------------------------------------------
+
+
+class _ByteArrayStream(object):
+    """ A write-only file-like object appending to a QByteArray.
+    """
+
+    def __init__(self):
+        self.data = QtCore.QByteArray()
+
+    def write(self, data):
+        self.data.append(data)
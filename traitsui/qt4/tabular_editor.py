@@ -131,6 +131,9 @@ class TabularEditor(Editor):
 
     widget_factory = Callable(lambda *args, **kwds: _TableView(*args, **kwds))
 
+    model_factory = Callable(
+        lambda *args, **kwds: TabularModel(*args, **kwds))
+
     #-------------------------------------------------------------------------
     #  Editor interface:
     #-------------------------------------------------------------------------
@@ -141,7 +144,7 @@ class TabularEditor(Editor):
         """
         factory = self.factory
         adapter = self.adapter = factory.adapter
-        self.model = TabularModel(editor=self)
+        self.model = self.model_factory(editor=self)
 
         # Create the control
         control = self.control = self.widget_factory(self)
@@ -677,7 +680,7 @@ class _TableView(QtGui.QTableView):
         self.setDropIndicatorShown(True)
 
     def keyPressEvent(self, event):
-        """ Reimplemented to support edit, insert, and delete by keyboard.
+        """ Reimplemented to support edit, insert, delete and copy by keyboard.
         """
         editor = self._editor
         factory = editor.factory
@@ -721,6 +724,18 @@ class _TableView(QtGui.QTableView):
             editor.model.insertRow(row)
             self.setCurrentIndex(editor.model.index(row, 0))
 
+        elif event.matches(QtGui.QKeySequence.Copy):
+            # Copy the selected cells if the adapter can export them as text:
+            indexes = self.selectionModel().selectedIndexes()
+            if len(indexes) > 0:
+                mime_data = self.model().mimeData(indexes)
+                if mime_data.hasText():
+                    event.accept()
+                    QtGui.QApplication.clipboard().setMimeData(mime_data)
+                    return
+
+            QtGui.QTableView.keyPressEvent(self, event)
+
         else:
             QtGui.QTableView.keyPressEvent(self, event)
 
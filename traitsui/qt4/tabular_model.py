@@ -43,6 +43,9 @@ alignment_map = {
 # MIME type for internal table drag/drop operations
 tabular_mime_type = 'traits-ui-tabular-editor'
 
+# MIME type for the text of exported cells
+text_mime_type = 'text/plain'
+
 #-------------------------------------------------------------------------
 #  'TabularModel' class:
 #-------------------------------------------------------------------------
@@ -260,11 +263,23 @@ class TabularModel(QtCore.QAbstractTableModel):
         """ Reimplemented to generate MIME data containing the rows of the
             current selection.
         """
+        editor = self._editor
+        object, name, adapter = editor.object, editor.name, editor.adapter
         rows = sorted(set([index.row() for index in indexes]))
-        items = [self._editor.adapter.get_drag(
-            self._editor.object, self._editor.name, row)
-            for row in rows]
+        items = [adapter.get_drag(object, name, row) for row in rows]
         mime_data = PyMimeData.coerce(items)
+
+        # Add the text of the selected cells if the adapter can export it:
+        columns = sorted(set([index.column() for index in indexes]))
+        chunks = adapter.get_export_text(object, name, rows, columns)
+        if chunks is not None:
+            text = QtCore.QByteArray()
+            for chunk in chunks:
+                if not isinstance(chunk, bytes):
+                    chunk = chunk.encode('utf-8')
+                text.append(chunk)
+            mime_data.setData(text_mime_type, text)
+
         data = QtCore.QByteArray(str(id(self)))
         for row in rows:
             data.append(' %i' % row)
@@ -438,6 +438,38 @@ class GUIToolkit(Toolkit):
                 # so we need to do the delete after the handler has returned.
                 w.deleteLater()
 
+    #-------------------------------------------------------------------------
+    #  Calls a function from the GUI toolkit event loop:
+    #-------------------------------------------------------------------------
+
+    def invoke_later(self, delay, callable, *args, **kw_args):
+        """ Calls a function from the GUI toolkit event loop after a specified
+            delay (in seconds), or at the next event loop iteration if the
+            delay is 0.
+        """
+        QtCore.QTimer.singleShot(int(1000.0 * delay),
+                                 lambda: callable(*args, **kw_args))
+
+    #-------------------------------------------------------------------------
+    #  Suspends/Resumes the updating of a specified GUI toolkit control:
+    #-------------------------------------------------------------------------
+
+    def suspend_updates(self, control):
+        """ Suspends the updating (painting and layout) of a specified GUI
+            toolkit control.
+        """
+        if control is not None:
+            control.setUpdatesEnabled(False)
+
+    def resume_updates(self, control):
+        """ Resumes the updating of a specified GUI toolkit control.
+        """
+        if control is not None:
+            control.setUpdatesEnabled(True)
+            layout = control.layout()
+            if layout is not None:
+                layout.activate()
+
     #-------------------------------------------------------------------------
     #  Returns a ( width, height ) tuple containing the size of a specified
     #  toolkit image:
@@ -20,13 +20,17 @@
 import copy
 import collections
 import logging
+from contextlib import contextmanager
 
 from pyface.qt import QtCore, QtGui
 
 from pyface.resource_manager import resource_manager
 from pyface.timer.api import do_later
-from traits.api import Any, Event
+from traits.api import Any, Event, Str
 from traitsui.api import TreeNode, ObjectTreeNode, MultiTreeNode
+from traitsui.editors.tree_editor import (TreeChildrenLoader, TreeLabelIndex,
+                                          TreeNodeCache)
+from traitsui.helper import compile_expression
 from traitsui.undo import ListUndoItem
 from traitsui.tree_node import ITreeNodeAdapterBridge
 from traitsui.menu import Menu, Action, Separator
@@ -37,6 +41,10 @@ from helper import pixmap_cache
 
 logger = logging.getLogger(__name__)
 
+# The number of children loaded in the background which are inserted into the
+# tree at a time:
+LOAD_BATCH_SIZE = 256
+
 #-------------------------------------------------------------------------
 #  The core tree node menu actions:
 #-------------------------------------------------------------------------
@@ -97,6 +105,9 @@ class SimpleEditor(Editor):
     # The vent fired when the application wants to refresh the viewport.
     refresh = Event
 
+    # The text used to filter the tree nodes:
+    filter_text = Str
+
     #-------------------------------------------------------------------------
     #  Finishes initializing the editor by creating the underlying toolkit widget
     #-------------------------------------------------------------------------
@@ -109,6 +120,30 @@ class SimpleEditor(Editor):
 
         self._editor = None
 
+        # The delegate drawing word wrapped labels (if any):
+        self._delegate = None
+
+        # Cache of the nodes handling each class of objects:
+        self._node_cache = TreeNodeCache(factory)
+
+        # The background loader of the children of asynchronous nodes, and
+        # the nodes whose children it is loading (keyed by node id):
+        self._loader = TreeChildrenLoader()
+        self._loader.on_trait_change(self._children_loaded, 'loaded',
+                                     dispatch='ui')
+        self._loads = {}
+
+        # The index of the node labels used to filter the tree (if any), and
+        # the nodes hidden by the filter:
+        self._index = None
+        self._hidden = []
+        if factory.filter != '':
+            self._index = TreeLabelIndex(node_for=self._node_for,
+                                         listener=self._index_listener,
+                                         mode=factory.filter_mode)
+            self._index.on_trait_change(self._apply_filter, 'updated',
+                                        dispatch='ui')
+
         if factory.editable:
 
             # Check to see if the tree view is based on a shared trait editor:
@@ -160,10 +195,10 @@ class SimpleEditor(Editor):
                     self._editor = editor.control
 
                 # Finally, create only the tree control:
-                self.control = self._tree = _TreeWidget(self)
+                self.control = self._tree = self._create_tree()
             else:
                 # If editable, create a tree control and an editor panel:
-                self._tree = _TreeWidget(self)
+                self._tree = self._create_tree()
 
                 self._editor = sa = QtGui.QScrollArea()
                 sa.setFrameShape(QtGui.QFrame.NoFrame)
@@ -182,11 +217,16 @@ class SimpleEditor(Editor):
                 splitter.addWidget(sa)
         else:
             # Otherwise, just create the tree control:
-            self.control = self._tree = _TreeWidget(self)
+            self.control = self._tree = self._create_tree()
 
-        # Set up the mapping between objects and tree id's:
+        # Set up the mapping between objects and tree id's (each object id is
+        # mapped to an ordered mapping from node ids to (name, nid) tuples):
         self._map = {}
 
+        # The number of (visible) nodes listening to the changes of each
+        # object, keyed by the object id:
+        self._listeners = {}
+
         # Initialize the 'undo state' stack:
         self._undoable = []
 
@@ -197,6 +237,26 @@ class SimpleEditor(Editor):
         self.sync_value(factory.click, 'click', 'to')
         self.sync_value(factory.dclick, 'dclick', 'to')
         self.sync_value(factory.veto, 'veto', 'from')
+        self.sync_value(factory.filter, 'filter_text', 'from')
+
+    #-------------------------------------------------------------------------
+    #  Creates the tree control:
+    #-------------------------------------------------------------------------
+
+    def _create_tree(self):
+        """ Creates the tree control.
+        """
+        tree = _TreeWidget(self)
+
+        # Word wrapped labels are drawn by a single delegate, which discards
+        # its cached label layouts when a column is resized:
+        if self.factory.word_wrap:
+            self._delegate = delegate = self.ItemDelegate(self, tree)
+            tree.setItemDelegate(delegate)
+            tree.header().sectionResized.connect(
+                lambda *args: delegate.invalidate())
+
+        return tree
 
     #-------------------------------------------------------------------------
     #  Handles the 'selection' trait being changed:
@@ -248,6 +308,15 @@ class SimpleEditor(Editor):
         """
         self._tree.viewport().update()
 
+    #-------------------------------------------------------------------------
+    #  Handles the 'filter_text' trait being changed:
+    #-------------------------------------------------------------------------
+
+    def _filter_text_changed(self):
+        """ Filters the tree nodes using the new text.
+        """
+        self._apply_filter()
+
     #-------------------------------------------------------------------------
     #  Disposes of the contents of an editor:
     #-------------------------------------------------------------------------
@@ -263,6 +332,16 @@ class SimpleEditor(Editor):
 
             self._tree = None
 
+        self._node_cache.dispose()
+        self._loader.on_trait_change(self._children_loaded, 'loaded',
+                                     remove=True)
+        self._loader.dispose()
+
+        if self._index is not None:
+            self._index.on_trait_change(self._apply_filter, 'updated',
+                                        remove=True)
+            self._index.dispose()
+
         super(SimpleEditor, self).dispose()
 
     #-------------------------------------------------------------------------
@@ -277,6 +356,7 @@ class SimpleEditor(Editor):
             if self._has_children(node, object):
                 self._expand_node(nid)
                 if expand:
+                    self._open_node(nid)
                     nid.setExpanded(True)
                 for cnid in self._nodes_for(nid):
                     self.expand_levels(cnid, levels - 1)
@@ -304,8 +384,17 @@ class SimpleEditor(Editor):
         if old_nid:
             self._delete_node(old_nid)
 
+        # Release the listeners of the objects of the previous tree:
+        if self._index is not None:
+            self._index.reset(None, None)
+
         tree.clear()
         self._map = {}
+        self._listeners = {}
+        self._hidden = []
+        root = tree.invisibleRootItem()
+        root._listened = False
+        root._visible = root._open = True
 
         object, node = self._node_for(self.value)
         if node is not None:
@@ -314,16 +403,23 @@ class SimpleEditor(Editor):
             else:
                 nid = self._create_item(tree, node, object)
 
-            self._map[id(object)] = [(node.get_children_id(object), nid)]
-            self._add_listeners(node, object)
             self._set_node_data(nid, (False, node, object))
+            self._map_node(nid)
+            # The root node is always visible:
+            self._add_node_listeners(nid)
+            nid._visible = True
             if self.factory.hide_root or self._has_children(node, object):
                 self._expand_node(nid)
+                self._open_node(nid)
                 if not self.factory.hide_root:
                     nid.setExpanded(True)
                     tree.setCurrentItem(nid)
 
             self.expand_levels(nid, self.factory.auto_open, False)
+
+        # Index the labels of the new tree:
+        if self._index is not None:
+            self._index.reset(object, node)
         ncolumns = self._tree.columnCount()
         if ncolumns > 1:
             for i in range(ncolumns):
@@ -359,7 +455,12 @@ class SimpleEditor(Editor):
     #-------------------------------------------------------------------------
 
     class ItemDelegate(QtGui.QStyledItemDelegate):
-        """ A delegate class to draw wrapped text labels """
+        """ A delegate class to draw wrapped text labels.
+
+            A single delegate is installed on the tree. The wrapped layout of
+            each label is cached per item and available width, until the label
+            changes or a column is resized.
+        """
         # FIXME: sizeHint() should return the size required by the label,
         # which is dependent on the width available, which is different for
         # each item due to the nested tree structure. However the option.rect
@@ -367,36 +468,66 @@ class SimpleEditor(Editor):
         # hack sizeHintChanged is emitted in paint() and the size of drawn
         # text is returned, as paint() gets a valid option.rect argument.
 
-        def __init__(self, *args, **kwargs):
-            self.size_map = collections.defaultdict(
-                lambda: QtCore.QSize(1, 21))
-            QtGui.QStyledItemDelegate.__init__(self, *args, **kwargs)
+        # The size hint of items whose label has not been laid out yet:
+        default_size = QtCore.QSize(1, 21)
+
+        def __init__(self, editor, parent=None):
+            QtGui.QStyledItemDelegate.__init__(self, parent)
+            self.editor = editor
+
+            # Mapping from item ids to the (width, static text) of their
+            # wrapped label:
+            self._layouts = {}
+
+        def invalidate(self, item=None):
+            """ Discards the cached label layout of an item (or of all items
+                if none is specified).
+            """
+            if item is None:
+                self._layouts.clear()
+            else:
+                self._layouts.pop(id(item), None)
 
         def sizeHint(self, option, index):
             """ returns area taken by the text. """
-            return self.size_map[self.editor._tree.itemFromIndex(index)]
+            layout = self._layouts.get(
+                id(self.editor._tree.itemFromIndex(index)))
+            if layout is None:
+                return self.default_size
+
+            return layout[1].size().toSize()
 
         def paint(self, painter, option, index):
             """ Do the actual drawing of the text """
             # For icon and highlights during selection etc
             super(self.__class__, self).paint(painter, option, index)
 
-            item = self.editor._tree.itemFromIndex(index)
-            expanded, node, object = self.editor._get_node_data(item)
-            text = node.get_label(object)
             if self.editor.factory.show_icons:
                 iconwidth = 24  # FIXME: get width from actual
             else:
                 iconwidth = 0
-            rect = painter.drawText(option.rect.left() + iconwidth,
-                                    option.rect.top(),
-                                    option.rect.width() - iconwidth,
-                                    option.rect.height(),
-                                    QtCore.Qt.TextWordWrap, text)
-            # Need to set the appropriate sizeHint of the item.
-            if self.size_map[item] != rect.size():
-                self.size_map[item] = rect.size()
-                do_later(self.sizeHintChanged.emit, index)
+            width = option.rect.width() - iconwidth
+
+            item = self.editor._tree.itemFromIndex(index)
+            layout = self._layouts.get(id(item))
+            if (layout is None) or (layout[0] != width):
+                expanded, node, object = self.editor._get_node_data(item)
+                text = QtGui.QStaticText(node.get_label(object))
+                text.setTextFormat(QtCore.Qt.PlainText)
+                text.setTextWidth(width)
+                text.prepare(QtGui.QTransform(), option.font)
+                old_size = self.sizeHint(option, index)
+                self._layouts[id(item)] = layout = (width, text)
+
+                # Need to set the appropriate sizeHint of the item.
+                if old_size != text.size().toSize():
+                    do_later(self.sizeHintChanged.emit, index)
+
+            painter.save()
+            painter.setFont(option.font)
+            painter.drawStaticText(option.rect.left() + iconwidth,
+                                   option.rect.top(), layout[1])
+            painter.restore()
 
     #-------------------------------------------------------------------------
     #  Create a TreeWidgetItem as per word wrap policy and set icon,tooltip
@@ -406,17 +537,16 @@ class SimpleEditor(Editor):
         """ Create  a new TreeWidgetItem as per word_wrap policy.
 
         Index is the index of the new node in the parent:
-            None implies append the child to the end. """
-        if index is None:
+            None implies append the child to the end. A parent of None
+            creates an item which is not part of the tree yet. """
+        if nid is None:
+            cnid = QtGui.QTreeWidgetItem()
+        elif index is None:
             cnid = QtGui.QTreeWidgetItem(nid)
         else:
             cnid = QtGui.QTreeWidgetItem()
             nid.insertChild(index, cnid)
-        if self.factory.word_wrap:
-            item = self.ItemDelegate()
-            item.editor = self
-            self._tree.setItemDelegate(item)
-        else:
+        if not self.factory.word_wrap:
             cnid.setText(0, node.get_label(object))
         cnid.setIcon(0, self._get_icon(node, object))
         cnid.setToolTip(0, node.get_tooltip(object))
@@ -436,6 +566,10 @@ class SimpleEditor(Editor):
         if not self.factory.word_wrap or col != 0:
             expanded, node, object = self._get_node_data(nid)
             nid.setText(col, node.get_label(object))
+        elif self._delegate is not None:
+            # The wrapped label is laid out again when it is next painted:
+            self._delegate.invalidate(nid)
+            self._tree.update(self._tree.indexFromItem(nid))
 
     #-------------------------------------------------------------------------
     #  Appends a new node to the specified node:
@@ -454,28 +588,162 @@ class SimpleEditor(Editor):
         """ Inserts a new node before a specified index into the children of the
             specified node.
         """
+        return self._insert_nodes(nid, index, [(object, node)])[0]
 
-        cnid = self._create_item(nid, node, object, index)
+    #-------------------------------------------------------------------------
+    #  Inserts new nodes for a list of objects to the specified node:
+    #-------------------------------------------------------------------------
 
-        has_children = self._has_children(node, object)
-        self._set_node_data(cnid, (False, node, object))
-        self._map.setdefault(id(object), []).append(
-            (node.get_children_id(object), cnid))
-        self._add_listeners(node, object)
+    def _insert_nodes(self, nid, index, children):
+        """ Inserts new nodes for a list of (object, node) pairs before a
+            specified index (None implies appending them) into the children
+            of the specified node, and returns the new nodes.
+        """
+        items = []
+        auto_open = []
+        for object, node in children:
+            cnid = self._create_item(None, node, object)
+            self._set_node_data(cnid, (False, node, object))
+            self._map_node(cnid)
+            items.append(cnid)
+
+            # The children of asynchronous nodes are not requested before the
+            # nodes are expanded:
+            if self._is_async(node):
+                has_children = node.allows_children(object)
+            else:
+                has_children = self._has_children(node, object)
 
-        # Automatically expand the new node (if requested):
-        if has_children:
-            if node.can_auto_open(object):
-                cnid.setExpanded(True)
+            if has_children:
+                if node.can_auto_open(object):
+                    auto_open.append(cnid)
+                else:
+                    # Qt only draws the control that expands the tree if there
+                    # is a child.  As the tree is being populated lazily we
+                    # create a dummy that will be removed when the node is
+                    # expanded for the first time.
+                    cnid._dummy = QtGui.QTreeWidgetItem(cnid)
+
+        if index is None:
+            index = nid.childCount()
+        nid.insertChildren(index, items)
+
+        self._show_nodes(nid, items)
+
+        # Automatically expand the new nodes (if requested):
+        for cnid in auto_open:
+            cnid.setExpanded(True)
+
+        # Return the newly created nodes:
+        return items
+
+    #-------------------------------------------------------------------------
+    #  Replaces the child nodes of the specified node:
+    #-------------------------------------------------------------------------
+
+    def _replace_nodes(self, nid, children):
+        """ Replaces the child nodes of the specified (expanded) node with the
+            nodes for a new list of child objects.
+
+            The nodes of the children which are still present (by identity)
+            are reused, together with their expansion state and listeners.
+        """
+        old_nids = self._nodes_for(nid)
+
+        # Map the id of each current child object to its nodes:
+        available = {}
+        for cnid in reversed(old_nids):
+            object = self._get_node_data(cnid)[2]
+            available.setdefault(id(object), []).append(cnid)
+
+        # The new child nodes, where the nodes to create are represented by
+        # (object, node) pairs:
+        new_nids = []
+        reused = set()
+        for child in children:
+            child, child_node = self._node_for(child)
+            if child_node is None:
+                continue
+
+            cnids = available.get(id(child))
+            if cnids and (self._get_node_data(cnids[-1])[1] is child_node):
+                cnid = cnids.pop()
+                reused.add(id(cnid))
+                new_nids.append(cnid)
             else:
-                # Qt only draws the control that expands the tree if there is a
-                # child.  As the tree is being populated lazily we create a
-                # dummy that will be removed when the node is expanded for the
-                # first time.
-                cnid._dummy = QtGui.QTreeWidgetItem(cnid)
+                new_nids.append((child, child_node))
+
+        kept = [onid for onid in old_nids if id(onid) in reused]
+        moved = [nnid for nnid in new_nids if id(nnid) in reused]
+        if all(cnid is mnid for cnid, mnid in zip(kept, moved)):
+            # The reused nodes keep their relative order, so just delete the
+            # obsolete nodes and insert each run of new ones in place:
+            for index in range(len(old_nids) - 1, -1, -1):
+                if id(old_nids[index]) not in reused:
+                    self._forget_node(old_nids[index])
+                    nid.takeChild(index)
+
+            index = 0
+            while index < len(new_nids):
+                end = index
+                while (end < len(new_nids)) and (id(new_nids[end])
+                                                 not in reused):
+                    end += 1
+                if end > index:
+                    self._insert_nodes(nid, index, new_nids[index: end])
+                index = end + 1
+        else:
+            # Otherwise, take all child nodes out of the tree and put them
+            # back in their new order, restoring the expanded ones:
+            expanded = self._expanded_nodes(kept)
+            for cnid in old_nids:
+                if id(cnid) not in reused:
+                    self._forget_node(cnid)
+            nid.takeChildren()
+
+            index = 0
+            for cnid in new_nids:
+                if id(cnid) in reused:
+                    nid.insertChild(index, cnid)
+                else:
+                    self._insert_nodes(nid, index, [cnid])
+                index += 1
 
-        # Return the newly created node:
-        return cnid
+            for cnid in expanded:
+                cnid.setExpanded(True)
+
+    #-------------------------------------------------------------------------
+    #  Returns the expanded nodes of a list of nodes and their children:
+    #-------------------------------------------------------------------------
+
+    def _expanded_nodes(self, nids):
+        """ Returns the expanded nodes among a list of nodes and their
+            (visible) children, parents first.
+        """
+        result = []
+        for nid in nids:
+            if nid.isExpanded():
+                result.append(nid)
+                result.extend(self._expanded_nodes(self._nodes_for(nid)))
+
+        return result
+
+    #-------------------------------------------------------------------------
+    #  Suspends the updates of the tree control:
+    #-------------------------------------------------------------------------
+
+    @contextmanager
+    def _updates_suspended(self):
+        """ Suspends the repainting of the tree control while a batch of
+            structural changes is applied.
+        """
+        tree = self._tree
+        enabled = tree.updatesEnabled()
+        tree.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            tree.setUpdatesEnabled(enabled)
 
     #-------------------------------------------------------------------------
     #  Deletes a specified tree node and all its children:
@@ -484,10 +752,6 @@ class SimpleEditor(Editor):
     def _delete_node(self, nid):
         """ Deletes a specified tree node and all its children.
         """
-
-        for cnid in self._nodes_for(nid):
-            self._delete_node(cnid)
-
         # See if it is a dummy.
         pnid = nid.parent()
         if pnid is not None and getattr(pnid, '_dummy', None) is nid:
@@ -495,33 +759,98 @@ class SimpleEditor(Editor):
             del pnid._dummy
             return
 
+        self._forget_node(nid)
+
+        if pnid is not None:
+            pnid.takeChild(pnid.indexOfChild(nid))
+        else:
+            index = self._tree.indexOfTopLevelItem(nid)
+            if index >= 0:
+                self._tree.takeTopLevelItem(index)
+            else:
+                # The invisible root item is never deleted, only its children:
+                nid.takeChildren()
+
+    #-------------------------------------------------------------------------
+    #  Deletes the child nodes of a specified node within an index range:
+    #-------------------------------------------------------------------------
+
+    def _delete_nodes(self, nid, start, end):
+        """ Deletes the child nodes of a specified node between a specified
+            start and end index (and all of their children).
+        """
+        count = nid.childCount()
+        end = min(end, count)
+        if (start == 0) and (end == count):
+            for cnid in self._nodes_for(nid):
+                self._forget_node(cnid)
+            nid.takeChildren()
+        else:
+            # Take the children from the end of the range, so that the
+            # indices of the remaining ones do not have to be searched for:
+            for index in range(end - 1, start - 1, -1):
+                self._forget_node(nid.child(index))
+                nid.takeChild(index)
+
+    #-------------------------------------------------------------------------
+    #  Forgets a specified tree node and all its children:
+    #-------------------------------------------------------------------------
+
+    def _forget_node(self, nid):
+        """ Removes the object mappings and listeners of a specified node and
+            all its children, before the node is removed from the tree.
+        """
+        for cnid in self._nodes_for(nid):
+            self._forget_node(cnid)
+
+        self._unmap_node(nid)
+
+    #-------------------------------------------------------------------------
+    #  Maps/unmaps the object of a specified node:
+    #-------------------------------------------------------------------------
+
+    def _map_node(self, nid):
+        """ Records that a specified node shows its object.
+
+            The event listeners for the object are only added once the node is
+            visible (see '_add_node_listeners').
+        """
+        expanded, node, object = self._get_node_data(nid)
+        nids = self._map.get(id(object))
+        if nids is None:
+            # The nodes showing an object are keyed by their id, as
+            # QTreeWidgetItem does not have an equal operator:
+            self._map[id(object)] = nids = collections.OrderedDict()
+        nids[id(nid)] = (node.get_children_id(object), nid)
+
+    def _unmap_node(self, nid):
+        """ Removes a specified node from the nodes showing its object, and
+            removes the event listeners of the node.
+        """
         try:
             expanded, node, object = self._get_node_data(nid)
         except AttributeError:
-            # The node has already been deleted.
-            pass
-        else:
-            id_object = id(object)
-            object_info = self._map[id_object]
-            for i, info in enumerate(object_info):
-                # QTreeWidgetItem does not have an equal operator, so use id()
-                if id(nid) == id(info[1]):
-                    del object_info[i]
-                    break
+            # The node is a dummy, or has already been deleted.
+            return
 
-            if len(object_info) == 0:
-                self._remove_listeners(node, object)
-                del self._map[id_object]
+        self._remove_node_listeners(nid)
 
-        if pnid is None:
-            self._tree.takeTopLevelItem(self._tree.indexOfTopLevelItem(nid))
-        else:
-            pnid.removeChild(nid)
+        if self._delegate is not None:
+            self._delegate.invalidate(nid)
+
+        # Stop loading or inserting the children of the node:
+        if self._loads.pop(id(nid), None) is not None:
+            self._loader.cancel(id(nid))
+        nid._loaded = None
+
+        id_object = id(object)
+        nids = self._map.get(id_object)
+        if (nids is not None) and (nids.pop(id(nid), None) is not None):
+            if len(nids) == 0:
+                del self._map[id_object]
 
         # If the deleted node had an active editor panel showing, remove it:
-        # Note: QTreeWidgetItem does not have an equal operator, so use id()
-        if (self._editor is not None) and (
-                id(nid) == id(self._editor._editor_nid)):
+        if (self._editor is not None) and (nid is self._editor._editor_nid):
             self._clear_editor()
 
     #-------------------------------------------------------------------------
@@ -535,20 +864,162 @@ class SimpleEditor(Editor):
 
         # Lazily populate the item's children:
         if not expanded:
+            # Slow children are loaded in the background:
+            if self._is_async(node):
+                self._load_children(nid)
+                return
+
             # Remove any dummy node.
             dummy = getattr(nid, '_dummy', None)
             if dummy is not None:
                 nid.removeChild(dummy)
                 del nid._dummy
 
-            for child in node.get_children(object):
-                child, child_node = self._node_for(child)
-                if child_node is not None:
-                    self._append_node(nid, child_node, child)
+            children = [self._node_for(child)
+                        for child in node.get_children(object)]
+            self._insert_nodes(nid, None,
+                               [(child, child_node)
+                                for child, child_node in children
+                                if child_node is not None])
 
             # Indicate the item is now populated:
             self._set_node_data(nid, (True, node, object))
 
+    #-------------------------------------------------------------------------
+    #  Asynchronous children loading:
+    #-------------------------------------------------------------------------
+
+    def _is_async(self, node):
+        """ Returns whether the children of a node are loaded in the
+            background.
+        """
+        return (self.factory.async_children or
+                getattr(node, 'async_children', False))
+
+    def _load_children(self, nid):
+        """ Requests the children of a specified node from the background
+            loader. A placeholder item is shown until the children of a node
+            which has not been populated yet are available.
+        """
+        expanded, node, object = self._get_node_data(nid)
+        if (not expanded) and (getattr(nid, '_placeholder', None) is None):
+            dummy = getattr(nid, '_dummy', None)
+            if dummy is not None:
+                nid.removeChild(dummy)
+                del nid._dummy
+
+            placeholder = QtGui.QTreeWidgetItem(nid)
+            placeholder.setText(0, self.factory.loading_label)
+            placeholder.setFlags(QtCore.Qt.NoItemFlags)
+            nid._placeholder = placeholder
+
+        self._loads[id(nid)] = nid
+        self._loader.load(id(nid), node, object)
+
+    def _cancel_load(self, nid):
+        """ Cancels the loading of the children of a specified node (if any),
+            returning the node to its unpopulated state.
+        """
+        if self._loads.pop(id(nid), None) is None:
+            return
+
+        self._loader.cancel(id(nid))
+        placeholder = getattr(nid, '_placeholder', None)
+        if placeholder is not None:
+            nid.removeChild(placeholder)
+            del nid._placeholder
+            nid._dummy = QtGui.QTreeWidgetItem(nid)
+
+    def _children_loaded(self, result):
+        """ Handles the children of a node having been loaded in the
+            background (on the UI thread).
+        """
+        key, children = result
+        nid = self._loads.pop(key, None)
+        if (nid is None) or (self._tree is None):
+            return
+
+        expanded, node, object = self._get_node_data(nid)
+        if expanded:
+            # The children of a populated node have been refreshed:
+            with self._updates_suspended():
+                self._replace_nodes(nid, children)
+            return
+
+        nid.removeChild(nid._placeholder)
+        del nid._placeholder
+        self._set_node_data(nid, (True, node, object))
+        nid._loaded = children
+        self._insert_loaded(nid, children)
+
+    def _insert_loaded(self, nid, children):
+        """ Inserts the nodes for the next batch of the children loaded for a
+            specified node, and schedules the insertion of the following one.
+        """
+        if (self._tree is None) or (getattr(nid, '_loaded', None) is not
+                                    children):
+            # The node has been deleted or its children have been replaced:
+            return
+
+        batch = [self._node_for(child)
+                 for child in children[:LOAD_BATCH_SIZE]]
+        del children[:LOAD_BATCH_SIZE]
+        with self._updates_suspended():
+            self._insert_nodes(nid, None,
+                               [(child, child_node)
+                                for child, child_node in batch
+                                if child_node is not None])
+
+        if len(children) > 0:
+            do_later(self._insert_loaded, nid, children)
+        else:
+            nid._loaded = None
+            if self.filter_text != '':
+                self._apply_filter()
+
+    #-------------------------------------------------------------------------
+    #  Filters the tree nodes:
+    #-------------------------------------------------------------------------
+
+    def _apply_filter(self):
+        """ Shows only the nodes whose label matches the filter text, and
+            their ancestors (which are expanded), or all nodes if there is no
+            filter text.
+        """
+        if (self._tree is None) or (self._index is None):
+            return
+
+        for nid in self._hidden:
+            nid.setHidden(False)
+        self._hidden = []
+
+        if self.filter_text != '':
+            matches, ancestors = self._index.match(self.filter_text)
+            with self._updates_suspended():
+                self._filter_node(self._tree.invisibleRootItem(), matches,
+                                  ancestors)
+
+    def _filter_node(self, nid, matches, ancestors):
+        """ Hides the children of a specified node which neither match the
+            filter text nor have a matching descendant, and expands (and
+            filters) the ones with a matching descendant.
+        """
+        for cnid in self._nodes_for(nid):
+            try:
+                expanded, node, object = self._get_node_data(cnid)
+            except AttributeError:
+                # Dummy and placeholder items are left alone.
+                continue
+
+            if id(object) in ancestors:
+                cnid.setHidden(False)
+                if not cnid.isExpanded():
+                    cnid.setExpanded(True)
+                self._filter_node(cnid, matches, ancestors)
+            elif id(object) not in matches:
+                cnid.setHidden(True)
+                self._hidden.append(cnid)
+
     #-------------------------------------------------------------------------
     #  Returns each of the child nodes of a specified node id:
     #-------------------------------------------------------------------------
@@ -570,14 +1041,14 @@ class SimpleEditor(Editor):
             if pnid is None:
                 return (None, None, None)
 
-        for i in range(pnid.childCount()):
-            if pnid.child(i) is nid:
-                _, pnode, pobject = self._get_node_data(pnid)
-                return (pnode, pobject, i)
-        else:
+        i = pnid.indexOfChild(nid)
+        if i < 0:
             # doesn't match any node, so return None
             return (None, None, None)
 
+        _, pnode, pobject = self._get_node_data(pnid)
+        return (pnode, pobject, i)
+
     #-------------------------------------------------------------------------
     #  Returns whether a specified object has any children:
     #-------------------------------------------------------------------------
@@ -655,7 +1126,201 @@ class SimpleEditor(Editor):
 
         node.when_label_changed(object, self._label_updated, True)
         node.when_column_labels_change(
-            object, self._column_labels_updated, False)
+            object, self._column_labels_updated, True)
+
+    #-------------------------------------------------------------------------
+    #  Adds/removes the event listeners of a specified node:
+    #-------------------------------------------------------------------------
+
+    def _add_node_listeners(self, nid):
+        """ Adds the event listeners for the object of a specified node, whose
+            parent is visible, unless the node already has them.
+
+            The children of a collapsed node are listened to as well, so that
+            its expand indicator stays up to date, the changes are logged for
+            undo, and the node can be expanded again without reloading its
+            children. The listeners of an object are shared by all of its
+            nodes, and are only removed once no node needs them anymore.
+        """
+        if getattr(nid, '_listened', False):
+            return
+
+        try:
+            expanded, node, object = self._get_node_data(nid)
+        except AttributeError:
+            # Dummy nodes do not have any listeners.
+            return
+
+        nid._listened = True
+        self._retain_listeners(node, object)
+
+        # Catch up with the changes made while the object was not listened to:
+        if getattr(nid, '_dirty', False):
+            nid._dirty = False
+            self._refresh_item(nid)
+
+    def _remove_node_listeners(self, nid):
+        """ Removes the event listeners of a specified node (if it has them).
+        """
+        if not getattr(nid, '_listened', False):
+            return
+
+        nid._listened = False
+        expanded, node, object = self._get_node_data(nid)
+        self._release_listeners(node, object)
+
+    def _retain_listeners(self, node, object):
+        """ Adds the event listeners for a specified object, unless they have
+            already been added for a node or the label index.
+        """
+        count = self._listeners.get(id(object), 0)
+        self._listeners[id(object)] = count + 1
+        if count == 0:
+            self._add_listeners(node, object)
+
+    def _release_listeners(self, node, object):
+        """ Removes the event listeners from a specified object once no node
+            (or the label index) needs them anymore.
+        """
+        count = self._listeners.pop(id(object)) - 1
+        if count > 0:
+            self._listeners[id(object)] = count
+        else:
+            self._remove_listeners(node, object)
+
+            # The nodes of the object miss any change made from now on, and
+            # are brought up to date once they are listened to again:
+            for children_id, nid in self._map.get(id(object), {}).values():
+                nid._dirty = True
+
+    def _index_listener(self, object, node, remove):
+        """ Handles an object being added to (or removed from) the label
+            index, whose label and children changes are then reported to the
+            index by the editor's own event listeners.
+        """
+        if remove:
+            self._release_listeners(node, object)
+        else:
+            self._retain_listeners(node, object)
+
+    #-------------------------------------------------------------------------
+    #  Temporarily listens to the changes of a specified object:
+    #-------------------------------------------------------------------------
+
+    @contextmanager
+    def _children_listened(self, node, object):
+        """ Makes sure the children changes of a specified object are handled
+            (and logged), even if none of its nodes is currently visible.
+        """
+        listened = id(object) in self._listeners
+        if not listened:
+            self._add_listeners(node, object)
+        try:
+            yield
+        finally:
+            if not listened:
+                self._remove_listeners(node, object)
+
+    #-------------------------------------------------------------------------
+    #  Opens/closes a specified node:
+    #-------------------------------------------------------------------------
+
+    def _open_node(self, nid):
+        """ Handles a populated node being expanded: shows its children (if
+            the node itself is visible).
+        """
+        if getattr(nid, '_open', False):
+            return
+
+        nid._open = True
+        if getattr(nid, '_visible', False):
+            for cnid in self._nodes_for(nid):
+                self._show_node(cnid)
+
+    def _close_node(self, nid):
+        """ Handles a node being collapsed: hides its children.
+        """
+        if not getattr(nid, '_open', False):
+            return
+
+        nid._open = False
+        if getattr(nid, '_visible', False):
+            for cnid in self._nodes_for(nid):
+                self._hide_node(cnid)
+
+    def _show_node(self, nid):
+        """ Makes a specified node visible: listens to its children, and shows
+            them as well if the node is expanded.
+        """
+        nid._visible = True
+        self._show_nodes(nid, self._nodes_for(nid))
+
+        if getattr(nid, '_open', False):
+            for cnid in self._nodes_for(nid):
+                self._show_node(cnid)
+
+    def _hide_node(self, nid):
+        """ Hides a specified node: stops listening to its children, and hides
+            them as well if the node is expanded.
+        """
+        nid._visible = False
+        for cnid in self._nodes_for(nid):
+            self._remove_node_listeners(cnid)
+
+            if getattr(nid, '_open', False):
+                self._hide_node(cnid)
+
+    def _show_nodes(self, nid, items):
+        """ Listens to a list of child nodes of a specified node if the node
+            is visible, and makes them visible if the node is expanded as well.
+        """
+        if getattr(nid, '_visible', False):
+            for cnid in items:
+                self._add_node_listeners(cnid)
+                cnid._visible = getattr(nid, '_open', False)
+
+    #-------------------------------------------------------------------------
+    #  Brings a node which was not listened to up to date:
+    #-------------------------------------------------------------------------
+
+    def _refresh_item(self, nid):
+        """ Brings the label, icon and children of a specified node, whose
+            object was not listened to for a while, up to date.
+        """
+        expanded, node, object = self._get_node_data(nid)
+        self._set_label(nid, node.get_label(object), 0)
+        self._set_column_labels(nid, node.get_column_labels(object))
+        self._update_icon(nid)
+        if self._is_async(node):
+            if expanded:
+                self._load_children(nid)
+        elif expanded:
+            with self._updates_suspended():
+                self._replace_nodes(nid, node.get_children(object))
+        else:
+            self._update_dummy(nid, node.get_children(object))
+
+    #-------------------------------------------------------------------------
+    #  Updates the dummy child of a node that has not been populated yet:
+    #-------------------------------------------------------------------------
+
+    def _update_dummy(self, nid, children):
+        """ Adds or removes the dummy child of a node which has not been
+            populated yet, depending on whether its object has any children.
+        """
+        if getattr(nid, '_placeholder', None) is not None:
+            # The children are being loaded, so load them again:
+            self._load_children(nid)
+            return
+
+        dummy = getattr(nid, '_dummy', None)
+        if dummy is None and len(children) > 0:
+            # if model now has children add dummy child
+            nid._dummy = QtGui.QTreeWidgetItem(nid)
+        elif dummy is not None and len(children) == 0:
+            # if model no longer has children remove dummy child
+            nid.removeChild(dummy)
+            del nid._dummy
 
     #-------------------------------------------------------------------------
     #  Returns the tree node data for a specified object in the form
@@ -666,7 +1331,7 @@ class SimpleEditor(Editor):
         """ Returns the tree node data for a specified object in the form
             ( expanded, node, nid ).
         """
-        info = self._map[id(object)]
+        info = self._map[id(object)].values()
         for name2, nid in info:
             if name == name2:
                 break
@@ -682,7 +1347,7 @@ class SimpleEditor(Editor):
             form: [ ( expanded, node, nid ), ... ].
         """
         result = []
-        for name2, nid in self._map[id(object)]:
+        for name2, nid in self._map.get(id(object), {}).values():
             if name == name2:
                 expanded, node, ignore = self._get_node_data(nid)
                 result.append((expanded, node, nid))
@@ -700,14 +1365,19 @@ class SimpleEditor(Editor):
                 isinstance(object[1], TreeNode)):
             return object
 
+        # Use the node already resolved for the object's class (if any):
+        node_cache = self._node_cache
+        node = node_cache.get_node(object)
+        if node is not None:
+            return (object, node)
+
         # Select all nodes which understand this object:
         factory = self.factory
-        nodes = [node for node in factory.nodes
-                 if node.is_node_for(object)]
+        nodes = node_cache.nodes_for(object)
 
         # If only one found, we're done, return it:
         if len(nodes) == 1:
-            return (object, nodes[0])
+            return (object, node_cache.set_node(object, nodes[0]))
 
         # If none found, give up:
         if len(nodes) == 0:
@@ -716,11 +1386,11 @@ class SimpleEditor(Editor):
         # Use all selected nodes that have the same 'node_for' list as the
         # first selected node:
         base = nodes[0].node_for
-        nodes = [node for node in nodes if base == node.node_for]
+        nodes = [match for match in nodes if base == match.node_for]
 
         # If only one left, then return that node:
         if len(nodes) == 1:
-            return (object, nodes[0])
+            return (object, node_cache.set_node(object, nodes[0]))
 
         # Otherwise, return a MultiTreeNode based on all selected nodes...
 
@@ -738,14 +1408,15 @@ class SimpleEditor(Editor):
         # If we have a matching MultiTreeNode already cached, return it:
         key = (root_node, ) + tuple(nodes)
         if key in factory.multi_nodes:
-            return (object, factory.multi_nodes[key])
+            return (object, node_cache.set_node(object,
+                                                factory.multi_nodes[key]))
 
         # Otherwise create one, cache it, and return it:
         factory.multi_nodes[key] = multi_node = MultiTreeNode(
             root_node=root_node,
             nodes=nodes)
 
-        return (object, multi_node)
+        return (object, node_cache.set_node(object, multi_node))
 
     #-------------------------------------------------------------------------
     #  Returns the TreeNode associated with a specified class:
@@ -754,10 +1425,7 @@ class SimpleEditor(Editor):
     def _node_for_class(self, klass):
         """ Returns the TreeNode associated with a specified class.
         """
-        for node in self.factory.nodes:
-            if issubclass(klass, tuple(node.node_for)):
-                return node
-        return None
+        return self._node_cache.node_for_class(klass)
 
     #-------------------------------------------------------------------------
     #  Returns the node and class associated with a specified class name:
@@ -766,11 +1434,7 @@ class SimpleEditor(Editor):
     def _node_for_class_name(self, class_name):
         """ Returns the node and class associated with a specified class name.
         """
-        for node in self.factory.nodes:
-            for klass in node.node_for:
-                if class_name == klass.__name__:
-                    return (node, klass)
-        return (None, None)
+        return self._node_cache.node_for_class_name(class_name)
 
     #-------------------------------------------------------------------------
     #  Updates the icon for a specified node:
@@ -822,9 +1486,10 @@ class SimpleEditor(Editor):
         """
         try:
             self._begin_undo()
-            if make_copy:
-                data = copy.deepcopy(data)
-            node.append_child(object, data)
+            with self._children_listened(node, object):
+                if make_copy:
+                    data = copy.deepcopy(data)
+                node.append_child(object, data)
         finally:
             self._end_undo()
 
@@ -837,9 +1502,10 @@ class SimpleEditor(Editor):
         """
         try:
             self._begin_undo()
-            if make_copy:
-                data = copy.deepcopy(data)
-            node.insert_child(object, index, data)
+            with self._children_listened(node, object):
+                if make_copy:
+                    data = copy.deepcopy(data)
+                node.insert_child(object, index, data)
         finally:
             self._end_undo()
 
@@ -852,7 +1518,8 @@ class SimpleEditor(Editor):
         """
         try:
             self._begin_undo()
-            node.delete_child(object, index)
+            with self._children_listened(node, object):
+                node.delete_child(object, index)
         finally:
             self._end_undo()
 
@@ -866,6 +1533,7 @@ class SimpleEditor(Editor):
         info = self._map.get(id(object))
         if info is None:
             return None
+        info = info.values()
         for name2, nid in info:
             if name == name2:
                 return nid
@@ -963,6 +1631,9 @@ class SimpleEditor(Editor):
         # yet):
         self._expand_node(nid)
 
+        # Show the children of the node:
+        self._open_node(nid)
+
         self._update_icon(nid)
 
     #-------------------------------------------------------------------------
@@ -972,6 +1643,8 @@ class SimpleEditor(Editor):
     def _on_item_collapsed(self, nid):
         """ Handles a tree node being collapsed.
         """
+        self._cancel_load(nid)
+        self._close_node(nid)
         self._update_icon(nid)
 
     #-------------------------------------------------------------------------
@@ -1314,11 +1987,13 @@ class SimpleEditor(Editor):
         """ Returns whether the action should be defined in the user interface.
         """
         if action.defined_when != '':
-            if not eval(action.defined_when, globals(), self._context):
+            if not eval(compile_expression(action.defined_when), globals(),
+                        self._context):
                 return False
 
         if action.visible_when != '':
-            if not eval(action.visible_when, globals(), self._context):
+            if not eval(compile_expression(action.visible_when), globals(),
+                        self._context):
                 return False
 
         return True
@@ -1353,7 +2028,7 @@ class SimpleEditor(Editor):
             if method_name.find('(') < 0:
                 method_name += '()'
             try:
-                eval(method_name, globals(),
+                eval(compile_expression(method_name), globals(),
                      {'object': object,
                       'editor': self,
                       'node': node,
@@ -1387,7 +2062,8 @@ class SimpleEditor(Editor):
         if condition != '':
             value = True
             try:
-                if not eval(condition, globals(), self._context):
+                if not eval(compile_expression(condition), globals(),
+                            self._context):
                     value = False
             except Exception as e:
                 logger.warning(
@@ -1513,6 +2189,9 @@ class SimpleEditor(Editor):
     def _children_replaced(self, object, name='', new=None):
         """ Handles the children of a node being completely replaced.
         """
+        if self._index is not None:
+            self._index.children_changed(object)
+
         tree = self._tree
         for expanded, node, nid in self._object_info_for(object, name):
             children = node.get_children(object)
@@ -1520,24 +2199,13 @@ class SimpleEditor(Editor):
             # Only add/remove the changes if the node has already been
             # expanded:
             if expanded:
-                # Delete all current child nodes:
-                for cnid in self._nodes_for(nid):
-                    self._delete_node(cnid)
-
-                # Add all of the children back in as new nodes:
-                for child in children:
-                    child, child_node = self._node_for(child)
-                    if child_node is not None:
-                        self._append_node(nid, child_node, child)
+                # Replace the child nodes, reusing the ones of the children
+                # which are still there:
+                nid._loaded = None
+                with self._updates_suspended():
+                    self._replace_nodes(nid, children)
             else:
-                dummy = getattr(nid, '_dummy', None)
-                if dummy is None and len(children) > 0:
-                    # if model now has children add dummy child
-                    nid._dummy = QtGui.QTreeWidgetItem(nid)
-                elif dummy is not None and len(children) == 0:
-                    # if model no longer has children remove dummy child
-                    nid.removeChild(dummy)
-                    del nid._dummy
+                self._update_dummy(nid, children)
 
             # Try to expand the node (if requested):
             if node.can_auto_open(object):
@@ -1555,6 +2223,9 @@ class SimpleEditor(Editor):
         name = name[:-6]
         self.log_change(self._get_undo_item, object, name, event)
 
+        if self._index is not None:
+            self._index.children_changed(object)
+
         # Get information about the node that was changed:
         start = event.index
         n = len(event.added)
@@ -1571,31 +2242,25 @@ class SimpleEditor(Editor):
 
             # Only add/remove the changes if the node has already been
             # expanded:
-            if expanded:
-                # Remove all of the children that were deleted:
-                for cnid in self._nodes_for(nid)[start: end]:
-                    self._delete_node(cnid)
-
-                remaining = len(children) - len(event.removed)
-                child_index = 0
-                # Add all of the children that were added:
-                for child in event.added:
-                    child, child_node = self._node_for(child)
-                    if child_node is not None:
-                        insert_index = (start + child_index) if \
-                            (start <= remaining) else None
-                        self._insert_node(nid, insert_index, child_node,
-                                          child)
-                        child_index += 1
+            if getattr(nid, '_loaded', None) is not None:
+                # The loaded children are still being inserted, so replace
+                # them all:
+                nid._loaded = None
+                with self._updates_suspended():
+                    self._replace_nodes(nid, children)
+            elif expanded:
+                with self._updates_suspended():
+                    # Remove all of the children that were deleted:
+                    self._delete_nodes(nid, start, end)
+
+                    # Add all of the children that were added:
+                    added = [self._node_for(child) for child in event.added]
+                    self._insert_nodes(
+                        nid, min(start, nid.childCount()),
+                        [(child, child_node) for child, child_node in added
+                         if child_node is not None])
             else:
-                dummy = getattr(nid, '_dummy', None)
-                if dummy is None and len(children) > 0:
-                    # if model now has children add dummy child
-                    nid._dummy = QtGui.QTreeWidgetItem(nid)
-                elif dummy is not None and len(children) == 0:
-                    # if model no longer has children remove dummy child
-                    nid.removeChild(dummy)
-                    del nid._dummy
+                self._update_dummy(nid, children)
 
             # Try to expand the node (if requested):
             if node.can_auto_open(object):
@@ -1608,16 +2273,17 @@ class SimpleEditor(Editor):
     def _label_updated(self, object, name, label):
         """  Handles the label of an object being changed.
         """
+        if self._index is not None:
+            self._index.label_changed(object)
+
         # Prevent the itemChanged() signal from being emitted.
         blk = self._tree.blockSignals(True)
 
-        nids = {}
-        for name2, nid in self._map[id(object)]:
-            if nid not in nids:
-                nids[nid] = None
-                node = self._get_node_data(nid)[1]
-                self._set_label(nid, node.get_label(object), 0)
-                self._update_icon(nid)
+        # The object may only be listened to for the label index:
+        for name2, nid in self._map.get(id(object), {}).values():
+            node = self._get_node_data(nid)[1]
+            self._set_label(nid, node.get_label(object), 0)
+            self._update_icon(nid)
 
         self._tree.blockSignals(blk)
 
@@ -1627,14 +2293,11 @@ class SimpleEditor(Editor):
         # Prevent the itemChanged() signal from being emitted.
         blk = self._tree.blockSignals(True)
 
-        nids = {}
-        for name2, nid in self._map[id(object)]:
-            if nid not in nids:
-                nids[nid] = None
-                node = self._get_node_data(nid)[1]
-                # Just do all of them at once. The number of columns should be
-                # small.
-                self._set_column_labels(nid, node.get_column_labels(object))
+        for name2, nid in self._map.get(id(object), {}).values():
+            node = self._get_node_data(nid)[1]
+            # Just do all of them at once. The number of columns should be
+            # small.
+            self._set_column_labels(nid, node.get_column_labels(object))
 
         self._tree.blockSignals(blk)
 
@@ -1681,69 +2344,16 @@ class SimpleEditor(Editor):
 #-- End UI preference save/restore interface -----------------------------
 
 #-------------------------------------------------------------------------
-#  '_TreeWidget' class:
+#  '_TreeDragDrop' class:
 #-------------------------------------------------------------------------
 
 
-class _TreeWidget(QtGui.QTreeWidget):
-    """ The _TreeWidget class is a specialised QTreeWidget that reimplements
-        the drag'n'drop support so that it hooks into the provided Traits
-        support.
+class _TreeDragDrop(object):
+    """ Mixin class implementing the drag'n'drop support of the tree controls
+        in terms of the QTreeWidget item interface, so that it hooks into the
+        provided Traits support.
     """
 
-    def __init__(self, editor, parent=None):
-        """ Initialise the tree widget.
-        """
-        QtGui.QTreeWidget.__init__(self, parent)
-
-        self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
-        self.setDragEnabled(True)
-        self.setAcceptDrops(True)
-        self.setIconSize(QtCore.QSize(*editor.factory.icon_size))
-
-        # Set up headers if necessary.
-        column_count = len(editor.factory.column_headers)
-        if column_count > 0:
-            self.setHeaderHidden(False)
-            self.setColumnCount(column_count)
-            self.setHeaderLabels(editor.factory.column_headers)
-        else:
-            self.setHeaderHidden(True)
-
-        self.setAlternatingRowColors(editor.factory.alternating_row_colors)
-        padding = editor.factory.vertical_padding
-        if padding > 0:
-            self.setStyleSheet("""
-            QTreeView::item {
-                padding-top: %spx;
-                padding-bottom: %spx;
-            }
-            """ % (padding, padding))
-
-        if editor.factory.selection_mode == 'extended':
-            self.setSelectionMode(QtGui.QAbstractItemView.ExtendedSelection)
-
-        self.itemExpanded.connect(editor._on_item_expanded)
-        self.itemCollapsed.connect(editor._on_item_collapsed)
-        self.itemClicked.connect(editor._on_item_clicked)
-        self.itemDoubleClicked.connect(editor._on_item_dclicked)
-        self.itemActivated.connect(editor._on_item_activated)
-        self.itemSelectionChanged.connect(editor._on_tree_sel_changed)
-        self.customContextMenuRequested.connect(editor._on_context_menu)
-        self.itemChanged.connect(editor._on_nid_changed)
-
-        self._editor = editor
-        self._dragging = None
-
-    def resizeEvent(self, event):
-        """ Overridden to emit sizeHintChanged() of items for word wrapping """
-        if self._editor.factory.word_wrap:
-            for i in range(self.topLevelItemCount()):
-                mi = self.indexFromItem(self.topLevelItem(i))
-                id = self.itemDelegate(mi)
-                id.sizeHintChanged.emit(mi)
-        super(self.__class__, self).resizeEvent(event)
-
     def startDrag(self, actions):
         """ Reimplemented to start the drag of a tree widget item.
         """
@@ -1929,3 +2539,67 @@ class _TreeWidget(QtGui.QTreeWidget):
                 action = None
 
         return (action, to_node, to_object, to_index, data)
+
+#-------------------------------------------------------------------------
+#  '_TreeWidget' class:
+#-------------------------------------------------------------------------
+
+
+class _TreeWidget(_TreeDragDrop, QtGui.QTreeWidget):
+    """ The _TreeWidget class is a specialised QTreeWidget that reimplements
+        the drag'n'drop support so that it hooks into the provided Traits
+        support.
+    """
+
+    def __init__(self, editor, parent=None):
+        """ Initialise the tree widget.
+        """
+        QtGui.QTreeWidget.__init__(self, parent)
+
+        self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
+        self.setDragEnabled(True)
+        self.setAcceptDrops(True)
+        self.setIconSize(QtCore.QSize(*editor.factory.icon_size))
+
+        # Set up headers if necessary.
+        column_count = len(editor.factory.column_headers)
+        if column_count > 0:
+            self.setHeaderHidden(False)
+            self.setColumnCount(column_count)
+            self.setHeaderLabels(editor.factory.column_headers)
+        else:
+            self.setHeaderHidden(True)
+
+        self.setAlternatingRowColors(editor.factory.alternating_row_colors)
+        padding = editor.factory.vertical_padding
+        if padding > 0:
+            self.setStyleSheet("""
+            QTreeView::item {
+                padding-top: %spx;
+                padding-bottom: %spx;
+            }
+            """ % (padding, padding))
+
+        if editor.factory.selection_mode == 'extended':
+            self.setSelectionMode(QtGui.QAbstractItemView.ExtendedSelection)
+
+        self.itemExpanded.connect(editor._on_item_expanded)
+        self.itemCollapsed.connect(editor._on_item_collapsed)
+        self.itemClicked.connect(editor._on_item_clicked)
+        self.itemDoubleClicked.connect(editor._on_item_dclicked)
+        self.itemActivated.connect(editor._on_item_activated)
+        self.itemSelectionChanged.connect(editor._on_tree_sel_changed)
+        self.customContextMenuRequested.connect(editor._on_context_menu)
+        self.itemChanged.connect(editor._on_nid_changed)
+
+        self._editor = editor
+        self._dragging = None
+
+    def resizeEvent(self, event):
+        """ Overridden to emit sizeHintChanged() of items for word wrapping """
+        if self._editor.factory.word_wrap:
+            for i in range(self.topLevelItemCount()):
+                mi = self.indexFromItem(self.topLevelItem(i))
+                id = self.itemDelegate(mi)
+                id.sizeHintChanged.emit(mi)
+        super(self.__class__, self).resizeEvent(event)
@@ -0,0 +1,860 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Defines the virtual tree editor for the PyQt user interface toolkit.
+
+    The standard tree editor creates a QTreeWidgetItem for every child of a
+    node as soon as the node is expanded, and immediately asks the TreeNode
+    for the label, icon, tooltip, colors and column labels of each of them.
+    This editor displays the tree using a virtual item model instead: the
+    children of a node are created in batches as they are scrolled into view,
+    and the data of a node is only requested when Qt paints it.
+
+    The editor is selected by setting the **virtual** trait of the TreeEditor.
+"""
+
+#-------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------
+
+import logging
+
+from pyface.qt import QtCore, QtGui
+
+from tree_editor import SimpleEditor as BaseSimpleEditor, _TreeDragDrop
+
+logger = logging.getLogger(__name__)
+
+#-------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------
+
+# The number of children of a node created at a time:
+FETCH_SIZE = 256
+
+# The default flags of a tree item:
+ITEM_FLAGS = (QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable |
+              QtCore.Qt.ItemIsDragEnabled | QtCore.Qt.ItemIsDropEnabled)
+
+#-------------------------------------------------------------------------
+#  'SimpleEditor' class:
+#-------------------------------------------------------------------------
+
+
+class SimpleEditor(BaseSimpleEditor):
+    """ Simple style of tree editor, using a virtual item model.
+    """
+
+    #-------------------------------------------------------------------------
+    #  Creates the tree control:
+    #-------------------------------------------------------------------------
+
+    def _create_tree(self):
+        """ Creates the tree control.
+        """
+        if self.factory.async_children:
+            logger.warning('The virtual TreeEditor does not support '
+                           'async_children: children are fetched when their '
+                           'items are scrolled into view instead')
+
+        return _TreeView(self)
+
+    #-------------------------------------------------------------------------
+    #  Creates a tree item:
+    #-------------------------------------------------------------------------
+
+    def _create_item(self, nid, node, object, index=None):
+        """ Creates a new tree item for *object* as a child of the *nid* item
+            (or as a top level item if *nid* is the tree control).
+
+            Index is the index of the new item in the parent: None implies
+            appending the item after the existing children.
+        """
+        model = self._tree.model()
+        if nid is self._tree:
+            nid = model.root
+
+        cnid = _TreeItem(model, nid)
+        self._set_node_data(cnid, (False, node, object))
+        if index is None:
+            index = nid.childCount()
+        model.insert_items(nid, index, [cnid])
+
+        return cnid
+
+    def _set_label(self, nid, text, col=0):
+        """ Set the label of the specified item.
+        """
+        self._tree.model().item_changed(nid)
+
+    def _set_column_labels(self, nid, column_labels):
+        """ Set the column labels.
+        """
+        self._tree.model().item_changed(nid)
+
+    #-------------------------------------------------------------------------
+    #  Inserts new nodes for a list of objects to the specified node:
+    #-------------------------------------------------------------------------
+
+    def _insert_nodes(self, nid, index, children):
+        """ Creates the items for a list of (object, node) pairs and inserts
+            them before a specified index (None implies appending them) into
+            the children of an item.
+        """
+        model = self._tree.model()
+        items = []
+        for object, node in children:
+            if node is not None:
+                cnid = _TreeItem(model, nid)
+                self._set_node_data(cnid, (False, node, object))
+                self._map_node(cnid)
+                items.append(cnid)
+
+        if index is None:
+            index = nid.childCount()
+        model.insert_items(nid, index, items)
+
+        self._show_nodes(nid, items)
+
+        # Automatically expand the new nodes (if requested):
+        for cnid in items:
+            expanded, node, object = self._get_node_data(cnid)
+            if node.can_auto_open(object) and self._has_children(node, object):
+                cnid.setExpanded(True)
+
+        return items
+
+    #-------------------------------------------------------------------------
+    #  Deletes a specified tree node and all its children:
+    #-------------------------------------------------------------------------
+
+    def _delete_node(self, nid):
+        """ Deletes a specified tree node and all its children.
+        """
+        self._forget_node(nid)
+
+        parent = nid._parent
+        if parent is None:
+            # The invisible root item is never deleted, only its children:
+            self._tree.model().remove_items(nid, 0, nid.childCount())
+            nid._pending = None
+        else:
+            self._tree.model().remove_items(parent, nid._row, nid._row + 1)
+
+    #-------------------------------------------------------------------------
+    #  Expands the contents of a specified node (if required):
+    #-------------------------------------------------------------------------
+
+    def _expand_node(self, nid):
+        """ Expands the contents of a specified node (if required).
+        """
+        expanded, node, object = self._get_node_data(nid)
+
+        # Lazily populate the item's children, creating only the first batch
+        # of items (the rest is created as they are scrolled into view):
+        if not expanded:
+            nid._pending = list(node.get_children(object))
+            self._set_node_data(nid, (True, node, object))
+            self._fetch_items(nid)
+
+    #-------------------------------------------------------------------------
+    #  Updates the icon for a specified node:
+    #-------------------------------------------------------------------------
+
+    def _update_icon(self, nid):
+        """ Updates the icon for a specified node.
+        """
+        nid._icon = None
+        self._tree.model().item_changed(nid)
+
+    #-------------------------------------------------------------------------
+    #  Handles the children of a node being completely replaced:
+    #-------------------------------------------------------------------------
+
+    def _children_replaced(self, object, name='', new=None):
+        """ Handles the children of a node being completely replaced.
+        """
+        if self._index is not None:
+            self._index.children_changed(object)
+
+        for expanded, node, nid in self._object_info_for(object, name):
+            # Only add/remove the changes if the node has already been
+            # expanded:
+            if expanded:
+                self._remove_items(nid, 0, nid.childCount())
+                nid._pending = list(node.get_children(object))
+                self._fetch_items(nid)
+            else:
+                self._children_changed(nid)
+
+            # Try to expand the node (if requested):
+            if node.can_auto_open(object):
+                nid.setExpanded(True)
+
+    #-------------------------------------------------------------------------
+    #  Handles the children of a node being changed:
+    #-------------------------------------------------------------------------
+
+    def _children_updated(self, object, name, event):
+        """ Handles the children of a node being changed.
+        """
+        # Log the change that was made made (removing '_items' from the end of
+        # the name):
+        name = name[:-6]
+        self.log_change(self._get_undo_item, object, name, event)
+
+        if self._index is not None:
+            self._index.children_changed(object)
+
+        # Get information about the node that was changed:
+        start = event.index
+        end = start + len(event.removed)
+
+        for expanded, node, nid in self._object_info_for(object, name):
+            # Only add/remove the changes if the node has already been
+            # expanded:
+            if expanded:
+                self._remove_items(nid, start, end)
+                self._insert_items(nid, start, event.added)
+            else:
+                self._children_changed(nid)
+
+            # Try to expand the node (if requested):
+            if node.can_auto_open(object):
+                nid.setExpanded(True)
+
+    #-------------------------------------------------------------------------
+    #  Brings an item which was not listened to up to date:
+    #-------------------------------------------------------------------------
+
+    def _refresh_item(self, nid):
+        """ Brings the label, icon and children of a specified item, whose
+            object was not listened to for a while, up to date.
+        """
+        nid._icon = None
+        nid._has_children = None
+
+        # The children of a populated item are only replaced if they changed:
+        expanded, node, object = self._get_node_data(nid)
+        if expanded:
+            children = list(node.get_children(object))
+            pending = nid._pending or []
+            current = [self._get_node_data(cnid)[2] for cnid in nid._children]
+            current.extend(pending)
+            if ((len(children) != len(current)) or
+                    any(child is not old
+                        for child, old in zip(children, current))):
+                self._remove_items(nid, 0, nid.childCount() + len(pending))
+                nid._pending = children
+                self._fetch_items(nid)
+
+        self._tree.model().item_changed(nid)
+
+    #-------------------------------------------------------------------------
+    #  Virtual tree support methods:
+    #-------------------------------------------------------------------------
+
+    def _item_has_children(self, nid):
+        """ Returns whether a specified item has (or may have) any children.
+        """
+        if (nid.childCount() > 0) or nid._pending:
+            return True
+
+        expanded, node, object = self._get_node_data(nid)
+        if expanded:
+            return False
+
+        if nid._has_children is None:
+            nid._has_children = self._has_children(node, object)
+
+        return nid._has_children
+
+    def _children_changed(self, nid):
+        """ Handles the children of an item that has not been expanded yet
+            being changed.
+        """
+        nid._has_children = None
+        self._tree.viewport().update()
+
+    def _fetch_items(self, nid):
+        """ Creates the items for the next batch of children of an item.
+        """
+        pending = nid._pending
+        if pending:
+            children = pending[:FETCH_SIZE]
+            del pending[:FETCH_SIZE]
+            self._insert_nodes(nid, nid.childCount(),
+                               [self._node_for(child) for child in children])
+
+    def _insert_items(self, nid, index, children):
+        """ Inserts the items of a list of child objects before a specified
+            index into the children of an expanded item.
+        """
+        count = nid.childCount()
+        if (index >= count) and nid._pending:
+            # The items of the new children will be created once they are
+            # scrolled into view:
+            nid._pending[index - count: index - count] = children
+            self._tree.fetch_later()
+        else:
+            self._insert_nodes(nid, min(index, count),
+                               [self._node_for(child) for child in children])
+
+    def _remove_items(self, nid, start, end):
+        """ Removes the items of the children of an expanded item between a
+            specified start and end index.
+        """
+        count = nid.childCount()
+        if start < count:
+            stop = min(end, count)
+            for cnid in nid._children[start: stop]:
+                self._forget_node(cnid)
+            self._tree.model().remove_items(nid, start, stop)
+
+        pending = nid._pending
+        if (end > count) and pending:
+            del pending[max(start - count, 0): end - count]
+
+#-------------------------------------------------------------------------
+#  '_TreeItem' class:
+#-------------------------------------------------------------------------
+
+
+class _TreeItem(object):
+    """ An item of the virtual tree model.
+
+        It implements the subset of the QTreeWidgetItem interface used by the
+        tree editor.
+    """
+
+    def __init__(self, model, parent=None):
+        """ Initialise the item.
+        """
+        self._model = model
+        self._parent = parent
+
+        # The index of the item in its parent:
+        self._row = 0
+
+        # The child items created so far:
+        self._children = []
+
+        # The child objects whose items have not been created yet (None if
+        # the children of the item have not been requested yet):
+        self._pending = None
+
+        self._flags = ITEM_FLAGS
+
+        # The cached icon and 'has children' state (None if not known):
+        self._icon = None
+        self._has_children = None
+
+    def parent(self):
+        """ Returns the parent item, or None for a top level item.
+        """
+        parent = self._parent
+        if parent is self._model.root:
+            return None
+
+        return parent
+
+    def child(self, index):
+        """ Returns the child item at a specified index.
+        """
+        return self._children[index]
+
+    def childCount(self):
+        """ Returns the number of child items created so far.
+        """
+        return len(self._children)
+
+    def indexOfChild(self, item):
+        """ Returns the index of a child item, or -1 if it is not a child.
+        """
+        if item._parent is self:
+            return item._row
+
+        return -1
+
+    def flags(self):
+        """ Returns the item flags.
+        """
+        return self._flags
+
+    def setFlags(self, flags):
+        """ Sets the item flags.
+        """
+        self._flags = flags
+
+    def isExpanded(self):
+        """ Returns whether the item is expanded.
+        """
+        model = self._model
+        return model.view.isExpanded(model.index_for(self))
+
+    def setExpanded(self, expanded):
+        """ Expands or collapses the item.
+        """
+        model = self._model
+        model.view.setExpanded(model.index_for(self), expanded)
+
+    def isHidden(self):
+        """ Returns whether the item is hidden.
+        """
+        model = self._model
+        return model.view.isRowHidden(self._row,
+                                      model.index_for(self._parent))
+
+    def setHidden(self, hidden):
+        """ Hides or shows the item.
+        """
+        model = self._model
+        model.view.setRowHidden(self._row, model.index_for(self._parent),
+                                hidden)
+
+#-------------------------------------------------------------------------
+#  '_TreeModel' class:
+#-------------------------------------------------------------------------
+
+
+class _TreeModel(QtCore.QAbstractItemModel):
+    """ The virtual item model of the tree.
+    """
+
+    def __init__(self, editor, view):
+        """ Initialise the object.
+        """
+        QtCore.QAbstractItemModel.__init__(self, view)
+
+        self.view = view
+        self._editor = editor
+
+        # The invisible root item:
+        self.root = _TreeItem(self)
+
+    #-------------------------------------------------------------------------
+    #  QAbstractItemModel interface:
+    #-------------------------------------------------------------------------
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        """ Reimplemented to return the index of a created item.
+        """
+        children = self.item_for(parent)._children
+        if (0 <= row < len(children)) and (0 <= column <
+                                           self.columnCount(parent)):
+            return self.createIndex(row, column, children[row])
+
+        return QtCore.QModelIndex()
+
+    def parent(self, index=None):
+        """ Reimplemented to return the index of the parent of an item.
+        """
+        if index is None:
+            return QtCore.QObject.parent(self)
+
+        if not index.isValid():
+            return QtCore.QModelIndex()
+
+        return self.index_for(index.internalPointer()._parent)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """ Reimplemented to return the number of created child items.
+        """
+        if parent.column() > 0:
+            return 0
+
+        return len(self.item_for(parent)._children)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """ Reimplemented to return the number of columns.
+        """
+        return max(len(self._editor.factory.column_headers), 1)
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        """ Reimplemented to avoid creating the children of an item to find
+            out whether it has any.
+        """
+        item = self.item_for(parent)
+        if item is self.root:
+            return len(item._children) > 0
+
+        if parent.column() > 0:
+            return False
+
+        return self._editor._item_has_children(item)
+
+    def canFetchMore(self, parent):
+        """ Reimplemented to report whether there are children whose items
+            have not been created yet.
+        """
+        return bool(self.item_for(parent)._pending)
+
+    def fetchMore(self, parent):
+        """ Reimplemented to create the next batch of child items.
+        """
+        self._editor._fetch_items(self.item_for(parent))
+
+    def data(self, index, role):
+        """ Reimplemented to return the data of an item as it is painted.
+        """
+        item = index.internalPointer()
+        expanded, node, object = item._py_data
+        column = index.column()
+        editor = self._editor
+
+        if role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
+            if column == 0:
+                return node.get_label(object)
+
+            if column < len(editor.factory.column_headers):
+                column_labels = node.get_column_labels(object)
+                if column <= len(column_labels):
+                    return column_labels[column - 1]
+
+            return None
+
+        # Only the first column has an icon, a tooltip and colors:
+        if column > 0:
+            return None
+
+        if role == QtCore.Qt.DecorationRole:
+            if item._icon is None:
+                item._icon = editor._get_icon(node, object, expanded)
+
+            return item._icon
+
+        if role == QtCore.Qt.ToolTipRole:
+            return node.get_tooltip(object)
+
+        if role == QtCore.Qt.BackgroundRole:
+            color = node.get_background(object)
+            if color:
+                return editor._get_brush(color)
+
+        elif role == QtCore.Qt.ForegroundRole:
+            color = node.get_foreground(object)
+            if color:
+                return editor._get_brush(color)
+
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        """ Reimplemented to rename the object of an item.
+        """
+        if (role != QtCore.Qt.EditRole) or (index.column() != 0):
+            return False
+
+        expanded, node, object = index.internalPointer()._py_data
+        new_label = unicode(value)
+        if (new_label != '') and (new_label != node.get_label(object)):
+            node.set_label(object, new_label)
+
+        return True
+
+    def flags(self, index):
+        """ Reimplemented to return the flags of an item.
+        """
+        if not index.isValid():
+            return QtCore.Qt.ItemIsDropEnabled
+
+        return index.internalPointer()._flags
+
+    def headerData(self, section, orientation, role):
+        """ Reimplemented to return the column headers.
+        """
+        headers = self._editor.factory.column_headers
+        if ((orientation == QtCore.Qt.Horizontal) and
+                (role == QtCore.Qt.DisplayRole) and (section < len(headers))):
+            return headers[section]
+
+        return None
+
+    #-------------------------------------------------------------------------
+    #  _TreeModel interface:
+    #-------------------------------------------------------------------------
+
+    def item_for(self, index):
+        """ Returns the item of a model index.
+        """
+        if index.isValid():
+            return index.internalPointer()
+
+        return self.root
+
+    def index_for(self, item, column=0):
+        """ Returns the model index of an item.
+        """
+        if (item is None) or (item is self.root):
+            return QtCore.QModelIndex()
+
+        return self.createIndex(item._row, column, item)
+
+    def insert_items(self, parent, row, items):
+        """ Inserts a list of items before a specified row of the children of
+            an item.
+        """
+        if len(items) > 0:
+            self.beginInsertRows(self.index_for(parent), row,
+                                 row + len(items) - 1)
+            children = parent._children
+            children[row: row] = items
+            self._renumber(children, row)
+            self.endInsertRows()
+
+    def remove_items(self, parent, start, end):
+        """ Removes the children of an item between a specified start and end
+            row.
+        """
+        if end > start:
+            self.beginRemoveRows(self.index_for(parent), start, end - 1)
+            children = parent._children
+            for item in children[start: end]:
+                item._parent = None
+            del children[start: end]
+            self._renumber(children, start)
+            self.endRemoveRows()
+
+    def item_changed(self, item):
+        """ Notifies the view that the data of an item has changed.
+        """
+        if item is not self.root:
+            self.dataChanged.emit(
+                self.index_for(item),
+                self.index_for(item, self.columnCount() - 1))
+
+    def clear(self):
+        """ Removes all items.
+        """
+        self.beginResetModel()
+        root = self.root
+        root._children = []
+        root._pending = None
+        self.endResetModel()
+
+    #-------------------------------------------------------------------------
+    #  Private methods:
+    #-------------------------------------------------------------------------
+
+    def _renumber(self, children, start):
+        """ Updates the row of the items of a list of children from a
+            specified start row onwards.
+        """
+        for row in range(start, len(children)):
+            children[row]._row = row
+
+#-------------------------------------------------------------------------
+#  '_TreeView' class:
+#-------------------------------------------------------------------------
+
+
+class _TreeView(_TreeDragDrop, QtGui.QTreeView):
+    """ The _TreeView class is a QTreeView displaying the virtual tree model,
+        which provides the subset of the QTreeWidget interface used by the
+        tree editor.
+    """
+
+    def __init__(self, editor, parent=None):
+        """ Initialise the tree view.
+        """
+        QtGui.QTreeView.__init__(self, parent)
+
+        self._editor = editor
+        self._dragging = None
+        self._fetch_scheduled = False
+
+        factory = editor.factory
+        self.setModel(_TreeModel(editor, self))
+
+        self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
+        self.setDragEnabled(True)
+        self.setAcceptDrops(True)
+        self.setIconSize(QtCore.QSize(*factory.icon_size))
+        self.setHeaderHidden(len(factory.column_headers) == 0)
+        self.setAlternatingRowColors(factory.alternating_row_colors)
+
+        # All rows have the same height, which saves Qt from asking every
+        # item for its size:
+        self.setUniformRowHeights(True)
+
+        padding = factory.vertical_padding
+        if padding > 0:
+            self.setStyleSheet("""
+            QTreeView::item {
+                padding-top: %spx;
+                padding-bottom: %spx;
+            }
+            """ % (padding, padding))
+
+        if factory.selection_mode == 'extended':
+            self.setSelectionMode(QtGui.QAbstractItemView.ExtendedSelection)
+
+        self.expanded.connect(self._on_expanded)
+        self.collapsed.connect(self._on_collapsed)
+        self.clicked.connect(self._on_clicked)
+        self.doubleClicked.connect(self._on_dclicked)
+        self.activated.connect(self._on_activated)
+        self.selectionModel().selectionChanged.connect(
+            self._on_selection_changed)
+        self.customContextMenuRequested.connect(editor._on_context_menu)
+
+        # Create more items whenever the end of the created children of an
+        # item may have been scrolled into view:
+        scroll_bar = self.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self.fetch_later)
+        scroll_bar.rangeChanged.connect(self.fetch_later)
+
+    #-------------------------------------------------------------------------
+    #  QTreeWidget interface:
+    #-------------------------------------------------------------------------
+
+    def invisibleRootItem(self):
+        """ Returns the invisible root item of the tree.
+        """
+        return self.model().root
+
+    def itemFromIndex(self, index):
+        """ Returns the item of a model index.
+        """
+        return self.model().item_for(index)
+
+    def indexFromItem(self, item, column=0):
+        """ Returns the model index of an item.
+        """
+        return self.model().index_for(item, column)
+
+    def currentItem(self):
+        """ Returns the current item (if any).
+        """
+        index = self.currentIndex()
+        if index.isValid():
+            return index.internalPointer()
+
+        return None
+
+    def setCurrentItem(self, item):
+        """ Makes an item the current item.
+        """
+        self.setCurrentIndex(self.model().index_for(item))
+
+    def selectedItems(self):
+        """ Returns the list of selected items.
+        """
+        return [index.internalPointer()
+                for index in self.selectionModel().selectedRows()]
+
+    def itemAt(self, pos):
+        """ Returns the item at a specified position (if any).
+        """
+        index = self.indexAt(pos)
+        if index.isValid():
+            return index.internalPointer()
+
+        return None
+
+    def editItem(self, item, column=0):
+        """ Starts editing an item.
+        """
+        self.edit(self.model().index_for(item, column))
+
+    def visualItemRect(self, item):
+        """ Returns the rectangle occupied by an item.
+        """
+        return self.visualRect(self.model().index_for(item))
+
+    def columnCount(self):
+        """ Returns the number of columns.
+        """
+        return self.model().columnCount()
+
+    def clear(self):
+        """ Removes all items.
+        """
+        self.model().clear()
+
+    #-------------------------------------------------------------------------
+    #  _TreeView interface:
+    #-------------------------------------------------------------------------
+
+    def fetch_later(self, *args):
+        """ Schedules creating more items, if the end of the created children
+            of an item is visible.
+        """
+        if not self._fetch_scheduled:
+            self._fetch_scheduled = True
+            QtCore.QTimer.singleShot(0, self._fetch_visible)
+
+    #-------------------------------------------------------------------------
+    #  Private methods:
+    #-------------------------------------------------------------------------
+
+    def _fetch_visible(self):
+        """ Creates the next batch of children of every item whose last
+            created child is visible.
+        """
+        self._fetch_scheduled = False
+        if self._editor._tree is None:
+            return
+
+        model = self.model()
+        index = self.indexAt(self.viewport().rect().bottomLeft())
+        if not index.isValid():
+            # The tree ends above the bottom of the view, so start from the
+            # last visible item:
+            index = self._last_visible_index()
+
+        fetched = False
+        while index.isValid():
+            parent = index.parent()
+            if ((index.row() == (model.rowCount(parent) - 1)) and
+                    model.canFetchMore(parent)):
+                model.fetchMore(parent)
+                fetched = True
+            index = parent
+
+        if fetched:
+            self.fetch_later()
+
+    def _last_visible_index(self):
+        """ Returns the model index of the last visible item.
+        """
+        model = self.model()
+        index = QtCore.QModelIndex()
+        while (not index.isValid()) or self.isExpanded(index):
+            rows = model.rowCount(index)
+            if rows == 0:
+                break
+            index = model.index(rows - 1, 0, index)
+
+        return index
+
+    def _on_expanded(self, index):
+        self._editor._on_item_expanded(index.internalPointer())
+        self.fetch_later()
+
+    def _on_collapsed(self, index):
+        self._editor._on_item_collapsed(index.internalPointer())
+
+    def _on_clicked(self, index):
+        self._editor._on_item_clicked(index.internalPointer(), index.column())
+
+    def _on_dclicked(self, index):
+        self._editor._on_item_dclicked(index.internalPointer(),
+                                       index.column())
+
+    def _on_activated(self, index):
+        self._editor._on_item_activated(index.internalPointer(),
+                                        index.column())
+
+    def _on_selection_changed(self, selected, deselected):
+        self._editor._on_tree_sel_changed()
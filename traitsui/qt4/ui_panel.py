@@ -27,6 +27,12 @@ from traits.api \
 from traitsui.api \
     import Group
 
+from traitsui.helper \
+    import compile_expression
+
+from traitsui.profiler \
+    import profiled
+
 from traitsui.undo \
     import UndoHistory
 
@@ -257,14 +263,15 @@ def panel(ui):
     content = ui._groups
     nr_groups = len(content)
 
-    if nr_groups == 0:
-        panel = None
-    if nr_groups == 1:
-        panel = _GroupPanel(content[0], ui).control
-    elif nr_groups > 1:
-        panel = QtGui.QTabWidget()
-        _fill_panel(panel, content, ui)
-        panel.ui = ui
+    with profiled('panel'):
+        if nr_groups == 0:
+            panel = None
+        if nr_groups == 1:
+            panel = _GroupPanel(content[0], ui).control
+        elif nr_groups > 1:
+            panel = QtGui.QTabWidget()
+            _fill_panel(panel, content, ui)
+            panel.ui = ui
 
     # If the UI is scrollable then wrap the panel in a scroll area.
     if ui.scrollable and panel is not None:
@@ -286,43 +293,31 @@ def _fill_panel(panel, content, ui, item_handler=None):
     """Fill a page based container panel with content.
     """
     active = 0
+    for index, item in enumerate(content):
+        if isinstance(item, Group) and item.selected:
+            active = index
+
+    if isinstance(panel, QtGui.QTabWidget):
+        layout = 'tabbed'
+    else:
+        layout = 'fold'
 
     for index, item in enumerate(content):
         page_name = item.get_label(ui)
         if page_name == "":
             page_name = "Page %d" % index
 
-        if isinstance(item, Group):
-            if item.selected:
-                active = index
-
-            gp = _GroupPanel(item, ui, suppress_label=True)
-            page = gp.control
-            sub_page = gp.sub_control
-
-            # If the result is the same type with only one page, collapse it
-            # down into just the page.
-            if isinstance(sub_page, type(panel)) and sub_page.count() == 1:
-                new = sub_page.widget(0)
-                if isinstance(panel, QtGui.QTabWidget):
-                    sub_page.removeTab(0)
-                else:
-                    sub_page.removeItem(0)
-            elif isinstance(page, QtGui.QWidget):
-                new = page
-            else:
-                new = QtGui.QWidget()
-                new.setLayout(page)
-
-            layout = new.layout()
-            if layout is not None:
-                layout.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
-
+        # Defer the creation of the pages which are not shown initially,
+        # unless they may have to be collapsed into the panel.
+        if (ui.view.lazy and index != active and
+                not (isinstance(item, Group) and item.layout == layout)):
+            new = _DeferredPanel(
+                ui, [item],
+                lambda parent, item=item: parent.addWidget(
+                    _create_page(panel, item, ui, item_handler)))
         else:
-            new = QtGui.QWidget()
-            layout = QtGui.QVBoxLayout(new)
-            layout.setContentsMargins(0, 0, 0, 0)
-            item_handler(item, layout)
+            with profiled('page', page_name):
+                new = _create_page(panel, item, ui, item_handler)
 
         # Add the content.
         if isinstance(panel, QtGui.QTabWidget):
@@ -333,6 +328,75 @@ def _fill_panel(panel, content, ui, item_handler=None):
     panel.setCurrentIndex(active)
 
 
+def _create_page(panel, item, ui, item_handler):
+    """Creates the widget for a Group or Item in a page based container panel.
+    """
+    if isinstance(item, Group):
+        gp = _GroupPanel(item, ui, suppress_label=True)
+        page = gp.control
+        sub_page = gp.sub_control
+
+        # If the result is the same type with only one page, collapse it
+        # down into just the page.
+        if isinstance(sub_page, type(panel)) and sub_page.count() == 1:
+            new = sub_page.widget(0)
+            if isinstance(panel, QtGui.QTabWidget):
+                sub_page.removeTab(0)
+            else:
+                sub_page.removeItem(0)
+        elif isinstance(page, QtGui.QWidget):
+            new = page
+        else:
+            new = QtGui.QWidget()
+            new.setLayout(page)
+
+        layout = new.layout()
+        if layout is not None:
+            layout.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
+
+    else:
+        new = QtGui.QWidget()
+        layout = QtGui.QVBoxLayout(new)
+        layout.setContentsMargins(0, 0, 0, 0)
+        item_handler(item, layout)
+
+    return new
+
+
+class _DeferredPanel(QtGui.QWidget):
+    """A placeholder for a page or group whose editors are only created when
+       it is first shown (see 'View.lazy').
+    """
+
+    def __init__(self, ui, content, build):
+        """Initialise the object.  build is called with the layout of the
+           placeholder to create the content.
+        """
+        QtGui.QWidget.__init__(self)
+
+        layout = QtGui.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self._ui = ui
+        self._build = build
+        ui.add_deferred(self.build, content)
+
+    def build(self):
+        """Creates the content of the placeholder.
+        """
+        build, self._build = self._build, None
+        if build is not None:
+            build(self.layout())
+
+    def showEvent(self, event):
+        """Creates the content the first time the placeholder is shown.
+        """
+        if self._build is not None:
+            self._ui.run_deferred(self.build)
+
+        QtGui.QWidget.showEvent(self, event)
+
+
 def _size_hint_wrapper(f, ui):
     """Wrap an existing sizeHint method with sizes from a UI object.
     """
@@ -597,16 +661,21 @@ class _GroupPanel(object):
                 # Create an editor.
                 self._setup_editor(group, GroupEditor(control=outer))
 
-            if isinstance(content[0], Group):
-                layout = self._add_groups(content, inner)
+            # Defer the creation of the editors of a group which is initially
+            # hidden until it is shown.
+            if (ui.view.lazy and group.visible_when != '' and
+                    not ui.eval_when(group.visible_when)):
+                inner.addWidget(_DeferredPanel(
+                    ui, content,
+                    lambda parent: parent.addLayout(
+                        self._add_content(content, None))))
             else:
-                layout = self._add_items(content, inner)
-            layout.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
+                layout = self._add_content(content, inner)
 
-            if outer is None:
-                outer = layout
-            elif layout is not inner:
-                inner.addLayout(layout)
+                if outer is None:
+                    outer = layout
+                elif layout is not inner:
+                    inner.addLayout(layout)
 
         if group.style_sheet:
             if isinstance(outer, QtGui.QLayout):
@@ -624,6 +693,18 @@ class _GroupPanel(object):
         # Publish the optional sub-control.
         self.sub_control = sub
 
+    def _add_content(self, content, outer):
+        """Adds a list of Group or Item objects to the panel, creating a layout
+           if needed.  Return the outermost layout.
+        """
+        if isinstance(content[0], Group):
+            layout = self._add_groups(content, outer)
+        else:
+            layout = self._add_items(content, outer)
+        layout.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
+
+        return layout
+
     def _add_splitter_items(self, content, splitter):
         """Adds a set of groups or items separated by splitter bars.
         """
@@ -830,7 +911,8 @@ class _GroupPanel(object):
                 continue
 
             # Otherwise, it must be a trait Item:
-            object = eval(item.object_, globals(), ui.context)
+            object = eval(compile_expression(item.object_), globals(),
+                          ui.context)
             trait = object.base_trait(name)
             desc = trait.desc or ''
 
@@ -857,18 +939,23 @@ class _GroupPanel(object):
                 if item.invalid != '':
                     editor_factory.invalid = item.invalid
 
-            # Create the requested type of editor from the editor factory:
-            factory_method = getattr(editor_factory, item.style + '_editor')
-            editor = factory_method(
-                ui, object, name, item.tooltip, None
-            ).set(item=item, object_name=item.object)
-
-            # Tell the editor to actually build the editing widget.  Note that
-            # "inner" is a layout.  This shouldn't matter as individual editors
-            # shouldn't be using it as a parent anyway.  The important thing is
-            # that it is not None (otherwise the main TraitsUI code can change
-            # the "kind" of the created UI object).
-            editor.prepare(inner)
+            with profiled('Item', item.id or name):
+                # Create the requested type of editor from the editor factory:
+                method_name = item.style + '_editor'
+                factory_method = getattr(editor_factory, method_name)
+                with profiled('create', '%s.%s' % (
+                        editor_factory.__class__.__name__, method_name)):
+                    editor = factory_method(
+                        ui, object, name, item.tooltip, None
+                    ).set(item=item, object_name=item.object)
+
+                # Tell the editor to actually build the editing widget.  Note
+                # that "inner" is a layout.  This shouldn't matter as
+                # individual editors shouldn't be using it as a parent anyway.
+                # The important thing is that it is not None (otherwise the
+                # main TraitsUI code can change the "kind" of the created UI
+                # object).
+                editor.prepare(inner)
             control = editor.control
 
             if item.style_sheet:
@@ -409,6 +409,32 @@ class TabularAdapter(HasPrivateTraits):
         self.object, self.name = object, trait
         return self.column_map[index]
 
+    def get_export_data(self, object, trait, rows, columns):
+        """ Returns the cells of the specified *rows* and *columns* (sorted
+            lists of indices) of the *object.trait* list as a single object,
+            such as an array or a data frame, which editors may export in
+            additional formats when the cells are copied or dragged.
+
+            Returns None if the adapter does not support exporting cells.
+        """
+        return None
+
+    def get_export_text(self, object, trait, rows, columns, separator='\t'):
+        """ Returns an iterator over chunks of text containing the cells of
+            the specified *rows* and *columns* of the *object.trait* list, one
+            line per row with the cells delimited by *separator*.
+
+            Returns None if the adapter does not support exporting cells.
+        """
+        return None
+
+    def get_column_ids(self, columns):
+        """ Returns the list of column ids of the specified *columns* (a list
+            of column indices).
+        """
+        column_map = self.column_map
+        return [column_map[column] for column in columns]
+
     #-- Property Implementations ---------------------------------------------
 
     def _get_drag(self):
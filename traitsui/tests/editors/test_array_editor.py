@@ -0,0 +1,174 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+"""
+Test cases for the ArrayEditor object.
+"""
+
+import unittest
+
+import numpy as np
+
+from traits.api import Any, Array, HasTraits
+from traits.testing.api import UnittestTools
+
+from traitsui.api import ArrayEditor, Item, View
+from traitsui.editors.array_editor import ArrayGridAdapter, parse_element
+from traitsui.tests._tools import skip_if_null
+
+
+class ArrayModel(HasTraits):
+    """ Model with an array trait.
+    """
+
+    data = Array
+
+    traits_view = View(Item('data', editor=ArrayEditor(grid_threshold=16)))
+
+
+class DummyStructure(HasTraits):
+    """ Stand-in for the ArrayStructure of a grid mode ArrayEditor.
+    """
+
+    array = Any
+
+    def set_element(self, row, column, text):
+        self.array[row, column] = float(text)
+
+
+class TestArrayGridAdapter(unittest.TestCase):
+
+    def test_get_text(self):
+        structure = DummyStructure(array=np.arange(6.0).reshape(2, 3))
+        adapter = ArrayGridAdapter(columns=[('0', 0), ('1', 1), ('2', 2)],
+                                   format='%.1f')
+
+        self.assertEqual(adapter.get_text(structure, 'array', 1, 2), '5.0')
+
+    def test_get_text_format_func(self):
+        structure = DummyStructure(array=np.arange(6.0).reshape(2, 3))
+        adapter = ArrayGridAdapter(columns=[('0', 0), ('1', 1), ('2', 2)],
+                                   format_func=lambda value: '<%g>' % value)
+
+        self.assertEqual(adapter.get_text(structure, 'array', 0, 1), '<1>')
+
+    def test_set_text_writes_in_place(self):
+        array = np.zeros((2, 3))
+        structure = DummyStructure(array=array)
+        adapter = ArrayGridAdapter(columns=[('0', 0), ('1', 1), ('2', 2)])
+
+        adapter.set_text(structure, 'array', 1, 2, '2.5')
+
+        self.assertIs(structure.array, array)
+        self.assertEqual(array[1, 2], 2.5)
+
+
+class TestParseElement(unittest.TestCase):
+
+    def test_numbers(self):
+        self.assertEqual(parse_element(np.dtype(float), '1.5'), 1.5)
+        self.assertEqual(parse_element(np.dtype(int), '3'), 3)
+        with self.assertRaises(ValueError):
+            parse_element(np.dtype(float), 'abc')
+
+    def test_booleans(self):
+        dtype = np.dtype(bool)
+        for text in ['1', 'True', ' yes ']:
+            self.assertIs(parse_element(dtype, text), np.True_)
+        for text in ['0', 'False', 'no']:
+            self.assertIs(parse_element(dtype, text), np.False_)
+        for text in ['', 'maybe', '2']:
+            with self.assertRaises(ValueError):
+                parse_element(dtype, text)
+
+
+@skip_if_null
+class TestArrayEditorGrid(UnittestTools, unittest.TestCase):
+
+    def test_large_array_uses_grid(self):
+        model = ArrayModel(data=np.zeros((5, 5)))
+        ui = model.edit_traits()
+        try:
+            editor, = ui.get_editors('data')
+            self.assertTrue(editor.grid)
+            self.assertIsNone(editor._as.trait('f0_0'))
+        finally:
+            ui.dispose()
+
+    def test_small_array_uses_fields(self):
+        model = ArrayModel(data=np.zeros((2, 2)))
+        ui = model.edit_traits()
+        try:
+            editor, = ui.get_editors('data')
+            self.assertFalse(editor.grid)
+            self.assertIsNotNone(editor._as.trait('f0_0'))
+        finally:
+            ui.dispose()
+
+    def test_grid_edit_writes_single_element(self):
+        data = np.zeros((5, 5))
+        model = ArrayModel(data=data)
+        ui = model.edit_traits()
+        try:
+            editor, = ui.get_editors('data')
+            with self.assertTraitChanges(model, 'data', count=1):
+                editor._as.set_element(3, 4, '1.5')
+            self.assertIs(model.data, data)
+            self.assertEqual(data[3, 4], 1.5)
+        finally:
+            ui.dispose()
+
+
+@skip_if_null
+class TestArrayEditorUpdates(UnittestTools, unittest.TestCase):
+
+    def test_update_only_changed_fields(self):
+        model = ArrayModel(data=np.zeros((3, 3)))
+        ui = model.edit_traits()
+        try:
+            editor, = ui.get_editors('data')
+            data = model.data.copy()
+            data[1, 2] = 4.0
+            with self.assertTraitDoesNotChange(editor._as, 'f0_0'):
+                with self.assertTraitChanges(editor._as, 'f1_2', count=1):
+                    model.data = data
+            self.assertEqual(editor._as.f1_2, 4.0)
+        finally:
+            ui.dispose()
+
+    def test_update_ignores_unchanged_nan(self):
+        model = ArrayModel(data=np.array([[np.nan, 0.0], [0.0, 0.0]]))
+        ui = model.edit_traits()
+        try:
+            editor, = ui.get_editors('data')
+            data = model.data.copy()
+            data[1, 1] = 4.0
+            with self.assertTraitDoesNotChange(editor._as, 'f0_0'):
+                with self.assertTraitChanges(editor._as, 'f1_1', count=1):
+                    model.data = data
+        finally:
+            ui.dispose()
+
+    def test_shape_change_rebuilds(self):
+        model = ArrayModel(data=np.zeros((2, 2)))
+        ui = model.edit_traits()
+        try:
+            editor, = ui.get_editors('data')
+            model.data = np.ones((3, 4))
+            self.assertEqual(editor._as.f2_3, 1.0)
+            model.data = np.ones((5, 5))
+            self.assertTrue(editor.grid)
+        finally:
+            ui.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,8 +14,16 @@
 #------------------------------------------------------------------------------
 
 
-from traits.api import Bool, HasTraits, Instance, Int, List
+import collections
+import threading
+import time
+
+from pyface.gui import GUI
+from traits import trait_notifiers
+from traits.api import Any, Bool, HasTraits, Instance, Int, List, Str
 from traitsui.api import Item, TreeEditor, TreeNode, View
+from traitsui.editors.tree_editor import (TreeChildrenLoader, TreeLabelIndex,
+                                          TreeNodeCache)
 
 from traitsui.tests._tools import *
 
@@ -33,13 +41,16 @@ class BogusTreeView(HasTraits):
 
     hide_root = Bool
 
+    virtual = Bool
+
     def default_traits_view(self):
         nodes = [
             TreeNode(node_for=[Bogus], children='bogus_list', label='=Bogus'),
         ]
 
         tree_editor = TreeEditor(
-            nodes=nodes, hide_root=self.hide_root, editable=False
+            nodes=nodes, hide_root=self.hide_root, editable=False,
+            virtual=self.virtual
         )
 
         traits_view = View(
@@ -50,14 +61,309 @@ class BogusTreeView(HasTraits):
         return traits_view
 
 
-def _test_tree_editor_releases_listeners(hide_root):
+class CountingTreeNode(TreeNode):
+    """ A tree node counting the calls to 'is_node_for'. """
+
+    calls = Int
+
+    def is_node_for(self, object):
+        self.calls += 1
+        return super(CountingTreeNode, self).is_node_for(object)
+
+
+class ChildrenCountingTreeNode(TreeNode):
+    """ A tree node counting the calls to 'get_children'. """
+
+    calls = Int
+
+    def get_children(self, object):
+        self.calls += 1
+        return super(ChildrenCountingTreeNode, self).get_children(object)
+
+
+class SpecialBogus(Bogus):
+    """ A Bogus subclass. """
+
+    special = Bool
+
+
+class SpecialTreeNode(TreeNode):
+    """ A tree node handling only special bogus objects. """
+
+    def is_node_for(self, object):
+        return getattr(object, 'special', False)
+
+
+def test_tree_node_cache_node_for_default():
+    nose.tools.assert_true(TreeNode().cache_node_for)
+    nose.tools.assert_false(SpecialTreeNode().cache_node_for)
+
+
+def test_tree_node_cache_nodes_for():
+    node = CountingTreeNode(node_for=[Bogus], cache_node_for=True)
+    special_node = TreeNode(node_for=[SpecialBogus])
+    factory = TreeEditor(nodes=[special_node, node])
+    cache = TreeNodeCache(factory)
+
+    nose.tools.assert_equal([node], cache.nodes_for(Bogus()))
+    nose.tools.assert_equal([node], cache.nodes_for(Bogus()))
+    nose.tools.assert_equal(1, node.calls)
+    nose.tools.assert_equal([special_node, node],
+                            cache.nodes_for(SpecialBogus()))
+    nose.tools.assert_equal([], cache.nodes_for(None))
+
+    # Changing the factory nodes flushes the cache:
+    factory.nodes = [node]
+    nose.tools.assert_equal([node], cache.nodes_for(SpecialBogus()))
+    nose.tools.assert_equal(3, node.calls)
+
+    cache.dispose()
+
+
+def test_tree_node_cache_dynamic_nodes():
+    node = TreeNode(node_for=[Bogus])
+    special_node = SpecialTreeNode(node_for=[Bogus])
+    factory = TreeEditor(nodes=[special_node, node])
+    cache = TreeNodeCache(factory)
+
+    nose.tools.assert_equal([node], cache.nodes_for(SpecialBogus()))
+    nose.tools.assert_equal([special_node, node],
+                            cache.nodes_for(SpecialBogus(special=True)))
+
+    # Resolved nodes are not cached when a node depends on the instance:
+    nose.tools.assert_is(node, cache.set_node(SpecialBogus(), node))
+    nose.tools.assert_is_none(cache.get_node(SpecialBogus()))
+
+    cache.dispose()
+
+
+def test_tree_node_cache_node_for_class():
+    node = TreeNode(node_for=[Bogus])
+    factory = TreeEditor(nodes=[node])
+    cache = TreeNodeCache(factory)
+
+    nose.tools.assert_is(node, cache.node_for_class(SpecialBogus))
+    nose.tools.assert_is_none(cache.node_for_class(int))
+    nose.tools.assert_equal((node, Bogus), cache.node_for_class_name('Bogus'))
+    nose.tools.assert_equal((None, None), cache.node_for_class_name('int'))
+
+    cache.dispose()
+
+
+class BlockingTreeNode(TreeNode):
+    """ A tree node whose 'get_children' waits until it is released. """
+
+    release = Any
+
+    lock = Any
+
+    running = Int
+
+    max_running = Int
+
+    def get_children(self, object):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.running, self.max_running)
+        self.release.wait(10.0)
+        with self.lock:
+            self.running -= 1
+        return super(BlockingTreeNode, self).get_children(object)
+
+
+def _load_all(loader, requests, release=None):
+    """ Loads the children for a list of (key, node, object) requests, and
+        returns the children loaded for each key.
+    """
+    results = {}
+    done = threading.Event()
+
+    def loaded(result):
+        key, children = result
+        results[key] = children
+        if not any(loader.is_loading(key) for key, node, object in requests):
+            done.set()
+
+    loader.on_trait_change(loaded, 'loaded')
+    for key, node, object in requests:
+        loader.load(key, node, object)
+    if release is not None:
+        release()
+    nose.tools.assert_true(done.wait(10.0))
+    loader.on_trait_change(loaded, 'loaded', remove=True)
+
+    return results
+
+
+def test_tree_children_loader():
+    node = TreeNode(node_for=[Bogus], children='bogus_list')
+    children = [Bogus(), Bogus()]
+    loader = TreeChildrenLoader()
+
+    results = _load_all(loader, [(1, node, Bogus(bogus_list=children)),
+                                 (2, node, Bogus())])
+
+    nose.tools.assert_equal({1: children, 2: []}, results)
+    loader.dispose()
+
+
+def test_tree_children_loader_limit_and_cancel():
+    node = BlockingTreeNode(node_for=[Bogus], children='bogus_list',
+                            async_limit=2, release=threading.Event(),
+                            lock=threading.Lock())
+    bogus = [Bogus(bogus_list=[Bogus()]) for i in range(4)]
+    loader = TreeChildrenLoader()
+    requests = [(i, node, bogus[i]) for i in range(4)]
+
+    def release():
+        loader.cancel(3)
+        node.release.set()
+
+    results = _load_all(loader, requests, release)
+
+    nose.tools.assert_equal([0, 1, 2], sorted(results))
+    nose.tools.assert_equal(bogus[2].bogus_list, results[2])
+    nose.tools.assert_true(node.max_running <= 2)
+    loader.dispose()
+
+
+class Named(HasTraits):
+    """ A named tree object. """
+
+    name = Str
+
+    children = List
+
+
+# The calls dispatched to the UI thread by '_queued_ui_handler':
+_ui_calls = collections.deque()
+
+
+def _queued_ui_handler(handler, *args):
+    _ui_calls.append((handler, args))
+
+
+def _process_ui_calls():
+    """ Performs the calls dispatched to the UI thread (on this thread).
+    """
+    if trait_notifiers.ui_handler is _queued_ui_handler:
+        while len(_ui_calls) > 0:
+            handler, args = _ui_calls.popleft()
+            handler(*args)
+    else:
+        GUI.process_events()
+
+
+def _wait_for_index(index, change=None):
+    """ Performs a change to the tree of a label index (if any), and waits for
+        the index to be up to date.
+    """
+    updates = []
+    updated = lambda: updates.append(True)
+    index.on_trait_change(updated, 'updated')
+    if change is not None:
+        change()
+    elif index.complete:
+        updates.append(True)
+
+    deadline = time.time() + 10.0
+    while ((len(updates) == 0) or (not index.complete)) and \
+            (time.time() < deadline):
+        _process_ui_calls()
+        time.sleep(0.01)
+
+    index.on_trait_change(updated, 'updated', remove=True)
+    nose.tools.assert_true(len(updates) > 0)
+    nose.tools.assert_true(index.complete)
+
+
+def test_tree_label_index():
+    # The index resolves nodes, and the tree node listeners are dispatched,
+    # on the UI thread:
+    old_ui_handler = trait_notifiers.ui_handler
+    trait_notifiers.set_ui_handler(_queued_ui_handler)
+    try:
+        _test_tree_label_index()
+    finally:
+        _ui_calls.clear()
+        trait_notifiers.set_ui_handler(old_ui_handler)
+
+
+def _test_tree_label_index():
+    node = TreeNode(node_for=[Named], children='children', label='name')
+    alpha = Named(name='Alpha')
+    beta = Named(name='Beta', children=[Named(name='alphabet')])
+    root = Named(name='Root', children=[alpha, beta])
+
+    # The index is fed by the listeners of its user (the tree editor):
+    listened = []
+    threads = set()
+
+    def label_changed(object, name, new):
+        index.label_changed(object)
+
+    def children_changed(object, name, new):
+        index.children_changed(object)
+
+    def listener(object, node, remove):
+        node.when_label_changed(object, label_changed, remove)
+        node.when_children_replaced(object, children_changed, remove)
+        node.when_children_changed(object, children_changed, remove)
+        if remove:
+            listened.remove(object)
+        else:
+            listened.append(object)
+
+    def node_for(object):
+        threads.add(threading.current_thread())
+        return (object, node)
+
+    index = TreeLabelIndex(node_for=node_for, listener=listener)
+    _wait_for_index(index, lambda: index.reset(root, node))
+    nose.tools.assert_equal(4, len(listened))
+    nose.tools.assert_equal(set([threading.current_thread()]), threads)
+
+    matches, ancestors = index.match('alpha')
+    nose.tools.assert_equal(set([id(alpha), id(beta.children[0])]), matches)
+    nose.tools.assert_equal(set([id(root), id(beta)]), ancestors)
+
+    # Incremental matching narrows down the previous matches:
+    matches, ancestors = index.match('alphab')
+    nose.tools.assert_equal(set([id(beta.children[0])]), matches)
+
+    index.mode = 'prefix'
+    matches, ancestors = index.match('bet')
+    nose.tools.assert_equal(set([id(beta)]), matches)
+    index.mode = 'substring'
+
+    # The index follows the reported label and children changes:
+    _wait_for_index(index, lambda: setattr(alpha, 'name', 'Gamma'))
+    nose.tools.assert_equal(set([id(beta.children[0])]),
+                            index.match('alpha')[0])
+
+    delta = Named(name='delta')
+    _wait_for_index(index, lambda: alpha.children.append(delta))
+    nose.tools.assert_equal((set([id(delta)]), set([id(root), id(alpha)])),
+                            index.match('del'))
+
+    _wait_for_index(index, lambda: setattr(root, 'children', [beta]))
+    nose.tools.assert_equal(set(), index.match('del')[0])
+    nose.tools.assert_equal(3, len(listened))
+
+    index.dispose()
+    nose.tools.assert_equal([], listened)
+    nose.tools.assert_equal(0, len(alpha.trait('name')._notifiers(True)))
+
+
+def _test_tree_editor_releases_listeners(hide_root, virtual=False):
     """ The TreeEditor should release the listener to the root node's children
     when it's disposed of.
     """
 
     with store_exceptions_on_all_threads():
         bogus = Bogus(bogus_list=[Bogus()])
-        tree_editor_view = BogusTreeView(bogus=bogus, hide_root=hide_root)
+        tree_editor_view = BogusTreeView(bogus=bogus, hide_root=hide_root,
+                                         virtual=virtual)
         ui = tree_editor_view.edit_traits()
 
         # The TreeEditor sets a listener on the bogus object's children list
@@ -80,3 +386,331 @@ def test_tree_editor_listeners_with_shown_root():
 @skip_if_null
 def test_tree_editor_listeners_with_hidden_root():
     _test_tree_editor_releases_listeners(hide_root=True)
+
+
+@skip_if_not_qt4
+def test_virtual_tree_editor_listeners_with_shown_root():
+    _test_tree_editor_releases_listeners(hide_root=False, virtual=True)
+
+
+@skip_if_not_qt4
+def test_virtual_tree_editor_listeners_with_hidden_root():
+    _test_tree_editor_releases_listeners(hide_root=True, virtual=True)
+
+
+@skip_if_not_qt4
+def test_virtual_tree_editor_fetches_children_in_batches():
+    from traitsui.qt4 import tree_model_editor
+
+    with store_exceptions_on_all_threads():
+        children = [Bogus() for i in range(3 * tree_model_editor.FETCH_SIZE)]
+        bogus = Bogus(bogus_list=children)
+        tree_editor_view = BogusTreeView(bogus=bogus, hide_root=True,
+                                         virtual=True)
+        ui = tree_editor_view.edit_traits()
+        try:
+            editor, = ui.get_editors('bogus')
+            root = editor._tree.invisibleRootItem()
+            nose.tools.assert_equal(tree_model_editor.FETCH_SIZE,
+                                    root.childCount())
+
+            # Changes to children without items are applied to the pending
+            # children:
+            del bogus.bogus_list[-10:]
+            nose.tools.assert_equal(2 * tree_model_editor.FETCH_SIZE - 10,
+                                    len(root._pending))
+
+            # Changes to children with items are applied to the items:
+            bogus.bogus_list[0:2] = [Bogus()]
+            nose.tools.assert_equal(tree_model_editor.FETCH_SIZE - 1,
+                                    root.childCount())
+            nose.tools.assert_is(bogus.bogus_list[0],
+                                 editor.get_object(root.child(0)))
+        finally:
+            ui.dispose()
+
+
+@skip_if_not_qt4
+def test_tree_editor_deletes_children_ranges():
+    with store_exceptions_on_all_threads():
+        children = [Bogus() for i in range(10)]
+        bogus = Bogus(bogus_list=children)
+        tree_editor_view = BogusTreeView(bogus=bogus, hide_root=True)
+        ui = tree_editor_view.edit_traits()
+        try:
+            editor, = ui.get_editors('bogus')
+            root = editor._tree.invisibleRootItem()
+
+            del bogus.bogus_list[2:8]
+            nose.tools.assert_equal(4, root.childCount())
+            for i, child in enumerate(bogus.bogus_list):
+                nid = root.child(i)
+                nose.tools.assert_is(child, editor.get_object(nid))
+                nose.tools.assert_equal(i, editor._node_index(nid)[2])
+            for child in children[2:8]:
+                nose.tools.assert_not_in(id(child), editor._map)
+
+            bogus.bogus_list = []
+            nose.tools.assert_equal(0, root.childCount())
+            for child in children:
+                nose.tools.assert_not_in(id(child), editor._map)
+        finally:
+            ui.dispose()
+
+
+@skip_if_not_qt4
+def test_tree_editor_replace_children_reuses_nodes():
+    with store_exceptions_on_all_threads():
+        children = [Bogus(bogus_list=[Bogus()]) for i in range(5)]
+        bogus = Bogus(bogus_list=children)
+        tree_editor_view = BogusTreeView(bogus=bogus, hide_root=True)
+        ui = tree_editor_view.edit_traits()
+        try:
+            editor, = ui.get_editors('bogus')
+            root = editor._tree.invisibleRootItem()
+            nids = editor._nodes_for(root)
+            nids[3].setExpanded(True)
+
+            # Surviving children keep their relative order:
+            new_child = Bogus()
+            bogus.bogus_list = [children[0], new_child] + children[3:]
+            nose.tools.assert_equal(4, root.childCount())
+            nose.tools.assert_is(nids[0], root.child(0))
+            nose.tools.assert_is(new_child, editor.get_object(root.child(1)))
+            nose.tools.assert_is(nids[3], root.child(2))
+            nose.tools.assert_true(root.child(2).isExpanded())
+
+            # Surviving children are moved:
+            bogus.bogus_list = [children[4], children[3]]
+            nose.tools.assert_is(nids[4], root.child(0))
+            nose.tools.assert_is(nids[3], root.child(1))
+            nose.tools.assert_true(root.child(1).isExpanded())
+            nose.tools.assert_not_in(id(children[0]), editor._map)
+        finally:
+            ui.dispose()
+
+
+@skip_if_not_qt4
+def test_tree_editor_listens_to_visible_nodes_only():
+    with store_exceptions_on_all_threads():
+        great_grandchild = Bogus()
+        grandchild = Bogus(bogus_list=[great_grandchild])
+        child = Bogus(bogus_list=[grandchild])
+        bogus = Bogus(bogus_list=[child])
+        tree_editor_view = BogusTreeView(bogus=bogus, hide_root=True)
+        ui = tree_editor_view.edit_traits()
+        try:
+            editor, = ui.get_editors('bogus')
+            nid = editor._tree.invisibleRootItem().child(0)
+
+            # The collapsed child is visible, but not its own children:
+            notifiers_list = child.trait('bogus_list')._notifiers(False)
+            nose.tools.assert_equal(1, len(notifiers_list))
+            notifiers_list = grandchild.trait('bogus_list')._notifiers(False)
+            nose.tools.assert_equal(0, len(notifiers_list))
+
+            nid.setExpanded(True)
+            nid.child(0).setExpanded(True)
+            notifiers_list = grandchild.trait('bogus_list')._notifiers(False)
+            nose.tools.assert_equal(1, len(notifiers_list))
+            notifiers_list = great_grandchild.trait(
+                'bogus_list')._notifiers(False)
+            nose.tools.assert_equal(1, len(notifiers_list))
+
+            # The children of the collapsed (but visible) node are still
+            # listened to, but not the hidden nodes below them:
+            nid.setExpanded(False)
+            notifiers_list = grandchild.trait('bogus_list')._notifiers(False)
+            nose.tools.assert_equal(1, len(notifiers_list))
+            notifiers_list = great_grandchild.trait(
+                'bogus_list')._notifiers(False)
+            nose.tools.assert_equal(0, len(notifiers_list))
+
+            # Changes made while the node was collapsed are shown when it is
+            # expanded again, including the ones of hidden nodes:
+            child.bogus_list.append(Bogus())
+            great_grandchild.bogus_list.append(Bogus())
+            nid.setExpanded(True)
+            nose.tools.assert_equal(2, nid.childCount())
+            nose.tools.assert_is(child.bogus_list[1],
+                                 editor.get_object(nid.child(1)))
+            nose.tools.assert_equal(1, nid.child(0).child(0).childCount())
+        finally:
+            ui.dispose()
+
+
+@skip_if_not_qt4
+def test_tree_editor_expands_again_without_reloading():
+    with store_exceptions_on_all_threads():
+        node = ChildrenCountingTreeNode(node_for=[Bogus],
+                                        children='bogus_list', label='=Bogus')
+        grandchildren = [Bogus(bogus_list=[Bogus()]) for i in range(3)]
+        child = Bogus(bogus_list=grandchildren)
+        tree_editor_view = BogusTreeView(bogus=Bogus(bogus_list=[child]))
+        view = View(Item('bogus', editor=TreeEditor(nodes=[node],
+                                                    hide_root=True,
+                                                    editable=False)))
+        ui = tree_editor_view.edit_traits(view=view)
+        try:
+            editor, = ui.get_editors('bogus')
+            nid = editor._tree.invisibleRootItem().child(0)
+            nid.setExpanded(True)
+            nid.setExpanded(False)
+
+            # Nothing changed while the node was collapsed:
+            node.calls = 0
+            nid.setExpanded(True)
+            nose.tools.assert_equal(0, node.calls)
+
+            # Only the hidden nodes, which were not listened to, are brought
+            # up to date:
+            nid.child(0).setExpanded(True)
+            nid.setExpanded(False)
+            node.calls = 0
+            nid.setExpanded(True)
+            nose.tools.assert_equal(1, node.calls)
+        finally:
+            ui.dispose()
+
+
+@skip_if_not_qt4
+def test_tree_editor_collapsed_node_gains_children():
+    with store_exceptions_on_all_threads():
+        child = Bogus()
+        bogus = Bogus(bogus_list=[child])
+        tree_editor_view = BogusTreeView(bogus=bogus, hide_root=True)
+        ui = tree_editor_view.edit_traits()
+        try:
+            editor, = ui.get_editors('bogus')
+            nid = editor._tree.invisibleRootItem().child(0)
+            nose.tools.assert_equal(0, nid.childCount())
+
+            # The collapsed node gets an expand indicator for its first child,
+            # and loses it with its last one:
+            child.bogus_list.append(Bogus())
+            nose.tools.assert_equal(1, nid.childCount())
+            nose.tools.assert_false(nid.isExpanded())
+
+            del child.bogus_list[:]
+            nose.tools.assert_equal(0, nid.childCount())
+        finally:
+            ui.dispose()
+
+
+@skip_if_not_qt4
+def test_tree_editor_loads_children_asynchronously():
+    with store_exceptions_on_all_threads():
+        child = Bogus(bogus_list=[Bogus(), Bogus()])
+        bogus = Bogus(bogus_list=[child])
+        tree_editor_view = BogusTreeView(bogus=bogus, hide_root=True)
+        view = tree_editor_view.default_traits_view()
+        view.content.content[0].editor.async_children = True
+        ui = tree_editor_view.edit_traits(view=view)
+        gui = GUI()
+        try:
+            editor, = ui.get_editors('bogus')
+            root = editor._tree.invisibleRootItem()
+            for i in range(100):
+                gui.process_events()
+                if root.childCount() > 0:
+                    break
+                time.sleep(0.05)
+            nid = root.child(0)
+
+            # A placeholder is shown until the children have been loaded:
+            nid.setExpanded(True)
+            nose.tools.assert_is_not_none(nid._placeholder)
+            for i in range(100):
+                gui.process_events()
+                if getattr(nid, '_placeholder', None) is None:
+                    break
+                time.sleep(0.05)
+            nose.tools.assert_equal(2, nid.childCount())
+            nose.tools.assert_is(child.bogus_list[0],
+                                 editor.get_object(nid.child(0)))
+
+            # Collapsing a node cancels the loading of its children:
+            cnid = nid.child(0)
+            cnid.setExpanded(True)
+            cnid.setExpanded(False)
+            nose.tools.assert_false(editor._loader.is_loading(id(cnid)))
+            nose.tools.assert_is_not_none(cnid._dummy)
+        finally:
+            ui.dispose()
+
+
+@skip_if_not_qt4
+def test_word_wrap_tree_editor_uses_single_delegate():
+    with store_exceptions_on_all_threads():
+        bogus = Bogus(bogus_list=[Bogus(), Bogus()])
+        tree_editor_view = BogusTreeView(bogus=bogus, hide_root=True)
+        view = tree_editor_view.default_traits_view()
+        view.content.content[0].editor.word_wrap = True
+        ui = tree_editor_view.edit_traits(view=view)
+        try:
+            editor, = ui.get_editors('bogus')
+            delegate = editor._tree.itemDelegate()
+            nose.tools.assert_is(editor._delegate, delegate)
+
+            bogus.bogus_list.append(Bogus())
+            nose.tools.assert_is(delegate, editor._tree.itemDelegate())
+
+            nid = editor._tree.invisibleRootItem().child(0)
+            delegate._layouts[id(nid)] = (100, None)
+            editor._set_label(nid, 'label')
+            nose.tools.assert_not_in(id(nid), delegate._layouts)
+        finally:
+            ui.dispose()
+
+
+class NamedTreeView(HasTraits):
+    """ A view of a tree of named objects, filtered by a text. """
+
+    root = Instance(Named)
+
+    text = Str
+
+    virtual = Bool
+
+    def default_traits_view(self):
+        nodes = [
+            TreeNode(node_for=[Named], children='children', label='name'),
+        ]
+        tree_editor = TreeEditor(nodes=nodes, hide_root=True, editable=False,
+                                 filter='text', virtual=self.virtual)
+
+        return View(Item(name='root', editor=tree_editor))
+
+
+def _test_tree_editor_filter(virtual=False):
+    with store_exceptions_on_all_threads():
+        alpha = Named(name='alpha', children=[Named(name='x')])
+        beta = Named(name='beta', children=[Named(name='alphabet')])
+        view = NamedTreeView(root=Named(name='root', children=[alpha, beta]),
+                             virtual=virtual)
+        ui = view.edit_traits()
+        try:
+            editor, = ui.get_editors('root')
+            _wait_for_index(editor._index)
+            root = editor._tree.invisibleRootItem()
+
+            view.text = 'alphab'
+            nose.tools.assert_true(root.child(0).isHidden())
+            nose.tools.assert_false(root.child(1).isHidden())
+            nose.tools.assert_true(root.child(1).isExpanded())
+            nose.tools.assert_false(root.child(1).child(0).isHidden())
+
+            view.text = ''
+            nose.tools.assert_false(root.child(0).isHidden())
+        finally:
+            ui.dispose()
+
+
+@skip_if_not_qt4
+def test_tree_editor_filter():
+    _test_tree_editor_filter()
+
+
+@skip_if_not_qt4
+def test_virtual_tree_editor_filter():
+    _test_tree_editor_filter(virtual=True)
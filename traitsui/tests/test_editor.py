@@ -0,0 +1,237 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+"""
+Test cases for the Editor base class.
+"""
+
+import threading
+import unittest
+
+from traits import trait_notifiers
+from traits.api import Any, HasTraits, Instance, Int, List
+
+from traitsui.editor import Editor
+from traitsui.editor_factory import EditorFactory
+from traitsui.handler import Handler
+from traitsui.ui import UI
+from traitsui.undo import UndoHistory
+from traitsui.view import View
+
+
+class Model(HasTraits):
+
+    value = Int
+
+
+class RecordingEditor(Editor):
+    """ Editor which records the values it is updated with.
+    """
+
+    values = List
+
+    def init(self, parent):
+        self.control = parent
+
+    def update_editor(self):
+        self.values.append(self.value)
+
+
+class TestMaxUpdateRate(unittest.TestCase):
+
+    def setUp(self):
+        # Record the calls made to the UI thread, so that they can be run
+        # later on by the test:
+        self.calls = []
+        self.old_ui_handler = trait_notifiers.ui_handler
+        self.old_ui_thread = trait_notifiers.ui_thread
+        trait_notifiers.set_ui_handler(self.record_call)
+
+        self.model = Model()
+        self.ui = UI(view=View(), context={'object': self.model},
+                     handler=Handler(), history=UndoHistory())
+
+    def tearDown(self):
+        trait_notifiers.ui_handler = self.old_ui_handler
+        trait_notifiers.ui_thread = self.old_ui_thread
+
+    def record_call(self, handler, *args):
+        self.calls.append((handler, args))
+
+    def run_calls(self):
+        calls, self.calls = self.calls, []
+        for handler, args in calls:
+            handler(*args)
+
+    def create_editor(self, rate):
+        editor = RecordingEditor(
+            None, factory=EditorFactory(max_update_rate=rate), ui=self.ui,
+            object=self.model, name='value')
+        editor.prepare('control')
+        del editor.values[:]
+        return editor
+
+    def set_values_in_thread(self, values):
+        def set_values():
+            for value in values:
+                self.model.value = value
+
+        thread = threading.Thread(target=set_values)
+        thread.start()
+        thread.join()
+
+    def test_changes_in_other_thread_are_coalesced(self):
+        editor = self.create_editor(1e6)
+        self.ui._undoable = self.ui.history.now
+
+        self.set_values_in_thread(range(1, 101))
+
+        self.assertEqual(len(self.calls), 1)
+        self.run_calls()
+        self.assertEqual(editor.values, [100])
+        self.assertEqual(editor.dropped_updates, 99)
+
+        # A single undo item covers all of the coalesced changes:
+        self.ui.history.undo()
+        self.assertEqual(self.model.value, 0)
+
+    def test_changes_in_ui_thread_are_not_coalesced(self):
+        editor = self.create_editor(1e6)
+
+        self.model.value = 1
+        self.model.value = 2
+
+        self.assertEqual(editor.values, [1, 2])
+        self.assertEqual(self.calls, [])
+
+    def test_unlimited_editor(self):
+        editor = self.create_editor(0.0)
+
+        self.set_values_in_thread(range(1, 11))
+        self.run_calls()
+
+        self.assertEqual(len(editor.values), 10)
+        self.assertEqual(editor.dropped_updates, 0)
+
+    def test_disposed_editor(self):
+        editor = self.create_editor(1e6)
+        self.set_values_in_thread([1, 2])
+
+        editor.dispose()
+        self.run_calls()
+        self.set_values_in_thread([3])
+
+        self.assertEqual(editor.values, [])
+        self.assertEqual(self.calls, [])
+
+
+class Child(HasTraits):
+
+    value = Int
+
+    values = List(Int)
+
+
+class Parent(HasTraits):
+
+    child = Instance(Child, ())
+
+
+class PlainParent(object):
+
+    def __init__(self):
+        self.child = Child()
+
+
+class SyncEditor(RecordingEditor):
+    """ Editor with traits which can be synchronized with user traits.
+    """
+
+    selected = Any
+
+    selection = List(Int)
+
+    changes = Int
+
+    def _selected_changed(self):
+        self.changes += 1
+
+
+class TestSyncValue(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+        self.parent = Parent()
+        self.plain = PlainParent()
+        self.ui = UI(view=View(), handler=Handler(), context={
+            'object': self.model, 'parent': self.parent, 'plain': self.plain})
+        self.editor = SyncEditor(None, factory=EditorFactory(), ui=self.ui,
+                                 object=self.model, name='value')
+
+    def tearDown(self):
+        self.editor.dispose()
+
+    def test_context_object_trait(self):
+        self.editor.sync_value('value', 'selected')
+        self.assertEqual(self.editor.selected, 0)
+
+        self.model.value = 3
+        self.assertEqual(self.editor.selected, 3)
+
+        self.editor.selected = 4
+        self.assertEqual(self.model.value, 4)
+        self.assertEqual(self.editor.changes, 3)
+
+    def test_intermediate_link_replaced(self):
+        self.editor.sync_value('parent.child.value', 'selected')
+        old_child = self.parent.child
+        self.editor.selected = 1
+        self.assertEqual(old_child.value, 1)
+
+        self.parent.child = Child(value=5)
+        self.assertEqual(self.editor.selected, 5)
+
+        self.editor.selected = 6
+        self.assertEqual(self.parent.child.value, 6)
+        self.assertEqual(old_child.value, 1)
+
+    def test_to_only_non_traits_link(self):
+        self.editor.selected = 2
+        self.editor.sync_value('plain.child.value', 'selected', 'to')
+        self.assertEqual(self.plain.child.value, 2)
+
+        self.plain.child = Child()
+        self.editor.selected = 7
+        self.assertEqual(self.plain.child.value, 7)
+
+    def test_list_items(self):
+        self.parent.child.values = [1, 2, 3]
+        self.editor.sync_value('parent.child.values', 'selection',
+                               is_list=True)
+
+        self.parent.child.values[1] = 5
+        self.assertEqual(self.editor.selection, [1, 5, 3])
+
+        self.editor.selection[0:1] = [4, 4]
+        self.assertEqual(self.parent.child.values, [4, 4, 5, 3])
+
+    def test_dispose_removes_listeners(self):
+        self.editor.sync_value('parent.child.value', 'selected')
+
+        self.editor.dispose()
+        self.parent.child = Child(value=5)
+        self.parent.child.value = 6
+
+        self.assertEqual(self.editor.selected, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+"""
+Test cases for the helper functions.
+"""
+
+import unittest
+
+from traitsui.helper import (
+    ExpressionCache, compile_expression, expression_cache)
+
+
+class TestExpressionCache(unittest.TestCase):
+
+    def test_compile_caches_code(self):
+        cache = ExpressionCache(size=10)
+
+        code = cache.compile('a + 1')
+
+        self.assertEqual(eval(code, {}, {'a': 1}), 2)
+        self.assertIs(cache.compile('a + 1'), code)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_least_recently_used_is_discarded(self):
+        cache = ExpressionCache(size=2)
+        first = cache.compile('1')
+        cache.compile('2')
+        cache.compile('1')
+
+        cache.compile('3')
+
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.compile('1'), first)
+        self.assertEqual(cache.misses, 3)
+        cache.compile('2')
+        self.assertEqual(cache.misses, 4)
+
+    def test_code_is_returned_unchanged(self):
+        cache = ExpressionCache()
+        code = compile('1', '<string>', 'eval')
+
+        self.assertIs(cache.compile(code), code)
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+
+    def test_syntax_error(self):
+        cache = ExpressionCache()
+
+        with self.assertRaises(SyntaxError):
+            cache.compile('a +')
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        cache = ExpressionCache()
+        cache.compile('1')
+
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+
+    def test_shared_cache(self):
+        hits = expression_cache.hits
+        compile_expression('object.name')
+
+        compile_expression('object.name')
+
+        self.assertEqual(expression_cache.hits, hits + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+"""
+Test cases for the UI profiler.
+"""
+
+import json
+import unittest
+
+from traits import trait_notifiers
+from traits.api import HasTraits, Int, List
+
+from traitsui.editor import Editor
+from traitsui.editor_factory import EditorFactory
+from traitsui.handler import Handler
+from traitsui import profiler
+from traitsui.profiler import (begin_profiled, count_event, end_profiled,
+                                profile_ui, profiled)
+from traitsui.toolkit import toolkit
+from traitsui import ui as ui_module
+from traitsui.ui import UI
+from traitsui.view import View
+
+from traitsui.tests._tools import skip_if_not_null
+
+
+class Model(HasTraits):
+
+    value = Int
+
+
+class RecordingEditor(Editor):
+    """ Editor which records the values it is updated with.
+    """
+
+    values = List
+
+    def init(self, parent):
+        self.control = parent
+
+    def update_editor(self):
+        self.values.append(self.value)
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        # Deliver the changes to the editors directly if there is no UI
+        # handler:
+        self.old_ui_handler = trait_notifiers.ui_handler
+        if self.old_ui_handler is None:
+            trait_notifiers.set_ui_handler(
+                lambda handler, *args: handler(*args))
+
+        self.model = Model()
+        self.ui = UI(view=View(), context={'object': self.model},
+                     handler=Handler())
+
+    def tearDown(self):
+        trait_notifiers.set_ui_handler(self.old_ui_handler)
+
+    def create_editor(self):
+        editor = RecordingEditor(None, factory=EditorFactory(), ui=self.ui,
+                                 object=self.model, name='value')
+        editor.prepare('control')
+        return editor
+
+    def test_inactive(self):
+        self.assertIsNone(profiler.active_profiler)
+        with profiled('Item', 'value') as node:
+            count_event('listeners')
+
+        self.assertIsNone(node)
+
+    def test_tree(self):
+        with profile_ui() as ui_profiler:
+            self.assertIs(profiler.active_profiler, ui_profiler)
+            with profiled('View', 'view'):
+                with profiled('Item', 'value'):
+                    editor = self.create_editor()
+                with profiled('Item', 'other'):
+                    count_event('listeners', n=2)
+
+        self.assertIsNone(profiler.active_profiler)
+        tree = ui_profiler.report()['tree']
+        view, = tree['children']
+        self.assertEqual((view['kind'], view['name']), ('View', 'view'))
+        self.assertEqual([item['name'] for item in view['children']],
+                         ['value', 'other'])
+
+        value, other = view['children']
+        prepare, = value['children']
+        self.assertEqual(prepare['kind'], 'prepare')
+        self.assertEqual(prepare['name'],
+                         'traitsui.tests.test_profiler.RecordingEditor')
+        self.assertEqual(prepare['counters'],
+                         {'listeners': 1, 'update_editor': 1})
+        self.assertEqual([child['kind'] for child in prepare['children']],
+                         ['init'])
+        self.assertEqual(other['counters'], {'listeners': 2})
+        self.assertTrue(tree['time'] >= view['time'] >= value['time'])
+        editor.dispose()
+
+    def test_updates_after_construction(self):
+        editor = self.create_editor()
+
+        with profile_ui() as ui_profiler:
+            self.model.value = 1
+            self.model.value = 2
+        self.model.value = 3
+
+        report = ui_profiler.report()
+        self.assertEqual(report['counters']['_update_editor'], 2)
+        self.assertEqual(report['counters']['update_editor'], 2)
+        stats = report['editors'][
+            'traitsui.tests.test_profiler.RecordingEditor']
+        self.assertEqual(stats['update_editor'], 2)
+        self.assertEqual(report['tree']['counters']['update_editor'], 2)
+        editor.dispose()
+
+    def test_condition_evaluations(self):
+        editor = self.create_editor()
+        self.ui.add_visible('value > 0', editor)
+        self.ui.add_enabled('value > 1', editor)
+
+        with profile_ui() as ui_profiler:
+            self.ui._do_evaluate_when()
+
+        self.assertEqual(ui_profiler.report()['counters']['conditions'], 2)
+        editor.dispose()
+
+    def test_json_and_summary(self):
+        with profile_ui() as ui_profiler:
+            with profiled('View', 'view'):
+                editor = self.create_editor()
+
+        data = json.loads(ui_profiler.to_json())
+        self.assertEqual(data['tree']['children'][0]['name'], 'view')
+
+        summary = ui_profiler.summary()
+        self.assertIn("View 'view'", summary)
+        self.assertIn(
+            'traitsui.tests.test_profiler.RecordingEditor: 1 created',
+            summary)
+        self.assertIn('listeners=1', summary)
+
+        summary = ui_profiler.summary(min_time=1e6)
+        self.assertNotIn("View 'view'", summary)
+        editor.dispose()
+
+    @skip_if_not_null
+    def test_view_node_ends_when_prepared(self):
+        # The null toolkit does not support hooking events:
+        class HookingToolkit(type(toolkit())):
+
+            def hook_events(self, *args, **kw):
+                pass
+
+        hooking_toolkit = HookingToolkit()
+        with profile_ui() as ui_profiler:
+            node = begin_profiled('View', 'view')
+            self.ui._profile_node = node
+            old_toolkit = ui_module.toolkit
+            ui_module.toolkit = lambda: hooking_toolkit
+            try:
+                self.ui.prepare_ui()
+            finally:
+                ui_module.toolkit = old_toolkit
+            # Events after construction (e.g. in a modal dialog's event loop)
+            # are not attributed to the View:
+            count_event('update_editor')
+            end_profiled(node)
+
+        tree = ui_profiler.report()['tree']
+        view, = tree['children']
+        self.assertNotIn('update_editor', view['counters'])
+        self.assertEqual(tree['counters']['update_editor'], 1)
+        self.assertIsNone(self.ui._profile_node)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,10 +17,18 @@
 Test cases for the UI object.
 """
 
+from traits import trait_notifiers
 from traits.has_traits import HasTraits
-from traits.trait_types import Str, Int
+from traits.trait_types import Bool, Int, List, Str
+from traits.traits import Property
 import traitsui
+from traitsui.editor import Editor
+from traitsui.editor_factory import EditorFactory
+from traitsui.group import Group
+from traitsui.handler import Handler
 from traitsui.item import Item
+from traitsui.ui import UI
+from traitsui.undo import UndoHistory
 from traitsui.view import View
 
 from traitsui.tests._tools import *
@@ -196,3 +204,427 @@ def test_destroy_after_ok_qt():
     for c in ui_children:
         if isinstance(c, qt.QtGui.QWidget):
             nose.tools.assert_equal(c.deleteLater._n_calls, 1)
+
+
+class WhenModel(HasTraits):
+    """Model used by 'visible_when' and 'enabled_when' conditions."""
+
+    my_int = Int
+    my_str = Str
+    my_list = List
+    other = Int
+
+
+class DummyEditor(HasTraits):
+    """Stand-in for an editor controlled by conditions."""
+
+    visible = Bool(True)
+    enabled = Bool(True)
+    checked = Bool(True)
+
+
+def test_when_condition_names():
+    code, editor, names = traitsui.ui.when_condition(
+        "my_int > 0 and object.my_str != '' and len(my_list)", None)
+
+    nose.tools.assert_equal(names, {'my_int': [None],
+                                    'object': ['my_str'],
+                                    'len': [None],
+                                    'my_list': [None]})
+    nose.tools.assert_true(eval(code, {}, {'my_int': 1, 'my_list': [1],
+                                           'object': WhenModel(my_str='a')}))
+
+    code, editor, names = traitsui.ui.when_condition(
+        "object.other and object.trait_get()", None)
+
+    nose.tools.assert_equal(names, {'object': ['other', None]})
+
+
+class PropertyModel(HasTraits):
+    """Model with properties that count how often they are computed."""
+
+    my_int = Int(3)
+
+    cheap = Property(depends_on='my_int')
+
+    expensive = Property(depends_on='my_int')
+
+    computed = List
+
+    def _get_cheap(self):
+        self.computed.append('cheap')
+        return self.my_int
+
+    def _get_expensive(self):
+        self.computed.append('expensive')
+        return self.my_int * 1000
+
+
+def test_eval_when_computes_used_traits_only():
+    model = PropertyModel()
+    ui = UI(view=View(), context={'object': model}, handler=Handler())
+
+    nose.tools.assert_true(ui.eval_when('cheap > 2 and cheap < 4'))
+    nose.tools.assert_equal(model.computed, ['cheap'])
+
+    nose.tools.assert_true(ui.eval_when('object is not None and ui'))
+    comprehension = 'len([x for x in range(my_int)]) > 3'
+    nose.tools.assert_false(ui.eval_when(comprehension))
+    nose.tools.assert_equal(model.computed, ['cheap'])
+
+
+def test_lazy_context_names():
+    model = PropertyModel()
+    ui = UI(view=View(), context={'object': model}, handler=Handler())
+    context = ui._get_context(ui.context)
+
+    nose.tools.assert_is(context['ui'], ui)
+    nose.tools.assert_is(context['object'], model)
+    nose.tools.assert_equal(context['expensive'], 3000)
+    nose.tools.assert_equal(context['expensive'], 3000)
+    nose.tools.assert_equal(model.computed, ['expensive'])
+    with nose.tools.assert_raises(KeyError):
+        context['no_such_trait']
+    nose.tools.assert_equal(eval('len(computed)', globals(), context), 1)
+
+
+def _direct_ui_handler(handler, *args):
+    handler(*args)
+
+
+def test_when_listeners_only_dependent_traits():
+    # Condition listeners are dispatched to the UI thread:
+    old_ui_handler = trait_notifiers.ui_handler
+    if old_ui_handler is None:
+        trait_notifiers.set_ui_handler(_direct_ui_handler)
+    try:
+        _test_when_listeners_only_dependent_traits()
+    finally:
+        trait_notifiers.set_ui_handler(old_ui_handler)
+
+
+def _test_when_listeners_only_dependent_traits():
+    model = WhenModel()
+    ui = UI(view=View(), context={'object': model}, handler=Handler())
+    int_editor = DummyEditor()
+    list_editor = DummyEditor()
+    any_editor = DummyEditor()
+    ui.add_visible('my_int > 0', int_editor)
+    ui.add_enabled('len(object.my_list) > 0', list_editor)
+    ui.add_visible('object.trait_get() is not None', any_editor)
+
+    ui._add_when_listeners()
+    ui._do_evaluate_when(at_init=True)
+    nose.tools.assert_false(int_editor.visible)
+    nose.tools.assert_false(list_editor.enabled)
+
+    # Changes to unrelated traits only re-evaluate conditions using any
+    # trait of the object:
+    any_editor.visible = False
+    model.other = 1
+    nose.tools.assert_true(any_editor.visible)
+    nose.tools.assert_false(int_editor.visible)
+
+    int_editor.visible = True
+    model.my_str = 'changed'
+    nose.tools.assert_true(int_editor.visible)
+
+    model.my_int = 1
+    nose.tools.assert_true(int_editor.visible)
+    model.my_int = 0
+    nose.tools.assert_false(int_editor.visible)
+
+    model.my_list.append(1)
+    nose.tools.assert_true(list_editor.enabled)
+
+    ui._remove_when_listeners()
+    model.my_int = 1
+    nose.tools.assert_false(int_editor.visible)
+
+
+class UndeclaredPropertyModel(HasTraits):
+    """Model with a property which does not declare its dependencies."""
+
+    x = Int
+
+    ok = Property
+
+    def _get_ok(self):
+        return self.x > 1
+
+
+def test_when_listeners_property_without_dependencies():
+    old_ui_handler = trait_notifiers.ui_handler
+    if old_ui_handler is None:
+        trait_notifiers.set_ui_handler(_direct_ui_handler)
+    try:
+        _test_when_listeners_property_without_dependencies()
+    finally:
+        trait_notifiers.set_ui_handler(old_ui_handler)
+
+
+def _test_when_listeners_property_without_dependencies():
+    model = UndeclaredPropertyModel()
+    ui = UI(view=View(), context={'object': model}, handler=Handler())
+    main_editor = DummyEditor()
+    object_editor = DummyEditor()
+    ui.add_enabled('ok', main_editor)
+    ui.add_visible('object.ok', object_editor)
+
+    ui._add_when_listeners()
+    ui._do_evaluate_when(at_init=True)
+    nose.tools.assert_false(main_editor.enabled)
+    nose.tools.assert_false(object_editor.visible)
+
+    # The property does not notify its changes, so the conditions are
+    # re-evaluated when any trait of the object changes:
+    model.x = 5
+    nose.tools.assert_true(main_editor.enabled)
+    nose.tools.assert_true(object_editor.visible)
+
+    ui._remove_when_listeners()
+
+
+class DeferringToolkit(object):
+    """Toolkit stand-in which records the calls scheduled by a UI."""
+
+    def __init__(self):
+        self.later = []
+        self.suspended = 0
+
+    def invoke_later(self, delay, callable, *args, **kw_args):
+        self.later.append((delay, callable, args, kw_args))
+
+    def suspend_updates(self, control):
+        self.suspended += 1
+
+    def resume_updates(self, control):
+        self.suspended -= 1
+
+    def run_later(self):
+        later, self.later = self.later, []
+        for delay, callable, args, kw_args in later:
+            callable(*args, **kw_args)
+
+
+def test_when_changes_are_coalesced():
+    old_ui_handler = trait_notifiers.ui_handler
+    if old_ui_handler is None:
+        trait_notifiers.set_ui_handler(_direct_ui_handler)
+    old_toolkit = traitsui.ui.toolkit
+    deferring_toolkit = DeferringToolkit()
+    traitsui.ui.toolkit = lambda: deferring_toolkit
+    try:
+        _test_when_changes_are_coalesced(deferring_toolkit)
+    finally:
+        traitsui.ui.toolkit = old_toolkit
+        trait_notifiers.set_ui_handler(old_ui_handler)
+
+
+def _test_when_changes_are_coalesced(deferring_toolkit):
+    model = WhenModel()
+    ui = UI(view=View(), context={'object': model}, handler=Handler())
+    int_editor = DummyEditor()
+    str_editor = DummyEditor()
+    ui.add_visible('my_int > 0', int_editor)
+    ui.add_enabled("my_str == 'a'", str_editor)
+    ui._add_when_listeners()
+
+    for i in range(100):
+        model.my_int = i
+        model.my_str = 'ab'[i % 2]
+
+    # A single re-evaluation is scheduled for all of the changes:
+    nose.tools.assert_equal(len(deferring_toolkit.later), 1)
+    nose.tools.assert_equal(deferring_toolkit.later[0][0], 0.0)
+    nose.tools.assert_true(str_editor.enabled)
+
+    deferring_toolkit.run_later()
+    nose.tools.assert_true(int_editor.visible)
+    nose.tools.assert_false(str_editor.enabled)
+    nose.tools.assert_equal(deferring_toolkit.suspended, 0)
+
+    # The next re-evaluation is delayed by the 'when_interval':
+    ui.when_interval = 10.0
+    model.my_int = 0
+    delay = deferring_toolkit.later[0][0]
+    nose.tools.assert_true(9.0 < delay <= 10.0)
+
+    # Pending re-evaluations are discarded with the conditions:
+    ui._remove_when_listeners()
+    deferring_toolkit.run_later()
+    nose.tools.assert_true(int_editor.visible)
+
+
+class CountingEditor(Editor):
+    """Editor which counts its updates."""
+
+    updates = Int
+
+    def init(self, parent):
+        self.control = parent
+
+    def update_editor(self):
+        self.updates += 1
+
+
+def test_batch_updates():
+    old_ui_handler = trait_notifiers.ui_handler
+    if old_ui_handler is None:
+        trait_notifiers.set_ui_handler(_direct_ui_handler)
+    try:
+        _test_batch_updates()
+    finally:
+        trait_notifiers.set_ui_handler(old_ui_handler)
+
+
+def _test_batch_updates():
+    model = WhenModel()
+    ui = UI(view=View(), context={'object': model}, handler=Handler(),
+            history=UndoHistory())
+    factory = EditorFactory()
+    int_editor = CountingEditor(None, factory=factory, ui=ui, object=model,
+                                name='my_int')
+    int_editor.prepare('control')
+    str_editor = CountingEditor(None, factory=factory, ui=ui, object=model,
+                                name='my_str')
+    str_editor.prepare('control')
+    when_editor = DummyEditor()
+    ui.add_visible('my_int > 0', when_editor)
+    ui._add_when_listeners()
+    ui._do_evaluate_when(at_init=True)
+
+    with ui.batch_updates():
+        for i in range(100):
+            model.my_int = i
+        with ui.batch_updates():
+            model.my_str = 'changed'
+        nose.tools.assert_equal(int_editor.updates, 1)
+        nose.tools.assert_equal(str_editor.updates, 1)
+        nose.tools.assert_false(when_editor.visible)
+
+    nose.tools.assert_equal(int_editor.updates, 2)
+    nose.tools.assert_equal(str_editor.updates, 2)
+    nose.tools.assert_true(when_editor.visible)
+    nose.tools.assert_equal(ui._undoable, -1)
+
+    # All of the changes are grouped into a single undo transaction:
+    nose.tools.assert_equal(ui.history.now, 1)
+    ui.history.undo()
+    nose.tools.assert_equal(model.my_int, 0)
+    nose.tools.assert_equal(model.my_str, '')
+
+    model.my_int = 5
+    nose.tools.assert_equal(int_editor.updates, 4)
+
+
+class PrefsEditor(CountingEditor):
+    """Editor which saves its update count as its preferences."""
+
+    def save_prefs(self):
+        return {'updates': self.updates}
+
+    def restore_prefs(self, prefs):
+        self.updates = prefs['updates']
+
+
+def test_editor_indices():
+    model = WhenModel()
+    ui = UI(view=View(), context={'object': model}, handler=Handler())
+    factory = EditorFactory()
+    editors = [
+        PrefsEditor(None, factory=factory, ui=ui, object=model,
+                    name='my_int', item=Item('my_int', id='first')),
+        PrefsEditor(None, factory=factory, ui=ui, object=model,
+                    name='my_int', item=Item('my_int')),
+        PrefsEditor(None, factory=factory, ui=ui, object=model,
+                    name='my_str', item=Item('my_str', id='second')),
+    ]
+    # Bind the editors the way the toolkit panels do:
+    for editor in editors:
+        ui.info.bind(editor.item.id or editor.name, editor, editor.item.id)
+        ui._editors.append(editor)
+
+    # A group editor is bound to its id without being in the editors list:
+    group_editor = PrefsEditor(None, factory=factory, ui=ui, object=model,
+                               name='other')
+    ui.info.bind('group', group_editor)
+
+    nose.tools.assert_equal(ui.get_editors('my_int'), editors[:2])
+    nose.tools.assert_equal(ui.get_editors('my_str'), editors[2:])
+    nose.tools.assert_equal(ui.get_editors('other'), [])
+
+    editors[0].updates = 3
+    prefs = ui.get_prefs()
+    nose.tools.assert_equal(prefs['first'], {'updates': 3})
+    nose.tools.assert_equal(prefs['second'], {'updates': 0})
+    nose.tools.assert_equal(prefs['group'], {'updates': 0})
+    nose.tools.assert_not_in('my_int', prefs)
+
+    ui.set_prefs({'first': {'updates': 1}, 'second': {'updates': 2},
+                  'group': {'updates': 4}})
+    nose.tools.assert_equal(editors[0].updates, 1)
+    nose.tools.assert_equal(editors[2].updates, 2)
+    nose.tools.assert_equal(group_editor.updates, 4)
+
+    # The name index follows the removal and replacement of editors:
+    ui._editors.remove(editors[0])
+    nose.tools.assert_equal(ui.get_editors('my_int'), editors[1:2])
+
+    ui._editors = editors[2:]
+    nose.tools.assert_equal(ui.get_editors('my_int'), [])
+    nose.tools.assert_equal(ui.get_editors('my_str'), editors[2:])
+
+
+def test_deferred_construction():
+    old_ui_handler = trait_notifiers.ui_handler
+    if old_ui_handler is None:
+        trait_notifiers.set_ui_handler(_direct_ui_handler)
+    try:
+        _test_deferred_construction()
+    finally:
+        trait_notifiers.set_ui_handler(old_ui_handler)
+
+
+def _test_deferred_construction():
+    model = WhenModel()
+    ui = UI(view=View(lazy=True), context={'object': model},
+            handler=Handler())
+    built = []
+
+    def builder(name, id):
+        def build():
+            editor = PrefsEditor(None, factory=EditorFactory(), ui=ui,
+                                 object=model, name=name,
+                                 item=Item(name, id=id))
+            ui.info.bind(id or name, editor, id)
+            ui._editors.append(editor)
+            ui.add_visible('my_int > 0', editor)
+            built.append(editor)
+        return build
+
+    build_int = builder('my_int', 'int_id')
+    ui.add_deferred(build_int, [Item('my_int', id='int_id')])
+    ui.add_deferred(builder('my_str', ''), [Group(Item('my_str'))])
+    ui.set_prefs({'int_id': {'updates': 5}})
+    ui.info.initialized = True
+
+    # The preferences of editors which are not built yet are kept:
+    nose.tools.assert_equal(ui.get_prefs()['int_id'], {'updates': 5})
+    nose.tools.assert_false(hasattr(ui.info, 'other'))
+    nose.tools.assert_equal(built, [])
+
+    # Looking up an editor builds it, and finishes its set-up:
+    int_editor, = ui.get_editors('my_int')
+    nose.tools.assert_equal(built, [int_editor])
+    nose.tools.assert_equal(int_editor.updates, 5)
+    nose.tools.assert_false(int_editor.visible)
+    nose.tools.assert_false(ui.run_deferred(build_int))
+
+    str_editor = ui.info.my_str
+    nose.tools.assert_equal(built, [int_editor, str_editor])
+    nose.tools.assert_equal(ui._deferred, [])
+
+    model.my_int = 1
+    nose.tools.assert_true(int_editor.visible)
+    nose.tools.assert_true(str_editor.visible)
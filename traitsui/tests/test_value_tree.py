@@ -0,0 +1,195 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#------------------------------------------------------------------------------
+"""
+Test cases for the value tree nodes.
+"""
+
+import unittest
+
+import numpy as np
+
+from traits.api import Any, HasTraits, Int
+
+from traitsui.api import Item, ValueEditor, View
+from traitsui import value_tree
+from traitsui.value_tree import (
+    ArrayNode, BoolNode, ClassNode, DictNode, FloatNode, IntNode, ListNode,
+    MoreNode, ObjectNode, SetNode, SingleValueTreeNodeObject, StringNode,
+    TraitsNode, node_class_for)
+from traitsui.tests._tools import skip_if_null
+
+
+class ValueModel(HasTraits):
+
+    value = Any
+
+    traits_view = View(Item('value', editor=ValueEditor()))
+
+
+class TestPagedChildren(unittest.TestCase):
+
+    def setUp(self):
+        self.old_page_size = value_tree.PAGE_SIZE
+        value_tree.PAGE_SIZE = 4
+
+    def tearDown(self):
+        value_tree.PAGE_SIZE = self.old_page_size
+
+    def test_first_page(self):
+        node = ListNode(value=range(10))
+
+        children = node.tno_get_children(None)
+
+        self.assertEqual(len(children), 5)
+        self.assertEqual(children[3].value, 3)
+        self.assertIsInstance(children[-1], MoreNode)
+        self.assertEqual(children[-1].tno_get_label(None),
+                         '... more (6 remaining)')
+
+    def test_no_more_node_for_small_values(self):
+        node = ListNode(value=range(4))
+
+        children = node.tno_get_children(None)
+
+        self.assertEqual([child.value for child in children], range(4))
+
+    def test_show_more(self):
+        node = ListNode(value=range(10))
+        replaced = []
+        node.tno_when_children_replaced(None, replaced.append, False)
+        first = node.tno_get_children(None)
+
+        first[-1].tno_dclick(None)
+        second = node.tno_get_children(None)
+
+        self.assertEqual(replaced, [node])
+        self.assertEqual(len(second), 9)
+        self.assertEqual(second[-1].value, 2)
+        # The nodes of the first page are reused:
+        for old, new in zip(first[:4], second[:4]):
+            self.assertIs(old, new)
+
+        node.show_more()
+        third = node.tno_get_children(None)
+        self.assertEqual([child.tno_get_label(None) for child in third],
+                         ['[%d]: %d' % (i, i) for i in range(10)])
+
+    def test_dict_pages_sorted_keys(self):
+        node = DictNode(value=dict((i, str(i)) for i in range(10)))
+
+        children = node.tno_get_children(None)
+
+        self.assertEqual([child.name for child in children[:4]],
+                         ['[0]', '[1]', '[2]', '[3]'])
+        self.assertEqual(children[-1].value, 6)
+
+    def test_dict_show_more_after_removing_key(self):
+        value = dict((i, str(i)) for i in range(10))
+        node = DictNode(value=value)
+        node.tno_get_children(None)
+
+        del value[5]
+        node.show_more()
+        children = node.tno_get_children(None)
+
+        self.assertEqual(children[5].name, '[5]')
+        self.assertIsNone(children[5].value)
+
+    def test_set_pages(self):
+        node = SetNode(value=set(range(10)))
+
+        node.show_more()
+        node.show_more()
+        children = node.tno_get_children(None)
+
+        self.assertEqual(set(child.value for child in children),
+                         set(range(10)))
+
+    def test_array_pages_rows(self):
+        node = ArrayNode(value=np.zeros((10, 3)))
+
+        children = node.tno_get_children(None)
+
+        self.assertEqual(len(children), 5)
+        self.assertEqual(children[0].tno_get_label(None), '[0]: Array(3)')
+        self.assertFalse(ArrayNode(value=np.array(1.0)).tno_has_children(None))
+
+
+class OrderedDictLike(dict):
+    pass
+
+
+class OldStyle:
+    pass
+
+
+class TestNodeClassFor(unittest.TestCase):
+
+    def test_basic_types(self):
+        self.assertIs(node_class_for(True), BoolNode)
+        self.assertIs(node_class_for(1), IntNode)
+        self.assertIs(node_class_for(u'text'), StringNode)
+        self.assertIs(node_class_for(ValueModel()), TraitsNode)
+
+    def test_subclasses_use_mro(self):
+        self.assertIs(node_class_for(OrderedDictLike()), DictNode)
+        self.assertIs(node_class_for(np.float64(1.0)), FloatNode)
+        self.assertIs(node_class_for(np.zeros(3).view(np.matrix)), ArrayNode)
+
+    def test_other_values(self):
+        self.assertIs(node_class_for(OldStyle()), ObjectNode)
+        self.assertIs(node_class_for(OldStyle), ClassNode)
+        self.assertIs(node_class_for(ValueModel), ClassNode)
+        self.assertIs(node_class_for(object()), ObjectNode)
+
+    def test_readonly_is_inherited(self):
+        node = ListNode(value=[1], readonly=True)
+
+        child, = node.tno_get_children(None)
+
+        self.assertTrue(child.readonly)
+        self.assertIs(child.parent, node)
+
+
+class CountingNode(SingleValueTreeNodeObject):
+
+    count = Int
+
+    def format_value(self, value):
+        self.count += 1
+        return repr(value)
+
+
+class TestLazyLabels(unittest.TestCase):
+
+    def test_value_formatted_once(self):
+        node = CountingNode(value=1)
+        self.assertEqual(node.count, 0)
+
+        node.tno_get_label(None)
+        node.tno_get_label(None)
+        self.assertEqual(node.count, 1)
+
+        node.value = 2
+        self.assertEqual(node.tno_get_label(None), '2')
+        self.assertEqual(node.count, 2)
+
+
+@skip_if_null
+def test_value_editor_large_list():
+    model = ValueModel(value=range(100000))
+    ui = model.edit_traits()
+    ui.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,6 +17,7 @@
 Test the layout when element appear and disappear with visible_when.
 """
 
+from pyface.gui import GUI
 from traits.has_traits import HasTraits
 from traits.trait_types import Enum, Bool, Str
 
@@ -76,9 +77,12 @@ def test_visible_when_layout():
         dialog = VisibleWhenProblem()
         ui = dialog.edit_traits()
 
-        # have the dialog switch from group one to two and back to one
+        # have the dialog switch from group one to two and back to one (the
+        # conditions are re-evaluated at the next event loop iteration)
         dialog.which = 'two'
+        GUI.process_events()
         dialog.which = 'one'
+        GUI.process_events()
 
         # the size of the window should not be larger than the largest
         # combination (in this case, the `text_group` plus the `which` item
@@ -88,6 +92,34 @@ def test_visible_when_layout():
         nose.tools.assert_less(size[1], _TEXT_HEIGHT + 150)
 
 
+@skip_if_not_qt4
+def test_lazy_hidden_group_shown():
+    # A group hidden by 'visible_when' in a lazy view gets its editors when
+    # it is first shown.
+    from pyface.qt import QtGui
+
+    with store_exceptions_on_all_threads():
+        dialog = VisibleWhenProblem()
+        view = View(
+            Item('which'),
+            VGroup(Include('onoff_group'), Include('text_group')),
+            lazy=True
+        )
+        ui = dialog.edit_traits(view=view)
+        try:
+            nose.tools.assert_not_in('txt', ui._editors_by_name)
+            nose.tools.assert_equal(len(ui._deferred), 1)
+
+            dialog.which = 'two'
+            QtGui.QApplication.processEvents()
+
+            nose.tools.assert_equal(len(ui._deferred), 0)
+            editor, = ui._editors_by_name['txt']
+            nose.tools.assert_true(editor.control.isVisible())
+        finally:
+            ui.dispose()
+
+
 if __name__ == '__main__':
     # Execute from command line for manual testing
     vw = VisibleWhenProblem(txt='ciao')
@@ -0,0 +1,323 @@
+#  Copyright (c) 2016, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+
+import os
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from traits.api import Array, HasTraits
+
+from traitsui.item import Item
+from traitsui.ui_editors import array_view_editor
+from traitsui.ui_editors.array_view_editor import (
+    ArraySummary, ArrayViewAdapter, ArrayViewEditor, column_title, index_for)
+from traitsui.view import View
+
+from traitsui.tests._tools import (store_exceptions_on_all_threads,
+                                   skip_if_not_qt4, skip_if_null)
+
+
+class ArrayViewer(HasTraits):
+
+    data = Array
+
+    view = View(
+        Item('data', editor=ArrayViewEditor(titles=['x', 'y', 'z']),
+             show_label=False)
+    )
+
+
+def sample_data():
+    return ArrayViewer(data=np.arange(12).reshape(4, 3))
+
+
+def test_adapter_get_array():
+    viewer = sample_data()
+    adapter = ArrayViewAdapter()
+
+    array = adapter.get_array(viewer, 'data')
+
+    assert array.shape == (4, 3)
+    assert np.may_share_memory(array, viewer.data)
+
+
+def test_adapter_get_array_transposed():
+    viewer = sample_data()
+    adapter = ArrayViewAdapter(transpose=True)
+
+    array = adapter.get_array(viewer, 'data')
+
+    assert array.shape == (3, 4)
+    assert np.may_share_memory(array, viewer.data)
+
+
+def test_adapter_get_text_block():
+    viewer = sample_data()
+    adapter = ArrayViewAdapter(format='%03d')
+
+    block = adapter.get_text_block(viewer, 'data', slice(1, 3), slice(0, 2))
+
+    assert block == [['003', '004'], ['006', '007']]
+
+
+def test_adapter_get_text_block_matches_get_text():
+    viewer = sample_data()
+    adapter = ArrayViewAdapter(columns=[('Data %d' % i, i) for i in range(4)],
+                               transpose=True)
+
+    block = adapter.get_text_block(viewer, 'data', slice(0, 10),
+                                   slice(0, 10))
+
+    assert len(block) == 3
+    for row, texts in enumerate(block):
+        assert len(texts) == 4
+        for column, text in enumerate(texts):
+            assert text == adapter.get_text(viewer, 'data', row, column)
+
+
+def test_adapter_get_text_block_1d():
+    viewer = ArrayViewer(data=np.linspace(0.0, 1.0, 5))
+    adapter = ArrayViewAdapter(is_2d=False, format='%.2f')
+
+    block = adapter.get_text_block(viewer, 'data', slice(3, 10),
+                                   slice(0, 1))
+
+    assert block == [['0.75'], ['1.00']]
+
+
+def test_adapter_get_text_block_memmap():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(tmpdir, 'data.bin')
+        data = np.memmap(filename, dtype='float64', mode='w+',
+                         shape=(1000, 50))
+        data[500, 20] = 1.5
+        viewer = ArrayViewer(data=data)
+        adapter = ArrayViewAdapter()
+
+        block = adapter.get_text_block(viewer, 'data', slice(500, 501),
+                                       slice(20, 22))
+
+        assert block == [['1.5', '0.0']]
+        del viewer, data
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test_adapter_get_export_data():
+    viewer = sample_data()
+    adapter = ArrayViewAdapter(columns=[('Index', 'index'), ('x', 0),
+                                        ('y', 1), ('z', 2)])
+
+    data = adapter.get_export_data(viewer, 'data', [1, 2], [0, 2, 3])
+
+    assert_array_equal(data, [[4, 5], [7, 8]])
+    assert np.may_share_memory(data, viewer.data)
+
+
+def test_adapter_get_export_data_scattered():
+    viewer = sample_data()
+    adapter = ArrayViewAdapter(columns=[('Data %d' % i, i) for i in range(4)],
+                               transpose=True)
+
+    data = adapter.get_export_data(viewer, 'data', [0, 2], [1, 3])
+
+    assert_array_equal(data, [[3, 9], [5, 11]])
+
+
+def test_adapter_get_export_text():
+    viewer = sample_data()
+    adapter = ArrayViewAdapter(columns=[('Index', 'index'), ('x', 0),
+                                        ('y', 1), ('z', 2)],
+                               format='%02d')
+
+    text = ''.join(adapter.get_export_text(viewer, 'data', [0, 3], [0, 1, 3],
+                                           separator=','))
+
+    assert text == '0,00,02\n3,09,11\n'
+
+
+def test_adapter_get_export_text_chunked_1d():
+    viewer = ArrayViewer(data=np.arange(5.0))
+    adapter = ArrayViewAdapter(is_2d=False, columns=[('Data', 0)],
+                               format='%.1f')
+
+    old_chunk_rows = array_view_editor.EXPORT_CHUNK_ROWS
+    array_view_editor.EXPORT_CHUNK_ROWS = 2
+    try:
+        chunks = list(adapter.get_export_text(viewer, 'data', [0, 1, 2, 4],
+                                              [0]))
+    finally:
+        array_view_editor.EXPORT_CHUNK_ROWS = old_chunk_rows
+
+    assert chunks == ['0.0\n1.0\n', '2.0\n4.0\n']
+
+
+def test_index_for():
+    assert index_for([2, 3, 4]) == slice(2, 5)
+    assert index_for([2, 4]) == [2, 4]
+    assert index_for([]) == []
+
+
+def test_column_title():
+    assert column_title([], 3, 2) == 'Data 2'
+    assert column_title(['x', 'y'], 4, 3) == 'y1'
+    assert column_title(['x', 'y'], 3, 1) == 'y'
+    assert column_title(['x', 'y'], 3, 2) == ''
+
+
+def summary_of(array, statistic, min_size=1):
+    old_min_size = array_view_editor.SUMMARY_MIN_SIZE
+    array_view_editor.SUMMARY_MIN_SIZE = min_size
+    try:
+        summary = ArraySummary(array=array, statistic=statistic)
+        summary.compute()
+    finally:
+        array_view_editor.SUMMARY_MIN_SIZE = old_min_size
+    return summary
+
+
+def test_summary_mean():
+    array = np.arange(15.0).reshape(3, 5)
+    array[0, 0] = np.nan
+
+    summary = summary_of(array, 'mean')
+
+    assert summary.complete
+    assert [level.shape for level in summary.levels] == [(2, 3), (1, 2),
+                                                         (1, 1)]
+    assert_array_equal(summary.get_level(1),
+                       [[(1 + 5 + 6) / 3.0, 5.0, 6.5],
+                        [10.5, 12.5, 14.0]])
+    assert summary.get_level(3)[0, 0] == np.nanmean(array)
+    assert summary.limits == (1.0, 14.0)
+
+
+def test_summary_min_max():
+    array = np.arange(15.0).reshape(3, 5)
+
+    minimum = summary_of(array, 'min')
+    maximum = summary_of(array, 'max')
+
+    assert_array_equal(minimum.get_level(1), [[0, 2, 4], [10, 12, 14]])
+    assert_array_equal(maximum.get_level(1), [[6, 8, 9], [11, 13, 14]])
+    assert minimum.limits == (0.0, 14.0)
+    assert maximum.limits == (0.0, 14.0)
+
+
+def test_summary_chunked_first_level():
+    array = np.random.RandomState(0).rand(101, 9)
+    reference = summary_of(array, 'max')
+
+    old_chunk_size = array_view_editor.SUMMARY_CHUNK_SIZE
+    array_view_editor.SUMMARY_CHUNK_SIZE = 20
+    try:
+        summary = summary_of(array, 'max')
+    finally:
+        array_view_editor.SUMMARY_CHUNK_SIZE = old_chunk_size
+
+    for level in range(1, len(reference.levels) + 1):
+        assert_array_equal(summary.get_level(level),
+                           reference.get_level(level))
+    assert summary.limits == reference.limits == (array.min(), array.max())
+
+
+def test_summary_level_for():
+    summary = summary_of(np.zeros((64, 64)), 'mean')
+
+    assert summary.get_level(0) is summary.array
+    assert summary.level_for(0.5) == 0
+    assert summary.level_for(3.0) == 1
+    assert summary.level_for(1000.0) == len(summary.levels)
+
+
+def test_summary_start():
+    summary = ArraySummary(array=np.arange(60000.0).reshape(200, 300))
+    done = threading.Event()
+    summary.on_trait_change(done.set, 'updated')
+
+    summary.start()
+
+    assert done.wait(10.0)
+    assert summary.complete
+    assert summary.limits == (0.0, 59999.0)
+
+
+def test_summary_start_failure():
+    summary = ArraySummary(array=np.array([['a', 'b'], ['c', 'd']]))
+    done = threading.Event()
+    summary.on_trait_change(done.set, 'updated')
+
+    summary.start()
+
+    assert done.wait(10.0)
+    assert summary.failed
+    assert not summary.complete
+
+
+@skip_if_null
+def test_array_view_editor():
+    viewer = sample_data()
+    with store_exceptions_on_all_threads():
+        ui = viewer.edit_traits()
+        ui.dispose()
+
+
+@skip_if_null
+def test_array_view_editor_summary():
+    viewer = sample_data()
+    view = View(Item('data', editor=ArrayViewEditor(summary=True)))
+    with store_exceptions_on_all_threads():
+        ui = viewer.edit_traits(view=view)
+        ui.dispose()
+
+
+class ModelEditor(object):
+    """ Stand-in for the tabular editor of an ArrayViewModel.
+    """
+
+    def __init__(self, adapter, object, name):
+        self.adapter = adapter
+        self.object = object
+        self.name = name
+
+
+@skip_if_not_qt4
+def test_array_view_model_1d_titles():
+    from pyface.qt import QtCore
+    from traitsui.qt4.array_view_model import ArrayViewModel
+
+    # A 1D array shows its values in every titled column:
+    viewer = ArrayViewer(data=np.arange(4))
+    adapter = ArrayViewAdapter(is_2d=False, columns=[('x', 0), ('y', 1)])
+    model = ArrayViewModel(ModelEditor(adapter, viewer, 'data'))
+    for column in range(2):
+        text = model.data(model.createIndex(2, column), QtCore.Qt.DisplayRole)
+        assert text == '2'
+
+
+@skip_if_not_qt4
+def test_array_view_model_mime_data():
+    from traitsui.qt4.array_view_model import ArrayViewModel, npy_mime_type
+
+    # The dragged rows are kept, and the cells are exported alongside them:
+    viewer = sample_data()
+    adapter = ArrayViewAdapter(columns=[('x', 0), ('y', 1), ('z', 2)])
+    model = ArrayViewModel(ModelEditor(adapter, viewer, 'data'))
+    indexes = [model.createIndex(row, column)
+               for row in (1, 2) for column in (0, 1)]
+    mime_data = model.mimeData(indexes)
+    rows = mime_data.instance()
+    assert len(rows) == 2
+    assert_array_equal(rows[0], viewer.data[1])
+    assert str(mime_data.text()) == '3\t4\n6\t7\n'
+    assert mime_data.hasFormat(npy_mime_type)
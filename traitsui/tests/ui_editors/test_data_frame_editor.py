@@ -19,6 +19,7 @@ except ImportError as exc:
 from traits.api import HasTraits, Instance
 
 from traitsui.item import Item
+from traitsui.ui_editors import data_frame_editor
 from traitsui.ui_editors.data_frame_editor import (
     DataFrameEditor, DataFrameAdapter)
 from traitsui.view import View
@@ -345,6 +346,61 @@ def test_adapter_insert_end_numerical_index():
     assert_array_equal(data.index, [1, 2, 3, 4, 0])
 
 
+def export_adapter(**traits):
+    columns = [('', 'index'), ('X', 'X'), ('Y', 'Y'), ('Z', 'Z')]
+    return DataFrameAdapter(columns=columns, **traits)
+
+
+@skip_if_null
+def test_adapter_get_export_data():
+    viewer = sample_data()
+    adapter = export_adapter()
+
+    data = adapter.get_export_data(viewer, 'data', [1, 3], [0, 1, 3])
+
+    assert_array_equal(data.values, [[3, 5], [9, 11]])
+    assert_array_equal(data.columns, ['X', 'Z'])
+    assert_array_equal(data.index, ['two', 'four'])
+
+
+@skip_if_null
+def test_adapter_get_export_text():
+    viewer = sample_data()
+    adapter = export_adapter(_formats={'X': '%03d'})
+
+    text = ''.join(adapter.get_export_text(viewer, 'data', [1, 2], [0, 1, 2]))
+
+    assert text == 'two\t003\t4\nthree\t006\t7\n'
+
+
+@skip_if_null
+def test_adapter_get_export_text_quoting():
+    viewer = sample_text_data()
+    viewer.data.iloc[1, 2] = 'five, "5"'
+    adapter = export_adapter()
+
+    text = ''.join(adapter.get_export_text(viewer, 'data', [0, 1], [1, 3],
+                                           separator=','))
+
+    assert text == '0,two\n3,"five, ""5"""\n'
+
+
+@skip_if_null
+def test_adapter_get_export_text_chunked():
+    viewer = sample_data_numerical_index()
+    adapter = export_adapter()
+
+    old_chunk_rows = data_frame_editor.EXPORT_CHUNK_ROWS
+    data_frame_editor.EXPORT_CHUNK_ROWS = 3
+    try:
+        chunks = list(adapter.get_export_text(viewer, 'data', [0, 1, 2, 3],
+                                              [0, 3]))
+    finally:
+        data_frame_editor.EXPORT_CHUNK_ROWS = old_chunk_rows
+
+    assert chunks == ['1\t2\n2\t5\n3\t8\n', '4\t11\n']
+
+
 @skip_if_null
 def test_data_frame_editor():
     viewer = sample_data()
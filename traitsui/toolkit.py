@@ -408,6 +408,36 @@ class Toolkit(HasPrivateTraits):
         """
         raise NotImplementedError
 
+    #-------------------------------------------------------------------------
+    #  Calls a function from the GUI toolkit event loop:
+    #-------------------------------------------------------------------------
+
+    def invoke_later(self, delay, callable, *args, **kw_args):
+        """ Calls a function from the GUI toolkit event loop after a specified
+            delay (in seconds), or at the next event loop iteration if the
+            delay is 0.
+
+            Toolkits without an event loop call the function immediately.
+        """
+        callable(*args, **kw_args)
+
+    #-------------------------------------------------------------------------
+    #  Suspends/Resumes the updating of a specified GUI toolkit control:
+    #-------------------------------------------------------------------------
+
+    def suspend_updates(self, control):
+        """ Suspends the updating (painting and layout) of a specified GUI
+            toolkit control, so that a series of changes to it and its
+            children only cause a single update when updates are resumed.
+        """
+        pass
+
+    def resume_updates(self, control):
+        """ Resumes the updating of a specified GUI toolkit control
+            suspended by 'suspend_updates'.
+        """
+        pass
+
     #-------------------------------------------------------------------------
     #  Returns a ( width, height ) tuple containing the size of a specified
     #  toolkit image:
@@ -34,6 +34,7 @@ from traits.api import (
     Either,
     HasPrivateTraits,
     Instance,
+    Int,
     Interface,
     isinterface,
     List,
@@ -100,6 +101,14 @@ class TreeNode(HasPrivateTraits):
     # Automatically close sibling tree nodes?
     auto_close = Bool(False)
 
+    # Should the children of the node's objects be fetched in a background
+    # thread when the node is expanded (for slow 'get_children' methods)?
+    async_children = Bool(False)
+
+    # The maximum number of objects of the node whose children are fetched
+    # in the background at the same time:
+    async_limit = Int(2)
+
     # List of object classes than can be added or copied
     add = List(Any)
 
@@ -115,6 +124,11 @@ class TreeNode(HasPrivateTraits):
     # List of object interfaces that the node applies to
     node_for_interface = Property(depends_on='node_for')
 
+    # Does the result of 'is_node_for' only depend on the class of the object,
+    # so that tree editors may cache which node handles each class? Defaults
+    # to True, unless a subclass overrides 'is_node_for'.
+    cache_node_for = Bool
+
     # Function for formatting the label
     formatter = Callable
 
@@ -178,6 +192,11 @@ class TreeNode(HasPrivateTraits):
         if self.icon_path == '':
             self.icon_path = get_resource_path()
 
+    #-- Default Values -------------------------------------------------------
+
+    def _cache_node_for_default(self):
+        return type(self).is_node_for == TreeNode.is_node_for
+
     #-- Property Implementations ---------------------------------------------
 
     @cached_property
@@ -25,15 +25,21 @@
 
 from __future__ import absolute_import
 
+import ast
 import shelve
 import os
+from collections import OrderedDict
+from contextlib import contextmanager
+from time import time
 
 from traits.api import (
     Any,
     Bool,
     Callable,
+    Dict,
     DictStrAny,
     Event,
+    Float,
     HasPrivateTraits,
     Instance,
     Int,
@@ -44,7 +50,7 @@ from traits.api import (
     on_trait_change,
     property_depends_on)
 
-from traits.trait_base import traits_home, is_str
+from traits.trait_base import Missing, traits_home, is_str
 
 from .editor import Editor
 
@@ -52,6 +58,10 @@ from .view_elements import ViewElements
 
 from .handler import Handler, ViewHandler
 
+from .helper import compile_expression
+
+from .profiler import count_event, end_profiled
+
 from .toolkit import toolkit
 
 from .ui_info import UIInfo
@@ -67,6 +77,10 @@ from .group import Group, ShadowGroup
 # List of **kind** types for views that must have a **parent** window specified
 kind_must_have_parent = ('panel', 'subpanel')
 
+# The editor traits controlled by 'visible_when', 'enabled_when' and
+# 'checked_when' conditions (in the order in which they are evaluated):
+when_traits = ('visible', 'enabled', 'checked')
+
 #-------------------------------------------------------------------------
 #  'UI' class:
 #-------------------------------------------------------------------------
@@ -140,6 +154,14 @@ class UI(HasPrivateTraits):
     # Set to True when the UI has finished being destroyed.
     destroyed = Bool(False)
 
+    # The minimum interval (in seconds) between two re-evaluations of the
+    # 'visible_when', 'enabled_when' and 'checked_when' conditions caused by
+    # context trait changes. Changes are always coalesced until at least the
+    # next GUI event loop iteration, even when made on the UI thread: the
+    # 'visible' and 'enabled' states of the editors are not up to date right
+    # after a trait is set, but only once the event loop has run:
+    when_interval = Float(0.0)
+
     #-- Private Traits -------------------------------------------------------
 
     # Original context when used with a modal dialog
@@ -151,15 +173,36 @@ class UI(HasPrivateTraits):
     # List of methods to call once the user interface is created
     _defined = List
 
-    # List of (visible_when,Editor) pairs
+    # List of (visible_when,Editor,names) tuples
     _visible = List
 
-    # List of (enabled_when,Editor) pairs
+    # List of (enabled_when,Editor,names) tuples
     _enabled = List
 
-    # List of (checked_when,Editor) pairs
+    # List of (checked_when,Editor,names) tuples
     _checked = List
 
+    # Mapping from the id of each context object to a tuple of the object and
+    # a dictionary mapping its trait names (None for any trait) to the
+    # (trait, condition) pairs depending on them
+    _when_dependencies = Any
+
+    # Mapping from the id of each condition waiting to be re-evaluated to its
+    # (trait, condition) pair (None if no re-evaluation is scheduled)
+    _when_pending = Any
+
+    # Time of the last re-evaluation of the conditions waiting to be
+    # re-evaluated
+    _when_time = Float
+
+    # Count of levels of nesting of 'batch_updates' blocks
+    _batch_level = Int
+
+    # Mapping from the id of each editor whose update has been deferred until
+    # the end of a 'batch_updates' block to the editor (None if there are
+    # none)
+    _batch_editors = Any
+
     # Search stack used while building a user interface
     _search = List
 
@@ -169,9 +212,30 @@ class UI(HasPrivateTraits):
     # List of editors used to build the user interface
     _editors = List
 
+    # Mapping from trait names to the editors (in **_editors**) for them
+    _editors_by_name = Dict
+
+    # Mapping from the ids (in **_names**) to the editors bound to them in the
+    # UIInfo object (including the editors of groups)
+    _editors_by_id = Dict
+
     # List of names bound to the **info** object
     _names = List
 
+    # The node recording the construction of the UI with the active profiler
+    # (see 'traitsui.profiler'), ended by 'prepare_ui' (None if none):
+    _profile_node = Any
+
+    # List of (build, names) tuples for the parts of the user interface whose
+    # construction has been deferred until they are needed, where names is
+    # the set of trait names and ids of the editors built by calling build
+    # (see 'add_deferred')
+    _deferred = List
+
+    # The preferences set by 'set_prefs', kept for the editors of the deferred
+    # parts of the user interface (None if there are none)
+    _deferred_prefs = Any
+
     # Index of currently the active group in the user interface
     _active_group = Int
 
@@ -198,8 +262,9 @@ class UI(HasPrivateTraits):
     # (i.e. rebuilt).
     recyclable_traits = [
         '_context', '_revert', '_defined', '_visible', '_enabled', '_checked',
-        '_search', '_dispatchers', '_editors', '_names', '_active_group',
-        '_undoable', '_rebuild', '_groups_cache'
+        '_search', '_dispatchers', '_editors', '_names', '_editors_by_id',
+        '_deferred', '_deferred_prefs', '_active_group', '_undoable',
+        '_rebuild', '_groups_cache'
     ]
 
     # List of additional traits that are discarded when a user interface is
@@ -265,6 +330,9 @@ class UI(HasPrivateTraits):
         # Discard any context object associated with the ui view control:
         self.control._object = None
 
+        # Stop monitoring the traits used by the discarded conditions:
+        self._remove_when_listeners()
+
         # Reset all recyclable traits:
         self.reset_traits(self.recyclable_traits)
 
@@ -281,8 +349,7 @@ class UI(HasPrivateTraits):
 
         # Make sure that 'visible', 'enabled', and 'checked' handlers are not
         # called after the editor has been disposed:
-        for object in self.context.values():
-            object.on_trait_change(self._evaluate_when, remove=True)
+        self._remove_when_listeners()
 
         # Notify the handler that the view has been closed:
         self.handler.closed(self.info, self.result)
@@ -452,26 +519,32 @@ class UI(HasPrivateTraits):
                         trait_name = prefix[col + 1:]
                         self._dispatchers.append(Dispatcher(
                             method, info, object, trait_name))
+                        count_event('listeners')
                         if object.base_trait(trait_name).type != 'event':
                             method(info)
 
         # If there are any Editor object's whose 'visible', 'enabled' or
         # 'checked' state is controlled by a 'visible_when', 'enabled_when' or
-        # 'checked_when' expression, set up an 'anytrait' changed notification
-        # handler on each object in the 'context' that will cause the 'visible',
-        # 'enabled' or 'checked' state of each affected Editor to be set. Also
-        # trigger the evaluation immediately, so the visible, enabled or checked
-        # state of each Editor can be correctly initialized:
+        # 'checked_when' expression, set up trait change notification handlers
+        # for the context object traits used by the expressions, which will
+        # cause the 'visible', 'enabled' or 'checked' state of each affected
+        # Editor to be set. Also trigger the evaluation immediately, so the
+        # visible, enabled or checked state of each Editor can be correctly
+        # initialized:
         if (len(self._visible) +
             len(self._enabled) +
                 len(self._checked)) > 0:
-            for object in context.values():
-                object.on_trait_change(self._evaluate_when, dispatch='ui')
+            self._add_when_listeners()
             self._do_evaluate_when(at_init=True)
 
         # Indicate that the user interface has been initialized:
         info.initialized = True
 
+        # The user interface is now built, so stop recording its construction
+        # (which would otherwise include any modal event loop):
+        end_profiled(self._profile_node)
+        self._profile_node = None
+
     #-------------------------------------------------------------------------
     #  Synchronize context object traits with view editor traits:
     #-------------------------------------------------------------------------
@@ -557,13 +630,9 @@ class UI(HasPrivateTraits):
         """ Sets the values of user preferences for the UI.
         """
         if isinstance(prefs, dict):
-            info = self.info
-            for name in self._names:
-                editor = getattr(info, name, None)
-                if isinstance(editor, Editor) and (editor.ui is self):
-                    editor_prefs = prefs.get(name)
-                    if editor_prefs is not None:
-                        editor.restore_prefs(editor_prefs)
+            self._restore_editor_prefs(prefs, self._editors_by_id.keys())
+            if len(self._deferred) > 0:
+                self._deferred_prefs = prefs
 
             if self.key_bindings is not None:
                 key_bindings = prefs.get('$')
@@ -606,16 +675,32 @@ class UI(HasPrivateTraits):
         if self.key_bindings is not None:
             ui_prefs['$'] = self.key_bindings
 
-        info = self.info
-        for name in self._names:
-            editor = getattr(info, name, None)
-            if isinstance(editor, Editor) and (editor.ui is self):
+        for id, editor in self._editors_by_id.items():
+            if editor.ui is self:
                 prefs = editor.save_prefs()
                 if prefs is not None:
-                    ui_prefs[name] = prefs
+                    ui_prefs[id] = prefs
+
+        # Keep the preferences of the editors which have not been built yet:
+        deferred_prefs = self._deferred_prefs
+        if deferred_prefs is not None:
+            for build, names in self._deferred:
+                for id in names:
+                    if (id in deferred_prefs) and (id not in ui_prefs):
+                        ui_prefs[id] = deferred_prefs[id]
 
         return ui_prefs
 
+    def _restore_editor_prefs(self, prefs, ids):
+        """ Restores the preferences of the editors bound to a list of ids.
+        """
+        for id in ids:
+            editor = self._editors_by_id.get(id)
+            if (editor is not None) and (editor.ui is self):
+                editor_prefs = prefs.get(id)
+                if editor_prefs is not None:
+                    editor.restore_prefs(editor_prefs)
+
     #-------------------------------------------------------------------------
     #  Gets a reference to the traits UI preference database:
     #-------------------------------------------------------------------------
@@ -636,7 +721,9 @@ class UI(HasPrivateTraits):
     def get_editors(self, name):
         """ Returns a list of editors for the given trait name.
         """
-        return [editor for editor in self._editors if editor.name == name]
+        self.build_deferred(name)
+
+        return list(self._editors_by_name.get(name, []))
 
     #-------------------------------------------------------------------------
     #  Returns the list of editor error controls contained by the user
@@ -678,8 +765,7 @@ class UI(HasPrivateTraits):
             'visible_when' objects.
         """
         try:
-            self._visible.append((compile(visible_when, '<string>', 'eval'),
-                                  editor))
+            self._visible.append(when_condition(visible_when, editor))
         except:
             pass
             # fixme: Log an error here...
@@ -694,8 +780,7 @@ class UI(HasPrivateTraits):
             'enabled_when' objects.
         """
         try:
-            self._enabled.append((compile(enabled_when, '<string>', 'eval'),
-                                  editor))
+            self._enabled.append(when_condition(enabled_when, editor))
         except:
             pass
             # fixme: Log an error here...
@@ -710,12 +795,100 @@ class UI(HasPrivateTraits):
             monitored 'checked_when' objects.
         """
         try:
-            self._checked.append((compile(checked_when, '<string>', 'eval'),
-                                  editor))
+            self._checked.append(when_condition(checked_when, editor))
         except:
             pass
             # fixme: Log an error here...
 
+    #-------------------------------------------------------------------------
+    #  Defers the construction of part of the user interface until needed:
+    #-------------------------------------------------------------------------
+
+    def add_deferred(self, build, content):
+        """ Adds a callable building the editors for a list of Group and Item
+            objects, whose construction is deferred until they are needed.
+
+            The toolkit calls **run_deferred** with the callable when the
+            corresponding part of the user interface is first shown. It is
+            also called when one of its editors is looked up using
+            **get_editors** or the **info** object.
+        """
+        names = set()
+        self._add_content_names(content, names)
+        self._deferred.append((build, names))
+
+    def _add_content_names(self, content, names):
+        """ Adds the trait names and ids of the editors for a list of Group
+            and Item objects to a set of names.
+        """
+        for item in content:
+            if isinstance(item, ShadowGroup):
+                names.add(item.id)
+                self._add_content_names(item.get_content(), names)
+            elif isinstance(item, Group):
+                names.add(item.id)
+                self._add_content_names(item.content, names)
+            elif isinstance(item, Item):
+                names.add(item.name)
+                names.add(item.id)
+
+        names.discard('')
+
+    def build_deferred(self, name=None):
+        """ Builds the deferred parts of the user interface containing an
+            editor for a specified trait name or id (or all of them if
+            *name* is None). Returns True if anything was built.
+        """
+        built = False
+        for build, names in self._deferred[:]:
+            if (name is None) or (name in names):
+                built |= self.run_deferred(build)
+
+        return built
+
+    def run_deferred(self, build):
+        """ Builds a part of the user interface whose construction has been
+            deferred using **add_deferred**. Returns False if it has already
+            been built.
+        """
+        for i, deferred in enumerate(self._deferred):
+            if deferred[0] == build:
+                del self._deferred[i]
+                break
+        else:
+            return False
+
+        n_names = len(self._names)
+        n_conditions = [len(getattr(self, '_' + trait))
+                        for trait in when_traits]
+
+        build()
+
+        # If the user interface has already been initialized, finish the
+        # set-up of the new editors the way 'prepare_ui' does:
+        info = self.info
+        if info.initialized:
+            for method in self._defined:
+                method(info)
+            del self._defined[:]
+
+            if self._deferred_prefs is not None:
+                self._restore_editor_prefs(self._deferred_prefs,
+                                           self._names[n_names:])
+
+            conditions = [getattr(self, '_' + trait)[n:]
+                          for trait, n in zip(when_traits, n_conditions)]
+            if sum(len(new_conditions) for new_conditions in conditions) > 0:
+                self._add_when_listeners()
+                for trait, new_conditions in zip(when_traits, conditions):
+                    self._evaluate_condition(new_conditions, trait,
+                                             at_init=True)
+
+        if len(self._deferred) == 0:
+            self._deferred_prefs = None
+
+        return True
+
     #-------------------------------------------------------------------------
     #  Performs an 'undoable' action:
     #-------------------------------------------------------------------------
@@ -733,6 +906,76 @@ class UI(HasPrivateTraits):
             if undoable == -1:
                 self._undoable = -1
 
+    #-------------------------------------------------------------------------
+    #  Performs a batch of updates:
+    #-------------------------------------------------------------------------
+
+    @contextmanager
+    def batch_updates(self):
+        """ Returns a context manager for a block of code making many changes
+            to the traits edited by the user interface (on the UI thread).
+
+            While the block runs, editors whose traits change are only marked
+            as needing an update, and any undoable changes are grouped into a
+            single undo transaction. When the (outermost) block exits, each of
+            these editors is updated once, and the 'visible_when',
+            'enabled_when' and 'checked_when' conditions affected by the
+            changes are evaluated once.
+
+            For example::
+
+                with ui.batch_updates():
+                    for name, value in values.items():
+                        setattr(model, name, value)
+        """
+        undoable = self._undoable
+        self._batch_level += 1
+        try:
+            if (undoable == -1) and (self.history is not None):
+                self._undoable = self.history.now
+
+            yield
+        finally:
+            if undoable == -1:
+                self._undoable = -1
+
+            self._batch_level -= 1
+            if self._batch_level == 0:
+                self._end_batch_updates()
+
+    #-------------------------------------------------------------------------
+    #  Defers the update of an editor until the end of a batch of updates:
+    #-------------------------------------------------------------------------
+
+    def _defer_update(self, editor):
+        """ Defers the update of an editor until the end of the current
+            'batch_updates' block, and returns True (or returns False if
+            there is none).
+        """
+        if self._batch_level == 0:
+            return False
+
+        if self._batch_editors is None:
+            self._batch_editors = OrderedDict()
+        self._batch_editors[id(editor)] = editor
+
+        return True
+
+    def _end_batch_updates(self):
+        """ Updates the editors and evaluates the conditions affected by the
+            changes made during a 'batch_updates' block.
+        """
+        editors, self._batch_editors = self._batch_editors, None
+        if editors is not None:
+            for editor in editors.values():
+                # Skip editors which have been disposed of in the meantime:
+                if editor.control is not None:
+                    count_event('update_editor', editor)
+                    editor.update_editor()
+
+        if self._when_pending is not None:
+            self._evaluate_pending_when()
+
     #-------------------------------------------------------------------------
     #  Routes a 'hooked' event to the correct handler method:
     #-------------------------------------------------------------------------
@@ -778,7 +1021,8 @@ class UI(HasPrivateTraits):
         context = self.context.copy()
         context['ui'] = self
         context['handler'] = self.handler
-        return eval(function, globals(), context)(*args, **kw_args)
+        return eval(compile_expression(function), globals(),
+                    context)(*args, **kw_args)
 
     #-------------------------------------------------------------------------
     #  Evaluates an expression in the UI's 'context' and returns the result:
@@ -790,13 +1034,11 @@ class UI(HasPrivateTraits):
         """
         context = self._get_context(self.context)
         try:
-            result = eval(when, globals(), context)
+            result = eval(compile_expression(when), globals(), context)
         except:
             from traitsui.api import raise_to_debug
             raise_to_debug()
 
-        del context['ui']
-
         return result
 
     #-------------------------------------------------------------------------
@@ -805,6 +1047,20 @@ class UI(HasPrivateTraits):
 
     def _get_context(self, context):
         """ Gets the context to use for evaluating an expression.
+
+            The traits of the main context object are only looked up when an
+            expression uses them (see 'LazyContext'), so a context should only
+            be used for a single evaluation pass.
+        """
+        return LazyContext(self, context)
+
+    #-------------------------------------------------------------------------
+    #  Gets the name of the main object of a context:
+    #-------------------------------------------------------------------------
+
+    def _get_context_name(self, context):
+        """ Gets the name of the main object of a context, whose traits can be
+            used directly by name in an expression.
         """
         name = 'object'
         n = len(context)
@@ -815,16 +1071,7 @@ class UI(HasPrivateTraits):
         elif n == 1:
             name = context.keys()[0]
 
-        value = context.get(name)
-        if value is not None:
-            context2 = value.trait_get()
-            context2.update(context)
-        else:
-            context2 = context.copy()
-
-        context2['ui'] = self
-
-        return context2
+        return name
 
     #-------------------------------------------------------------------------
     #  Sets the 'visible', 'enabled' and/or 'checked' state for all Editors
@@ -839,6 +1086,176 @@ class UI(HasPrivateTraits):
         """
         self._do_evaluate_when(at_init=False)
 
+    #-------------------------------------------------------------------------
+    #  Sets the 'visible', 'enabled' and/or 'checked' state for the Editors
+    #  whose condition depends upon a context object trait that changed:
+    #-------------------------------------------------------------------------
+
+    def _when_trait_changed(self, object, name, new):
+        """ Schedules the re-evaluation of the conditions that use a context
+            object trait that has changed.
+
+            All changes until the re-evaluation takes place (at the next GUI
+            event loop iteration, and no sooner than **when_interval** seconds
+            after the previous one) are coalesced into a single pass.
+        """
+        dependencies = None
+        if self._when_dependencies is not None:
+            dependencies = self._when_dependencies.get(id(object))
+        if dependencies is None:
+            return
+
+        names = dependencies[1]
+        changed = names.get(name, []) + names.get(None, [])
+        if len(changed) == 0:
+            return
+
+        pending = self._when_pending
+        if pending is None:
+            self._when_pending = pending = {}
+            scheduled = False
+        else:
+            scheduled = True
+
+        for trait, condition in changed:
+            pending[id(condition)] = (trait, condition)
+
+        # Conditions changed during a batch of updates are evaluated at the end
+        # of the batch:
+        if (not scheduled) and (self._batch_level == 0):
+            delay = max(self._when_time + self.when_interval - time(), 0.0)
+            toolkit().invoke_later(delay, self._evaluate_pending_when)
+
+    #-------------------------------------------------------------------------
+    #  Re-evaluates the conditions scheduled by '_when_trait_changed':
+    #-------------------------------------------------------------------------
+
+    def _evaluate_pending_when(self):
+        """ Set the 'visible', 'enabled', and 'checked' states of the Editors
+            whose condition is waiting to be re-evaluated.
+
+            Updates to the UI control are suspended while the states are set,
+            so that the layout is only updated once.
+        """
+        pending, self._when_pending = self._when_pending, None
+
+        # Do nothing if the conditions have been discarded in the meantime:
+        if (pending is None) or (self._when_dependencies is None):
+            return
+
+        self._when_time = time()
+        control = self.control
+        toolkit().suspend_updates(control)
+        try:
+            for trait in when_traits:
+                conditions = [condition
+                              for condition_trait, condition
+                              in pending.values()
+                              if condition_trait == trait]
+                if len(conditions) > 0:
+                    self._evaluate_condition(conditions, trait)
+        finally:
+            toolkit().resume_updates(control)
+
+    #-------------------------------------------------------------------------
+    #  Sets up/Removes the listeners for the context object traits used by
+    #  'visible_when', 'enabled_when' or 'checked_when' expressions:
+    #-------------------------------------------------------------------------
+
+    def _add_when_listeners(self):
+        """ Sets up trait change handlers for the context object traits used
+            by all 'visible_when', 'enabled_when' or 'checked_when'
+            expressions.
+
+            A name used by an expression refers either to a context object,
+            whose traits used by the expression are monitored (or all of its
+            traits when it is used in some other way, such as calling one of
+            its methods), or to a trait of the main context object.
+
+            Properties without dependencies do not notify their changes, so
+            all of the traits of their object are monitored instead.
+        """
+        self._remove_when_listeners()
+
+        context = self.context
+        main = context.get(self._get_context_name(context))
+        main_names = set()
+        if main is not None:
+            main_names = set(main.trait_names())
+
+        dependencies = self._when_dependencies = {}
+        for trait in when_traits:
+            for condition in getattr(self, '_' + trait):
+                for name, attributes in condition[2].items():
+                    object = context.get(name)
+                    if object is not None:
+                        trait_names = attributes
+                        for attribute in attributes:
+                            if ((attribute is None) or
+                                    not self._notifies_changes(object,
+                                                               attribute)):
+                                trait_names = [None]
+                                break
+                    elif name in main_names:
+                        object, trait_names = main, [name]
+                        if not self._notifies_changes(main, name):
+                            trait_names = [None]
+                    else:
+                        continue
+
+                    names = dependencies.setdefault(id(object),
+                                                    (object, {}))[1]
+                    for trait_name in trait_names:
+                        names.setdefault(trait_name, []).append(
+                            (trait, condition))
+
+                        # Also catch changes to the items of list, dict and
+                        # set traits:
+                        if ((trait_name is not None) and
+                                (object.trait(trait_name + '_items')
+                                 is not None)):
+                            names.setdefault(trait_name + '_items',
+                                             []).append((trait, condition))
+
+        for object, names in dependencies.values():
+            object.on_trait_change(self._when_trait_changed,
+                                   self._when_listener_names(names),
+                                   dispatch='ui')
+        count_event('listeners', n=len(dependencies))
+
+    def _notifies_changes(self, object, name):
+        """ Returns whether changes to an object trait used by a condition
+            can be listened to using its name (i.e. whether it is a trait
+            other than a Property without dependencies).
+        """
+        trait = object.trait(name)
+
+        return ((trait is not None) and
+                ((trait.type != 'property') or (trait.depends_on is not None)))
+
+    def _remove_when_listeners(self):
+        """ Removes the trait change handlers set up by
+            '_add_when_listeners'.
+        """
+        if self._when_dependencies is None:
+            return
+
+        for object, names in self._when_dependencies.values():
+            object.on_trait_change(self._when_trait_changed,
+                                   self._when_listener_names(names),
+                                   remove=True)
+
+        self._when_dependencies = self._when_pending = None
+
+    def _when_listener_names(self, names):
+        """ Returns the trait names to listen to for a dictionary of trait
+            names used by conditions (None if any trait is used).
+        """
+        if None in names:
+            return None
+
+        return sorted(names.keys())
+
     def _do_evaluate_when(self, at_init=False):
         """ Set the 'visible', 'enabled', and 'checked' states for all Editors.
 
@@ -878,10 +1295,11 @@ class UI(HasPrivateTraits):
 
         Parameters
         ----------
-        conditions : list of (str, Editor) tuple
-            A list of tuples, each formed by 1) a string that contains a
-            condition that evaluates to either True or False, and
-            2) the editor whose state depends on the condition
+        conditions : list of (code, Editor, dict) tuple
+            A list of tuples, each formed by 1) the compiled code of a
+            condition that evaluates to either True or False,
+            2) the editor whose state depends on the condition, and 3) the
+            names used by the condition (see 'when_condition')
 
         trait : str
             The trait that is set by the condition.
@@ -893,6 +1311,7 @@ class UI(HasPrivateTraits):
             again). If True, the state is always updated (used at
             initialization).
         """
+        count_event('conditions', n=len(conditions))
 
         context = self._get_context(self.context)
 
@@ -901,7 +1320,7 @@ class UI(HasPrivateTraits):
         # list of elements that should be de-activated
         deactivate = []
 
-        for when, editor in conditions:
+        for when, editor, names in conditions:
             try:
                 cond_value = eval(when, globals(), context)
                 editor_state = getattr(editor, trait)
@@ -968,6 +1387,41 @@ class UI(HasPrivateTraits):
 
     #-- Traits Event Handlers ------------------------------------------------
 
+    #-------------------------------------------------------------------------
+    #  Maintains the indices of the editors used by the user interface:
+    #-------------------------------------------------------------------------
+
+    @on_trait_change('_editors')
+    def _reindex_editors(self, editors):
+        self._editors_by_name = {}
+        self._index_editors(editors, [])
+
+    @on_trait_change('_editors_items')
+    def _editors_modified(self, event):
+        self._index_editors(event.added, event.removed)
+
+    def _index_editors(self, added, removed):
+        """ Updates the indices of the editors used by the user interface for
+            a list of added and removed editors.
+        """
+        by_name = self._editors_by_name
+        for editor in removed:
+            editors = by_name.get(editor.name)
+            if editors is not None:
+                editors.remove(editor)
+                if len(editors) == 0:
+                    del by_name[editor.name]
+
+        for editor in added:
+            by_name.setdefault(editor.name, []).append(editor)
+
+    def _bind_id(self, id, value):
+        """ Records a value bound to an id in the UIInfo object.
+        """
+        self._names.append(id)
+        if isinstance(value, Editor):
+            self._editors_by_id[id] = value
+
     def _updated_changed(self):
         if self.rebuild is not None:
             toolkit().rebuild_ui(self)
@@ -1031,3 +1485,96 @@ class Dispatcher(object):
         """
         self.object.on_trait_change(self.dispatch, self.method_name,
                                     remove=True)
+
+#-------------------------------------------------------------------------
+#  'LazyContext' class:
+#-------------------------------------------------------------------------
+
+
+class LazyContext(dict):
+    """ The namespace used to evaluate an expression in a UI's context.
+
+        It contains the context objects and the UI itself ('ui'). Any other
+        name is looked up as a trait of the main context object when it is
+        first used, and then cached, so that traits (and in particular
+        properties) not used by an expression are never computed.
+    """
+
+    def __init__(self, ui, context):
+        dict.__init__(self, context)
+        self['ui'] = ui
+        self.object = context.get(ui._get_context_name(context))
+
+    def __missing__(self, name):
+        object = self.object
+        if (object is None) or (object.trait(name) is None):
+            raise KeyError(name)
+
+        value = getattr(object, name, Missing)
+        if value is Missing:
+            raise KeyError(name)
+
+        self[name] = value
+
+        return value
+
+#-------------------------------------------------------------------------
+#  Compiles a 'visible_when', 'enabled_when' or 'checked_when' condition:
+#-------------------------------------------------------------------------
+
+
+def when_condition(when, editor):
+    """ Returns the (code, editor, names) tuple used by a UI to monitor a
+        'visible_when', 'enabled_when' or 'checked_when' condition of an
+        editor.
+
+        The names are a dictionary mapping each name used by the condition to
+        the list of attributes accessed on it (including None if the value
+        itself is used in some other way).
+    """
+    names = _WhenNames()
+    names.visit(ast.parse(when, mode='eval'))
+
+    return (compile_expression(when), editor, names.names)
+
+#-------------------------------------------------------------------------
+#  '_WhenNames' class:
+#-------------------------------------------------------------------------
+
+
+class _WhenNames(ast.NodeVisitor):
+    """ Collects the names used by an expression, along with the attributes
+        accessed on them.
+    """
+
+    def __init__(self):
+        self.names = {}
+
+    def add(self, name, attribute):
+        attributes = self.names.setdefault(name, [])
+        if attribute not in attributes:
+            attributes.append(attribute)
+
+    def visit_Name(self, node):
+        self.add(node.id, None)
+
+    def visit_Attribute(self, node):
+        if isinstance(node.value, ast.Name):
+            self.add(node.value.id, node.attr)
+        else:
+            self.visit(node.value)
+
+    def visit_Call(self, node):
+        # Calling a method may use any of the traits of the object:
+        func = node.func
+        if (isinstance(func, ast.Attribute) and
+                isinstance(func.value, ast.Name)):
+            self.add(func.value.id, None)
+        else:
+            self.visit(func)
+
+        for child in node.args + node.keywords:
+            self.visit(child)
+        for child in (node.starargs, node.kwargs):
+            if child is not None:
+                self.visit(child)
@@ -22,7 +22,11 @@
 
 from __future__ import absolute_import
 
-from traits.api import Instance, Property, List, Str, Bool, Font
+import logging
+from threading import Thread
+
+from traits.api import (Any, Instance, Property, List, Str, Bool, Enum,
+                        Event, Font, HasPrivateTraits, Tuple)
 
 from ..api import View, Item, TabularEditor, BasicEditorFactory
 
@@ -32,6 +36,8 @@ from ..toolkit import toolkit_object
 
 from ..ui_editor import UIEditor
 
+logger = logging.getLogger(__name__)
+
 #-- Tabular Adapter Definition -------------------------------------------
 
 
@@ -75,6 +81,342 @@ class ArrayViewAdapter(TabularAdapter):
 
         return super(ArrayViewAdapter, self).len(object, trait)
 
+    def get_array(self, object, trait):
+        """ Returns the *object.trait* array as it is displayed, i.e. with
+            rows and columns swapped if **transpose** is set.
+
+            The result is always a view on the original buffer, so that
+            memory-mapped arrays are not read into memory.
+        """
+        array = getattr(object, trait)
+        if self.transpose and self.is_2d:
+            return array.T
+
+        return array
+
+    def get_text_block(self, object, trait, rows, columns):
+        """ Returns the formatted text of a rectangular block of the
+            *object.trait* array as a list of rows of strings.
+
+            *rows* and *columns* are slices in display coordinates. Only the
+            requested block is read from the array buffer and it is formatted
+            in a single vectorized operation.
+        """
+        array = self.get_array(object, trait)
+        if self.is_2d:
+            block = array[rows, columns]
+        else:
+            block = array[rows].reshape(-1, 1)
+
+        return format_block(self.format, block)
+
+    def get_export_data(self, object, trait, rows, columns):
+        """ Returns the values of the specified display *rows* and *columns*
+            of the *object.trait* array as an array.
+
+            Contiguous selections are returned as views on the array buffer,
+            without copying any data.
+        """
+        array = self.get_array(object, trait)
+        if not self.is_2d:
+            return array[index_for(rows)]
+
+        column_ids = [column_id for column_id in self.get_column_ids(columns)
+                      if column_id != 'index']
+
+        return array[index_for(rows)][:, index_for(column_ids)]
+
+    def get_export_text(self, object, trait, rows, columns, separator='\t'):
+        """ Returns an iterator over chunks of text containing the values of
+            the specified display *rows* and *columns* of the *object.trait*
+            array.
+
+            The array is read and formatted **EXPORT_CHUNK_ROWS** rows at a
+            time, so that callers writing the text out never need to hold all
+            of it in memory.
+        """
+        array = self.get_array(object, trait)
+        if not self.is_2d:
+            array = array.reshape(-1, 1)
+
+        column_ids = self.get_column_ids(columns)
+        with_index = 'index' in column_ids
+        if with_index:
+            column_ids.remove('index')
+        column_index = index_for(column_ids)
+
+        for start in range(0, len(rows), EXPORT_CHUNK_ROWS):
+            chunk = rows[start: start + EXPORT_CHUNK_ROWS]
+            lines = format_block(self.format,
+                                 array[index_for(chunk)][:, column_index])
+            if with_index:
+                lines = [[str(row)] + line for row, line in zip(chunk, lines)]
+
+            yield join_lines(lines, separator)
+
+#-- Helper Functions -----------------------------------------------------
+
+# The number of rows read from a buffer at a time when exporting text:
+EXPORT_CHUNK_ROWS = 4096
+
+
+def index_for(indices):
+    """ Returns a slice equivalent to the sorted list of *indices* if they
+        are contiguous, so that indexing an array with the result returns a
+        view rather than a copy, and the list itself otherwise.
+    """
+    n = len(indices)
+    if n > 0 and (indices[-1] - indices[0]) == (n - 1):
+        return slice(indices[0], indices[-1] + 1)
+
+    return indices
+
+
+def join_lines(lines, separator):
+    """ Returns the text of a list of rows of strings, one line per row with
+        the strings delimited by *separator*.
+    """
+    return ''.join([separator.join(line) + '\n' for line in lines])
+
+
+def format_block(format, block):
+    """ Formats each element of a 2D array using the *format* string, and
+        returns the result as a list of rows of strings.
+    """
+    import numpy as np
+
+    try:
+        text = np.char.mod(format, block)
+    except (TypeError, ValueError):
+        # Fall back to element-wise formatting for values (e.g. objects or
+        # tuples) that numpy cannot format directly:
+        return [[format % value for value in row] for row in block]
+
+    return text.tolist()
+
+
+def column_title(titles, columns, column):
+    """ Returns the title of a column of an array with *columns* columns,
+        using the same conventions for the list of *titles* as the
+        ArrayViewEditor.
+    """
+    n = len(titles)
+    if n == 0:
+        return 'Data %d' % column
+
+    if (n < columns) and ((columns % n) == 0):
+        return '%s%d' % (titles[column % n], column // n)
+
+    if column < n:
+        return titles[column]
+
+    return ''
+
+#-- Array Summary Definition ---------------------------------------------
+
+# The number of elements read from the array at a time while computing the
+# first level of an ArraySummary:
+SUMMARY_CHUNK_SIZE = 1 << 22
+
+# An ArraySummary stops adding levels once neither dimension of the most
+# reduced level exceeds this size:
+SUMMARY_MIN_SIZE = 64
+
+
+class ArraySummary(HasPrivateTraits):
+    """ A pyramid of block-wise reductions of a 2D array.
+
+        Level *n* of the pyramid holds the chosen statistic of each block of
+        2**n x 2**n elements of the array (level 0 is the array itself).
+        Calling **start** computes the pyramid in a background thread; the
+        **updated** event is fired from that thread once it is complete (or
+        has failed).
+    """
+
+    # The 2D array being summarized:
+    array = Any
+
+    # The statistic used to aggregate each block of elements:
+    statistic = Enum('mean', 'min', 'max')
+
+    # The reduced levels of the pyramid (levels[0] is level 1):
+    levels = List
+
+    # The (min, max) range of the summarized values:
+    limits = Tuple(0.0, 1.0)
+
+    # Has the pyramid been completely computed?
+    complete = Bool(False)
+
+    # Did computing the pyramid fail?
+    failed = Bool(False)
+
+    # Fired (from the worker thread) when the pyramid has been computed (or
+    # computing it failed):
+    updated = Event
+
+    #-- Public Methods -------------------------------------------------------
+
+    def start(self):
+        """ Starts computing the pyramid in a background thread.
+        """
+        thread = Thread(target=self._run)
+        thread.daemon = True
+        thread.start()
+
+    def cancel(self):
+        """ Requests that a pending computation be abandoned.
+        """
+        self._cancelled = True
+
+    def compute(self):
+        """ Computes the pyramid in the calling thread.
+        """
+        import numpy as np
+
+        levels = []
+        values, counts, limits = self._first_level()
+        while values is not None:
+            levels.append(values)
+            if max(values.shape) <= SUMMARY_MIN_SIZE:
+                break
+            values, counts = self._reduce(values, counts)
+
+        if not self._cancelled:
+            low, high = limits
+            if np.isfinite(low) and np.isfinite(high):
+                self.limits = (float(low), float(high))
+            self.levels = levels
+            self.complete = True
+
+    def get_level(self, level):
+        """ Returns the (float) array of values for the specified level.
+            Level 0 is the summarized array itself, which is not converted.
+        """
+        if level == 0:
+            return self.array
+
+        return self.levels[level - 1]
+
+    def level_for(self, elements_per_pixel):
+        """ Returns the most detailed level whose blocks are at least as big
+            as the specified number of array elements per pixel.
+        """
+        level = 0
+        while ((level < len(self.levels)) and
+               ((1 << (level + 1)) <= elements_per_pixel)):
+            level += 1
+
+        return level
+
+    #-- Private Methods ------------------------------------------------------
+
+    def _run(self):
+        """ Computes the pyramid (in the worker thread).
+        """
+        try:
+            self.compute()
+        except Exception:
+            logger.exception('Error summarizing the array')
+            self.failed = True
+
+        if not self._cancelled:
+            self.updated = True
+
+    def _as_float(self, block):
+        """ Returns a block of the summarized array as a float array.
+        """
+        import numpy as np
+
+        return np.asarray(block, dtype=float)
+
+    def _first_level(self):
+        """ Computes the first reduced level, reading the array a chunk of rows
+            at a time so that memory-mapped arrays are never loaded at once.
+
+            Returns the values and element counts of the level (None if the
+            array is too small to be reduced), and the (min, max) range of
+            the values of the array (NaN if there are none).
+        """
+        import numpy as np
+
+        array = self.array
+        rows, columns = array.shape
+        if max(rows, columns) <= SUMMARY_MIN_SIZE:
+            return None, None, self._limits_of(self._as_float(array))
+
+        chunk = max(2, (SUMMARY_CHUNK_SIZE // max(columns, 1)) & ~1)
+        values = np.empty(((rows + 1) // 2, (columns + 1) // 2))
+        counts = np.empty(values.shape) if self.statistic == 'mean' else None
+        low = high = np.nan
+        for start in range(0, rows, chunk):
+            if self._cancelled:
+                return None, None, (low, high)
+
+            block = self._as_float(array[start: start + chunk])
+            block_low, block_high = self._limits_of(block)
+            low, high = np.fmin(low, block_low), np.fmax(high, block_high)
+            block_counts = None
+            if counts is not None:
+                block_counts = (~np.isnan(block)).astype(float)
+            block, block_counts = self._reduce(block, block_counts)
+            values[start // 2: start // 2 + block.shape[0]] = block
+            if counts is not None:
+                counts[start // 2: start // 2 + block.shape[0]] = block_counts
+
+        return values, counts, (low, high)
+
+    def _limits_of(self, block):
+        """ Returns the (min, max) range of the values of a float block of
+            the array, ignoring NaNs (NaN if there are no values).
+        """
+        import numpy as np
+
+        if block.size == 0:
+            return np.nan, np.nan
+
+        values = block.ravel()
+        return np.fmin.reduce(values), np.fmax.reduce(values)
+
+    def _reduce(self, values, counts):
+        """ Reduces each 2x2 block of *values* (and of the element *counts*
+            when computing means).
+        """
+        import numpy as np
+
+        if self.statistic == 'mean':
+            totals = np.where(counts > 0, values * counts, 0.0)
+            totals = self._pairs(self._pairs(totals, 0, np.add, 0.0), 1,
+                                 np.add, 0.0)
+            counts = self._pairs(self._pairs(counts, 0, np.add, 0.0), 1,
+                                 np.add, 0.0)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                return totals / counts, counts
+
+        op = np.fmin if self.statistic == 'min' else np.fmax
+        return self._pairs(self._pairs(values, 0, op), 1, op), None
+
+    def _pairs(self, values, axis, op, fill=None):
+        """ Combines adjacent pairs of elements along *axis* using *op*,
+            padding an odd-sized axis with *fill* (or the edge values).
+        """
+        import numpy as np
+
+        if values.shape[axis] % 2:
+            if axis == 0:
+                edge = values[-1:]
+            else:
+                edge = values[:, -1:]
+            if fill is not None:
+                edge = np.full_like(edge, fill)
+            values = np.concatenate((values, edge), axis)
+
+        if axis == 0:
+            return op(values[0::2], values[1::2])
+
+        return op(values[:, 0::2], values[:, 1::2])
+
+
 # Define the actual abstract Traits UI array view editor (each backend should
 # implement its own editor that inherits from this class.
 
@@ -92,6 +434,14 @@ class _ArrayViewEditor(UIEditor):
 
     #-- Private Methods ------------------------------------------------------
 
+    def _tabular_editor(self, **traits):
+        """ Returns the tabular editor factory used to display the array.
+
+            Toolkits may override this to use an editor with a model that
+            reads directly from the array buffer.
+        """
+        return TabularEditor(**traits)
+
     def _array_view(self):
         """ Return the view used by the editor.
         """
@@ -99,9 +449,9 @@ class _ArrayViewEditor(UIEditor):
             Item('object.object.' + self.name,
                  id='tabular_editor',
                  show_label=False,
-                 editor=TabularEditor(show_titles=self.show_titles,
-                                      editable=False,
-                                      adapter=self.adapter)
+                 editor=self._tabular_editor(show_titles=self.show_titles,
+                                             editable=False,
+                                             adapter=self.adapter)
                  ),
             id='array_view_editor',
             resizable=True
@@ -181,7 +531,17 @@ class ArrayViewEditor(BasicEditorFactory):
     # The font to use for displaying each array element:
     font = Font('Courier 10')
 
+    # Should the array be displayed as a zoomable, downsampled overview
+    # (for arrays which are too large to be inspected cell by cell)?
+    summary = Bool(False)
+
+    # The statistic used to aggregate blocks of elements in the overview:
+    summary_statistic = Enum('mean', 'min', 'max')
+
     def _get_klass(self):
         """ The class used to construct editor objects.
         """
+        if self.summary:
+            return toolkit_object('array_view_editor:_ArraySummaryEditor')
+
         return toolkit_object('array_view_editor:_ArrayViewEditor')
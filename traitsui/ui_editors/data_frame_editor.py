@@ -17,6 +17,8 @@ from traitsui.item import Item
 from traitsui.tabular_adapter import TabularAdapter
 from traitsui.toolkit import toolkit_object
 from traitsui.ui_editor import UIEditor
+from traitsui.ui_editors.array_view_editor import (
+    EXPORT_CHUNK_ROWS, format_block, index_for, join_lines)
 from traitsui.view import View
 
 
@@ -75,10 +77,7 @@ class DataFrameAdapter(TabularAdapter):
             return self._fonts.get(self.column_id, 'Courier 10')
 
     def _get_format(self):
-        if isinstance(self._formats, basestring):
-            return self._formats
-        else:
-            return self._formats.get(self.column_id, '%s')
+        return self._format_for(self.column_id)
 
     def _get_content(self):
         return self.item[self.column_id].iloc[0]
@@ -148,6 +147,65 @@ class DataFrameAdapter(TabularAdapter):
             new_df = pd.concat([df, value])
         setattr(object, trait, new_df)
 
+    def get_export_data(self, object, trait, rows, columns):
+        """ Returns the specified *rows* and *columns* of the *object.trait*
+            data frame as a data frame.
+        """
+        df = getattr(object, trait)
+        column_ids = [column_id for column_id in self.get_column_ids(columns)
+                      if column_id != 'index']
+
+        return df.iloc[index_for(rows)].loc[:, column_ids]
+
+    def get_export_text(self, object, trait, rows, columns, separator='\t'):
+        """ Returns an iterator over chunks of text containing the specified
+            *rows* and *columns* of the *object.trait* data frame.
+
+            Each column is formatted with a single vectorized operation,
+            **EXPORT_CHUNK_ROWS** rows at a time. Text values containing the
+            separator, quotes or line breaks are quoted as in CSV files.
+        """
+        df = getattr(object, trait)
+        column_ids = self.get_column_ids(columns)
+        for start in range(0, len(rows), EXPORT_CHUNK_ROWS):
+            chunk = df.iloc[index_for(rows[start: start + EXPORT_CHUNK_ROWS])]
+            fields = []
+            for column_id in column_ids:
+                if column_id == 'index':
+                    values = chunk.index.values
+                    format = '%s'
+                else:
+                    values = chunk[column_id].values
+                    format = self._format_for(column_id)
+                texts = format_block(format, values.reshape(-1, 1))
+                fields.append(quote_texts([text for text, in texts],
+                                          separator, values.dtype))
+
+            yield join_lines(zip(*fields), separator)
+
+    def _format_for(self, column_id):
+        """ Returns the format of the values of a column.
+        """
+        if isinstance(self._formats, basestring):
+            return self._formats
+
+        return self._formats.get(column_id, '%s')
+
+
+def quote_texts(texts, separator, dtype):
+    """ Quotes the strings of a list of *texts* formatted from values of the
+        specified *dtype*, where needed for the strings to be delimited by
+        *separator*.
+    """
+    if dtype.kind not in 'OSU':
+        # Formatted numbers, dates and booleans never need quoting:
+        return texts
+
+    special = (separator, '"', '\n', '\r')
+    return [('"%s"' % text.replace('"', '""'))
+            if any(character in text for character in special) else text
+            for text in texts]
+
 
 class _DataFrameEditor(UIEditor):
     """ TraitsUI-based editor implementation for data frames """
@@ -68,7 +68,34 @@ class UIInfo(HasPrivateTraits):
         if id is None:
             id = name
 
-        if not hasattr(self, name):
+        if not self._is_bound(name):
             self.add_trait(name, Constant(value))
             if id != '':
-                self.ui._names.append(id)
+                self.ui._bind_id(id, value)
+
+    #-------------------------------------------------------------------------
+    #  Builds the deferred parts of the user interface binding a name:
+    #-------------------------------------------------------------------------
+
+    def __getattr__(self, name):
+        """ Builds the deferred parts of the user interface (see
+            **View.lazy**) which bind a name that is not bound yet.
+        """
+        if not name.startswith('_'):
+            ui = self.ui
+            if (ui is not None) and ui.build_deferred(name):
+                return getattr(self, name)
+
+        raise AttributeError("'%s' object has no attribute '%s'" %
+                             (self.__class__.__name__, name))
+
+    def _is_bound(self, name):
+        """ Returns whether a name is bound, without building any deferred
+            part of the user interface.
+        """
+        try:
+            HasPrivateTraits.__getattribute__(self, name)
+        except AttributeError:
+            return False
+
+        return True
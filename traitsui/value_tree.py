@@ -25,6 +25,7 @@
 from __future__ import absolute_import
 
 import inspect
+from itertools import islice
 from operator import itemgetter
 
 from types import FunctionType, MethodType
@@ -35,6 +36,11 @@ from .tree_node import ObjectTreeNode, TreeNode, TreeNodeObject
 
 from .editors.tree_editor import TreeEditor
 
+# The number of children of a container value shown at a time (the remaining
+# ones are represented by a 'MoreNode', which shows the next page when it is
+# double-clicked or activated):
+PAGE_SIZE = 500
+
 #-------------------------------------------------------------------------
 #  'SingleValueTreeNodeObject' class:
 #-------------------------------------------------------------------------
@@ -153,10 +159,17 @@ class SingleValueTreeNodeObject(TreeNodeObject):
         if self.label != '':
             return self.label
 
+        # The value is only formatted once it is displayed (and again only if
+        # the value has been replaced since):
+        value = self.value
+        formatted = self._formatted
+        if (formatted is None) or (formatted[0] is not value):
+            self._formatted = formatted = (value, self.format_value(value))
+
         if self.name == '':
-            return self.format_value(self.value)
+            return formatted[1]
 
-        return '%s: %s' % (self.name, self.format_value(self.value))
+        return '%s: %s' % (self.name, formatted[1])
 
     #-------------------------------------------------------------------------
     #  Returns the formatted version of the value:
@@ -174,21 +187,13 @@ class SingleValueTreeNodeObject(TreeNodeObject):
     def node_for(self, name, value):
         """ Returns the correct node type for a specified value.
         """
-        for type, node in basic_types():
-            if isinstance(value, type):
-                break
-        else:
-            node = OtherNode
-            if inspect.isclass(value):
-                node = ClassNode
+        node = node_class_for(value)
 
-            elif hasattr(value, '__class__'):
-                node = ObjectNode
+        # Only set 'readonly' when needed, since most nodes are not:
+        if self.readonly:
+            return node(parent=self, name=name, value=value, readonly=True)
 
-        return node(parent=self,
-                    name=name,
-                    value=value,
-                    readonly=self.readonly)
+        return node(parent=self, name=name, value=value)
 
 #-------------------------------------------------------------------------
 #  'MultiValueTreeNodeObject' class:
@@ -217,6 +222,125 @@ class MultiValueTreeNodeObject(SingleValueTreeNodeObject):
         """
         return True
 
+    #-------------------------------------------------------------------------
+    #  Gets the object's children:
+    #-------------------------------------------------------------------------
+
+    def tno_get_children(self, node):
+        """ Gets the object's children, a page at a time.
+
+            The nodes of the children shown so far are created only once, and
+            are followed by a 'MoreNode' if there are any remaining children.
+        """
+        count = self._child_count()
+        nodes = self._nodes
+        if nodes is None:
+            self._nodes = nodes = []
+
+        shown = min(self._shown or PAGE_SIZE, count)
+        if len(nodes) < shown:
+            nodes.extend(self._child_nodes(len(nodes), shown))
+
+        children = nodes[:shown]
+        if shown < count:
+            children.append(MoreNode(parent=self, value=count - shown,
+                                     readonly=True))
+
+        return children
+
+    #-------------------------------------------------------------------------
+    #  Shows the next page of children:
+    #-------------------------------------------------------------------------
+
+    def show_more(self):
+        """ Shows the next page of the object's children.
+        """
+        self._shown = (self._shown or PAGE_SIZE) + PAGE_SIZE
+        if self._listener is not None:
+            self._listener(self)
+
+    #-------------------------------------------------------------------------
+    #  Sets up/Tears down a listener for 'children replaced' on a specified
+    #  object:
+    #-------------------------------------------------------------------------
+
+    def tno_when_children_replaced(self, node, listener, remove):
+        """ Sets up or removes a listener for children being replaced on a
+        specified object (which happens when more children are shown).
+        """
+        self._listener = None if remove else listener
+
+    #-------------------------------------------------------------------------
+    #  Sets up/Tears down a listener for 'children changed' on a specified
+    #  object:
+    #-------------------------------------------------------------------------
+
+    def tno_when_children_changed(self, node, listener, remove):
+        """ Sets up or removes a listener for children being changed on a
+        specified object.
+        """
+        pass
+
+    #-------------------------------------------------------------------------
+    #  Paged children support (overridden by subclasses):
+    #-------------------------------------------------------------------------
+
+    def _child_count(self):
+        """ Returns the number of children of the object.
+        """
+        return 0
+
+    def _child_nodes(self, start, end):
+        """ Returns the nodes for the children of the object between a
+            specified start and end index.
+        """
+        return []
+
+#-------------------------------------------------------------------------
+#  'MoreNode' class:
+#-------------------------------------------------------------------------
+
+
+class MoreNode(SingleValueTreeNodeObject):
+    """ A pseudo node standing for the remaining children of a container,
+        whose value is the number of remaining children. Double-clicking or
+        activating it shows the next page of children.
+    """
+
+    #-------------------------------------------------------------------------
+    #  Returns the formatted version of the value:
+    #-------------------------------------------------------------------------
+
+    def format_value(self, value):
+        """ Returns the formatted version of the value.
+        """
+        return '... more (%d remaining)' % value
+
+    #-------------------------------------------------------------------------
+    #  Returns the icon for a specified object:
+    #-------------------------------------------------------------------------
+
+    def tno_get_icon(self, node, is_expanded):
+        """ Returns the icon for a specified object.
+        """
+        return '<item>'
+
+    #-------------------------------------------------------------------------
+    #  Handles an object being double-clicked/activated:
+    #-------------------------------------------------------------------------
+
+    def tno_dclick(self, node):
+        """ Handles an object being double-clicked, by showing the next page
+            of children of its parent.
+        """
+        self.parent.show_more()
+
+    def tno_activated(self, node):
+        """ Handles an object being activated, by showing the next page of
+            children of its parent.
+        """
+        self.parent.show_more()
+
 #-------------------------------------------------------------------------
 #  'StringNode' class:
 #-------------------------------------------------------------------------
@@ -325,25 +449,29 @@ class TupleNode(MultiValueTreeNodeObject):
         """ Returns whether the object has children, based on the length of
             the tuple.
         """
-        return (len(self.value) > 0)
+        return (self._child_count() > 0)
 
     #-------------------------------------------------------------------------
-    #  Gets the object's children:
+    #  Paged children support:
     #-------------------------------------------------------------------------
 
-    def tno_get_children(self, node):
-        """ Gets the object's children.
+    def _child_count(self):
+        """ Returns the number of children of the object.
+        """
+        return len(self.value)
+
+    def _child_nodes(self, start, end):
+        """ Returns the nodes for the children of the object between a
+            specified start and end index.
         """
         node_for = self.node_for
-        value = self.value
-        if len(value) > 500:
-            return ([node_for('[%d]' % i, x)
-                     for i, x in enumerate(value[: 250])] +
-                    [StringNode(value='...', readonly=True)] +
-                    [node_for('[%d]' % i, x)
-                     for i, x in enumerate(value[-250:])])
+        return [node_for('[%d]' % i, x)
+                for i, x in enumerate(self._child_values(start, end), start)]
 
-        return [node_for('[%d]' % i, x) for i, x in enumerate(value)]
+    def _child_values(self, start, end):
+        """ Returns the values between a specified start and end index.
+        """
+        return self.value[start:end]
 
 #-------------------------------------------------------------------------
 #  'ListNode' class:
@@ -401,6 +529,16 @@ class SetNode(ListNode):
         """
         return 'Set(%d)' % len(value)
 
+    #-------------------------------------------------------------------------
+    #  Paged children support:
+    #-------------------------------------------------------------------------
+
+    def _child_values(self, start, end):
+        """ Returns the values between a specified start and end index (in
+            iteration order).
+        """
+        return islice(self.value, start, end)
+
 #-------------------------------------------------------------------------
 #  'ArrayNode' class:
 #-------------------------------------------------------------------------
@@ -419,6 +557,20 @@ class ArrayNode(TupleNode):
         """
         return 'Array(%s)' % ','.join([str(n) for n in value.shape])
 
+    #-------------------------------------------------------------------------
+    #  Paged children support:
+    #-------------------------------------------------------------------------
+
+    def _child_count(self):
+        """ Returns the number of children (rows) of the array (0 for a
+            scalar array).
+        """
+        shape = self.value.shape
+        if len(shape) == 0:
+            return 0
+
+        return shape[0]
+
 #-------------------------------------------------------------------------
 #  'DictNode' class:
 #-------------------------------------------------------------------------
@@ -438,21 +590,23 @@ class DictNode(TupleNode):
         return 'Dict(%d)' % len(value)
 
     #-------------------------------------------------------------------------
-    #  Gets the object's children:
+    #  Paged children support:
     #-------------------------------------------------------------------------
 
-    def tno_get_children(self, node):
-        """ Gets the object's children.
+    def _child_nodes(self, start, end):
+        """ Returns the nodes for the items of the dictionary (sorted by key)
+            between a specified start and end index.
+
+            The keys are sorted once, so a key removed since then shows None.
         """
-        node_for = self.node_for
-        items = [(repr(k), v) for k, v in self.value.items()]
-        items.sort(key=itemgetter(0))
-        if len(items) > 500:
-            return ([node_for('[%s]' % k, v) for k, v in items[: 250]] +
-                    [StringNode(value='...', readonly=True)] +
-                    [node_for('[%s]' % k, v) for k, v in items[-250:]])
+        if self._items is None:
+            self._items = items = [(repr(k), k) for k in self.value]
+            items.sort(key=itemgetter(0))
 
-        return [node_for('[%s]' % k, v) for k, v in items]
+        node_for = self.node_for
+        value = self.value
+        return [node_for('[%s]' % text, value.get(k))
+                for text, k in self._items[start:end]]
 
     #-------------------------------------------------------------------------
     #  Returns whether or not the object's children can be deleted:
@@ -557,15 +711,44 @@ class ObjectNode(MultiValueTreeNodeObject):
             return False
 
     #-------------------------------------------------------------------------
-    #  Gets the object's children:
+    #  Paged children support:
     #-------------------------------------------------------------------------
 
-    def tno_get_children(self, node):
-        """ Gets the object's children.
+    def _child_count(self):
+        """ Returns the number of children (attributes) of the object.
+        """
+        return len(self._get_names())
+
+    def _child_nodes(self, start, end):
+        """ Returns the nodes for the attributes of the object (sorted by
+            name) between a specified start and end index.
+        """
+        value = self.value
+        node_for = self.node_for
+        nodes = []
+        for name in self._get_names()[start:end]:
+            try:
+                item_value = getattr(value, name, '<unknown>')
+            except Exception as excp:
+                item_value = '<%s>' % excp
+            nodes.append(node_for('.' + name, item_value))
+
+        return nodes
+
+    #-------------------------------------------------------------------------
+    #  Gets the sorted names of all attributes:
+    #-------------------------------------------------------------------------
+
+    def _get_names(self):
+        """ Gets the sorted names of all attributes (computed once).
         """
-        items = [(k, v) for k, v in self.value.__dict__.items()]
-        items.sort(key=itemgetter(0))
-        return [self.node_for('.' + k, v) for k, v in items]
+        if self._names is None:
+            try:
+                self._names = sorted(self.value.__dict__.keys())
+            except:
+                self._names = []
+
+        return self._names
 
 #-------------------------------------------------------------------------
 #  'ClassNode' class:
@@ -603,40 +786,24 @@ class TraitsNode(ObjectNode):
         """
         return (len(self._get_names()) > 0)
 
-    #-------------------------------------------------------------------------
-    #  Gets the object's children:
-    #-------------------------------------------------------------------------
-
-    def tno_get_children(self, node):
-        """ Gets the object's children.
-        """
-        names = sorted(self._get_names())
-        value = self.value
-        node_for = self.node_for
-        nodes = []
-        for name in names:
-            try:
-                item_value = getattr(value, name, '<unknown>')
-            except Exception as excp:
-                item_value = '<%s>' % excp
-            nodes.append(node_for('.' + name, item_value))
-
-        return nodes
-
     #-------------------------------------------------------------------------
     #  Gets the names of all defined traits/attributes:
     #-------------------------------------------------------------------------
 
     def _get_names(self):
-        """ Gets the names of all defined traits or attributes.
+        """ Gets the sorted names of all defined traits or attributes
+            (computed once).
         """
-        value = self.value
-        names = {}
-        for name in value.trait_names(type=lambda x: x != 'event'):
-            names[name] = None
-        for name in value.__dict__.keys():
-            names[name] = None
-        return names.keys()
+        if self._names is None:
+            value = self.value
+            names = {}
+            for name in value.trait_names(type=lambda x: x != 'event'):
+                names[name] = None
+            for name in value.__dict__.keys():
+                names[name] = None
+            self._names = sorted(names.keys())
+
+        return self._names
 
     #-------------------------------------------------------------------------
     #  Sets up/Tears down a listener for 'children replaced' on a specified
@@ -647,12 +814,15 @@ class TraitsNode(ObjectNode):
         """ Sets up or removes a listener for children being replaced on a
         specified object.
         """
-        self._listener = listener
+        self._listener = None if remove else listener
         self.value.on_trait_change(self._children_replaced, remove=remove,
                                    dispatch='ui')
 
     def _children_replaced(self):
-        self._listener(self)
+        # The traits of the object have changed, so discard the children:
+        self._names = self._nodes = None
+        if self._listener is not None:
+            self._listener(self)
 
     #-------------------------------------------------------------------------
     #  Sets up/Tears down a listener for 'children changed' on a specified
@@ -730,6 +900,38 @@ def basic_types():
 
     return _basic_types
 
+# Mapping from the type of a value to the node class used for it (filled in
+# as new types are seen by 'node_class_for'):
+_node_classes = {}
+
+
+def node_class_for(value):
+    """ Returns the node class to use for a specified value.
+
+        The node class is looked up once per type of value, by walking the
+        type's method resolution order for a type listed by 'basic_types', and
+        cached.
+    """
+    klass = type(value)
+    node = _node_classes.get(klass)
+    if node is None:
+        types = dict(basic_types())
+        for base in inspect.getmro(klass):
+            node = types.get(base)
+            if node is not None:
+                break
+        else:
+            node = OtherNode
+            if inspect.isclass(value):
+                node = ClassNode
+
+            elif hasattr(value, '__class__'):
+                node = ObjectNode
+
+        _node_classes[klass] = node
+
+    return node
+
 #-------------------------------------------------------------------------
 #  '_ValueTree' class:
 #-------------------------------------------------------------------------
@@ -754,7 +956,7 @@ value_tree_nodes = [
         node_for=[NoneNode, StringNode, BoolNode, IntNode, FloatNode,
                   ComplexNode, OtherNode, TupleNode, ListNode, ArrayNode,
                   DictNode, SetNode, FunctionNode, MethodNode, ObjectNode,
-                  TraitsNode, RootNode, ClassNode])
+                  TraitsNode, RootNode, ClassNode, MoreNode])
 ]
 
 # Editor for a value tree:
@@ -774,7 +976,7 @@ value_tree_editor_with_root = TreeEditor(
             node_for=[NoneNode, StringNode, BoolNode, IntNode, FloatNode,
                       ComplexNode, OtherNode, TupleNode, ListNode, ArrayNode,
                       DictNode, SetNode, FunctionNode, MethodNode,
-                      ObjectNode, TraitsNode, RootNode, ClassNode]
+                      ObjectNode, TraitsNode, RootNode, ClassNode, MoreNode]
         ),
         TreeNode(node_for=[_ValueTree],
                  auto_open=True,
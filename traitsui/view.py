@@ -63,6 +63,8 @@ from .item import Item
 
 from .include import Include
 
+from .profiler import begin_profiled, end_profiled
+
 #-------------------------------------------------------------------------
 #  Trait definitions:
 #-------------------------------------------------------------------------
@@ -125,6 +127,10 @@ IsResizable = Bool(False, desc='whether dialog can be resized or not')
 # Is the view scrollable?
 IsScrollable = Bool(False, desc='whether view should be scrollable or not')
 
+# Are the editors of hidden pages and groups only created when needed?
+IsLazy = Bool(False, desc='whether the editors of hidden pages and groups '
+              'are only created when they are first shown')
+
 # The valid categories of imported elements that can be dragged into the view:
 ImportTypes = List(Str, desc='the categories of elements that can be '
                    'dragged into the view')
@@ -267,6 +273,14 @@ class View(ViewElement):
     # widgets might still contain scroll bars.
     scrollable = IsScrollable
 
+    # Are the editors of hidden pages and groups only created when needed? If
+    # set to True, the editors of the pages of a notebook or fold group that
+    # are not selected, and of groups hidden by their **visible_when**
+    # condition, are created the first time the page or group is shown, or
+    # when they are looked up in the UIInfo object or using
+    # **UI.get_editors()**.
+    lazy = IsLazy
+
     # The category of exported elements:
     export = ExportType
 
@@ -441,18 +455,25 @@ class View(ViewElement):
         if scrollable is None:
             scrollable = self.scrollable
 
-        ui = UI(view=self,
-                context=context,
-                handler=handler,
-                view_elements=view_elements,
-                title=self.title,
-                id=id,
-                scrollable=scrollable)
-
         if kind is None:
             kind = self.kind
 
-        ui.ui(parent, kind)
+        # The profiled construction of the UI ends once it has been prepared
+        # (see 'UI.prepare_ui'), before any modal event loop is run:
+        profile_node = begin_profiled('View', id or self.title)
+        try:
+            ui = UI(view=self,
+                    context=context,
+                    handler=handler,
+                    view_elements=view_elements,
+                    title=self.title,
+                    id=id,
+                    scrollable=scrollable,
+                    _profile_node=profile_node)
+
+            ui.ui(parent, kind)
+        finally:
+            end_profiled(profile_node)
 
         return ui
 
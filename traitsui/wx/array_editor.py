@@ -22,6 +22,8 @@
 #  Imports:
 #-------------------------------------------------------------------------
 
+import wx
+
 # FIXME: ToolkitEditorFactory is a proxy class defined here just for backward
 # compatibility. The class has been moved to the
 # traitsui.editors.array_editor file.
@@ -39,9 +41,21 @@ from editor \
 class SimpleEditor(BaseSimpleEditor, Editor):
     """ Simple style of editor for arrays.
     """
-    # FIXME: This class has been re-defined here simply so it inherits from the
-    # wx Editor class.
-    pass
+
+    def create_container(self, parent):
+        """ Creates and returns the toolkit control containing the user
+            interface mirroring the array.
+        """
+        control = wx.Panel(parent, -1)
+        control.SetSizer(wx.BoxSizer(wx.VERTICAL))
+        return control
+
+    def add_array_control(self, control):
+        """ Adds the control returned by **create_array_control** to the
+            editor's container.
+        """
+        self.control.GetSizer().Add(control, 1, wx.EXPAND)
+        self.control.Layout()
 
 #-------------------------------------------------------------------------
 #  'ReadonlyEditor' class:
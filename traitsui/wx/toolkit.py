@@ -486,6 +486,38 @@ class GUIToolkit(Toolkit):
             _popEventHandlers(child)
         control.DestroyChildren()
 
+    #-------------------------------------------------------------------------
+    #  Calls a function from the GUI toolkit event loop:
+    #-------------------------------------------------------------------------
+
+    def invoke_later(self, delay, callable, *args, **kw_args):
+        """ Calls a function from the GUI toolkit event loop after a specified
+            delay (in seconds), or at the next event loop iteration if the
+            delay is 0.
+        """
+        if delay > 0.0:
+            wx.CallLater(int(1000.0 * delay), callable, *args, **kw_args)
+        else:
+            wx.CallAfter(callable, *args, **kw_args)
+
+    #-------------------------------------------------------------------------
+    #  Suspends/Resumes the updating of a specified GUI toolkit control:
+    #-------------------------------------------------------------------------
+
+    def suspend_updates(self, control):
+        """ Suspends the updating (painting and layout) of a specified GUI
+            toolkit control.
+        """
+        if control is not None:
+            control.Freeze()
+
+    def resume_updates(self, control):
+        """ Resumes the updating of a specified GUI toolkit control.
+        """
+        if control is not None:
+            control.Layout()
+            control.Thaw()
+
     #-------------------------------------------------------------------------
     #  Returns a ( width, height ) tuple containing the size of a specified
     #  toolkit image:
@@ -50,6 +50,12 @@ from traitsui.api \
 from traitsui.editors.tree_editor \
     import ToolkitEditorFactory
 
+from traitsui.editors.tree_editor \
+    import TreeNodeCache
+
+from traitsui.helper \
+    import compile_expression
+
 from traitsui.undo \
     import ListUndoItem
 
@@ -157,6 +163,9 @@ class SimpleEditor(Editor):
         factory = self.factory
         style = self._get_style()
 
+        # Cache of the nodes handling each class of objects:
+        self._node_cache = TreeNodeCache(factory)
+
         if factory.editable:
 
             # Check to see if the tree view is based on a shared trait editor:
@@ -320,6 +329,8 @@ class SimpleEditor(Editor):
             if nid.IsOk():
                 self._delete_node(nid)
 
+        self._node_cache.dispose()
+
         super(SimpleEditor, self).dispose()
 
     #-------------------------------------------------------------------------
@@ -793,14 +804,19 @@ class SimpleEditor(Editor):
                 isinstance(object[1], TreeNode)):
             return object
 
+        # Use the node already resolved for the object's class (if any):
+        node_cache = self._node_cache
+        node = node_cache.get_node(object)
+        if node is not None:
+            return (object, node)
+
         # Select all nodes which understand this object:
         factory = self.factory
-        nodes = [node for node in factory.nodes
-                 if object is not None and node.is_node_for(object)]
+        nodes = node_cache.nodes_for(object)
 
         # If only one found, we're done, return it:
         if len(nodes) == 1:
-            return (object, nodes[0])
+            return (object, node_cache.set_node(object, nodes[0]))
 
         # If none found, try to create an adapted node for the object:
         if len(nodes) == 0:
@@ -809,11 +825,11 @@ class SimpleEditor(Editor):
         # Use all selected nodes that have the same 'node_for' list as the
         # first selected node:
         base = nodes[0].node_for
-        nodes = [node for node in nodes if base == node.node_for]
+        nodes = [match for match in nodes if base == match.node_for]
 
         # If only one left, then return that node:
         if len(nodes) == 1:
-            return (object, nodes[0])
+            return (object, node_cache.set_node(object, nodes[0]))
 
         # Otherwise, return a MultiTreeNode based on all selected nodes...
 
@@ -847,10 +863,7 @@ class SimpleEditor(Editor):
     def _node_for_class(self, klass):
         """ Returns the TreeNode associated with a specified class.
         """
-        for node in self.factory.nodes:
-            if issubclass(klass, tuple(node.node_for)):
-                return node
-        return None
+        return self._node_cache.node_for_class(klass)
 
     #-------------------------------------------------------------------------
     #  Returns the node and class associated with a specified class name:
@@ -859,11 +872,7 @@ class SimpleEditor(Editor):
     def _node_for_class_name(self, class_name):
         """ Returns the node and class associated with a specified class name.
         """
-        for node in self.factory.nodes:
-            for klass in node.node_for:
-                if class_name == klass.__name__:
-                    return (node, klass)
-        return (None, None)
+        return self._node_cache.node_for_class_name(class_name)
 
     #-------------------------------------------------------------------------
     #  Updates the icon for a specified node:
@@ -1696,14 +1705,16 @@ class SimpleEditor(Editor):
         """
         if action.defined_when != '':
             try:
-                if not eval(action.defined_when, globals(), self._context):
+                if not eval(compile_expression(action.defined_when), globals(),
+                            self._context):
                     return False
             except:
                 open_fbi()
 
         if action.visible_when != '':
             try:
-                if not eval(action.visible_when, globals(), self._context):
+                if not eval(compile_expression(action.visible_when), globals(),
+                            self._context):
                     return False
             except:
                 open_fbi()
@@ -1740,7 +1751,7 @@ class SimpleEditor(Editor):
             if method_name.find('(') < 0:
                 method_name += '()'
             try:
-                eval(method_name, globals(),
+                eval(compile_expression(method_name), globals(),
                      {'object': object,
                       'editor': self,
                       'node': node,
@@ -1775,7 +1786,8 @@ class SimpleEditor(Editor):
         if condition != '':
             value = True
             try:
-                if not eval(condition, globals(), self._context):
+                if not eval(compile_expression(condition), globals(),
+                            self._context):
                     value = False
             except:
                 open_fbi()
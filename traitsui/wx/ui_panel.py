@@ -35,6 +35,9 @@ from traits.api \
 from traitsui.api \
     import Group
 
+from traitsui.helper \
+    import compile_expression
+
 from traitsui.undo \
     import UndoHistory
 
@@ -978,7 +981,8 @@ class FillPanel(object):
                 continue
 
             # Otherwise, it must be a trait Item:
-            object = eval(item.object_, globals(), ui.context)
+            object = eval(compile_expression(item.object_), globals(),
+                          ui.context)
             trait = object.base_trait(name)
             desc = trait.desc or ''
             label = None